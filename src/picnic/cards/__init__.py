@@ -1,12 +1,18 @@
+import functools
+import importlib
+import sys
 from pathlib import Path
 
 
+DEFAULT_PARAMETERS_PATH = Path(__file__).resolve().parent / "default_parameters"
+
+
 def get_path_to_jsons():
     """
     Locate the default_parameters json files and return a Path to them.
     """
 
-    return Path(__file__).parent.absolute() / "default_parameters"
+    return DEFAULT_PARAMETERS_PATH
 
 
 def get_path_to_json(keyword):
@@ -14,4 +20,39 @@ def get_path_to_json(keyword):
     Locate a specific default_parameters json file and return a Path to it.
     """
 
-    return get_path_to_jsons() / f"{keyword}.json"
+    return DEFAULT_PARAMETERS_PATH / f"{keyword}.json"
+
+
+def infer_class_name_from_card_name(card_name):
+    """
+    returns a string of the suspected class name by giving a card name. This
+    assumes all spaces will be removed, the first word will be capitalized and
+    CamelCase will be used for subsequent words.
+
+    :Parameters:
+      -. `card_name` : a string, the name of the card
+
+    :Return:
+      -.  a string
+    """
+    return ''.join([s.capitalize() for s in card_name.split(' ')])
+
+
+@functools.lru_cache(maxsize=None)
+def load_card_class(card_name):
+    """
+    Import a card's module and return its class; motion correction ->
+    picnic.cards.motion_correction.MotionCorrection. Decks repeat card types,
+    so every card name is only resolved once.
+
+    :Parameters:
+      -. `card_name` : str, the card name without the star
+    """
+
+    # only go through the import machinery (and its lock) if the module has
+    #   not already been imported
+    module_name = 'picnic.cards.' + '_'.join(card_name.lower().split(' '))
+    module = sys.modules.get(module_name)
+    if module is None:
+        module = importlib.import_module(module_name)
+    return getattr(module, infer_class_name_from_card_name(card_name))
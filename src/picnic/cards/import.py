@@ -75,6 +75,7 @@ class Import(CardBuilder):
         # if the user has given some custom parameters, use those instead
         params = self._user_defined_parameters(**optional_parameters)
         params['name'] = self._name
+        params['nprocs'] = params['_nprocs']
         
         # set the outflows
         if not sink_directory:
@@ -6,6 +6,7 @@ import sys
 import os
 import json
 import string
+import functools
 import logging
 
 from picnic.cards import get_path_to_json
@@ -14,6 +15,7 @@ from picnic.cards import get_path_to_json
 # =======================================
 # Constants
 INPUT_DECK_EXTENSION = '.inp'
+INPUT_DECK_BUFFER_SIZE = 131072
 commenter = '#'
 
 # =======================================
@@ -57,9 +59,9 @@ class InputDeck():
         """
         logging.info('  Checking the file location')
         if not check_file_extension(self.filename, INPUT_DECK_EXTENSION):
-            logging.warning('  ' + self.filename + ' is not a ' + INPUT_DECK_EXTENSION + ' file type, this is an unsupported file format input decks')
+            logging.warning('  %s is not a %s file type, this is an unsupported file format input decks', self.filename, INPUT_DECK_EXTENSION)
         if not check_file_exists(self.filename):
-            logging.error('  Error: The file ' + self.filename + ' was not found.')
+            logging.error('  Error: The file %s was not found.', self.filename)
             raise InputDeckSyntaxError('Error: The file ' + self.filename + ' was not found.')
             
             
@@ -69,13 +71,19 @@ class InputDeck():
         """
         print('  Opening file '+self.filename)
         user_defined_parameters = {}
+        # decks often repeat the same lines, only substitute each one once
+        substituted_lines = {}
         # loop over all the data, start reading with *start
-        with open(self.filename, 'r') as f:
+        with open(self.filename, 'r', buffering=INPUT_DECK_BUFFER_SIZE, encoding='utf-8') as f:
             for line in f:
                 if line.lower().strip().startswith('*start'):
                     print('    Reader:    *start')
                     for line in f: # python iterator will continue its iteration until consumed
-                        line = string.Template(line.strip()).substitute(user_defined_parameters)
+                        line = line.strip()
+                        try:
+                            line = substituted_lines[line]
+                        except KeyError:
+                            line = substituted_lines[line] = string.Template(line).substitute(user_defined_parameters)
                         if line.lower().startswith('*end'): # stop reading and exit method at *end
                             print('    Reader:    *end\n\n')
                             return
@@ -95,6 +103,7 @@ class InputDeck():
                                 else:
                                     # use exec to run the psudo python code for parameters
                                     user_defined_parameters = read_parameter_card(parameter_lines)
+                                    substituted_lines = {}
                                     
                                     # I personally don't like this, but I can't think of a better way to
                                     #   exit the iterator. Load the first card after *parameter
@@ -130,8 +139,7 @@ class InputDeck():
             user provided information is dictated in the input deck.
         """
         self.cards.append(Card(cardname, parameters))
-        for dataline in datalines:
-            self.cards[-1].add_dataline = dataline
+        self.cards[-1].extend_datalines(datalines)
 
 
 class Card():
@@ -155,6 +163,8 @@ class Card():
     --------
     >>> card = Card(*line.lower().split(','))
     """
+    # a deck can hold many cards, skip the per-instance __dict__
+    __slots__ = ('cardname', '_parameters', '_datalines')
 
     def __init__(self, cardname, *parameters):
         """
@@ -176,12 +186,14 @@ class Card():
         # load in the default parameters, then overwrite the with the user 
         #  defined parameters
         default_parameters = self._load_defaults()
+        unsupported = self.parameters.keys() - default_parameters.keys()
+        if unsupported:
+            raise InputDeckSyntaxError(
+                f"Error: The optional parameter "
+                f"{next(iter(unsupported))}"
+                f" is not supported for the card '{self.cardname}'"
+            )
         self.parameters = self.check_parameter_syntax(default_parameters)
-        assert len(self.parameters) == len(default_parameters), (
-            f"Error: The optional parameter "
-            f"{tuple(set(self.parameters.keys()).difference(default_parameters.keys()))[0]}"
-            f" is not supported for the card '{self.cardname}"
-        )
 
         # initialize the dataline list
         self.datalines = []
@@ -195,12 +207,12 @@ class Card():
         # change the data type to a dictionary containing para_key: para_value
         if isinstance(all_paras, tuple) or isinstance(all_paras, list):
             try:
-                self._parameters = dict([s.split('=') for s in all_paras])
+                self._parameters = dict(s.split('=') for s in all_paras)
             except AttributeError:
                 # we enter this exception because tuple and list do not have a 
                 #  split method, this will happen when the user passes a list 
                 #  or tuple into Card and the initialization packs it
-                self._parameters = dict([s.split('=') for s in all_paras[0]])
+                self._parameters = dict(s.split('=') for s in all_paras[0])
             except ValueError:
                 # we enter this exception when there is no '=' to split the str
                 raise InputDeckSyntaxError('Error: Unexpected syntax for the optional parameters for "' + self.cardname + '"')
@@ -219,9 +231,7 @@ class Card():
         """
 
         # Load the json
-        json_path = get_path_to_json(self.cardname[1:].replace(' ', '_'))
-        with open(json_path, 'r') as f:
-            data = json.load(f)
+        data = load_default_parameters(self.cardname[1:].replace(' ', '_'))
 
         # if the card doesn't have a type or the user doesn't provide one, use
         #  the first option in the json
@@ -306,6 +316,24 @@ class Card():
         else:
             raise InputDeckSyntaxError('Error: Unexpected data type when setting dataline for card ' + self.cardname)
 
+    def extend_datalines(self, lines):
+        """
+        Add several datalines at once
+        
+        :Parameters:
+          -. `lines` : an iterable of lists split by ',' or strs, the data lines
+            to be added in order
+        """
+        lines = list(lines)
+        # the usual case is all raw strs, split them without checking each type
+        if all(isinstance(line, str) for line in lines):
+            self.datalines.extend(
+                [itm.strip() for itm in line.strip().split(',')] for line in lines
+            )
+        else:
+            for line in lines:
+                self.add_dataline(line)
+
     @property
     def datalines(self):
         return self._datalines
@@ -346,7 +374,7 @@ def check_file_extension(filename, extension):
       -. `filename` : str, the input deck file
       -. `extension` : str, the file extension type (most likely '.inp')
     """
-    return os.path.splitext(filename)[-1].lower() == extension
+    return filename.lower().endswith(extension)
 
 
 def check_file_exists(filename):
@@ -359,22 +387,35 @@ def check_file_exists(filename):
     return os.path.exists(filename)
 
 
+@functools.lru_cache(maxsize=None)
+def load_default_parameters(keyword):
+    """
+    Read a card's default parameters json. The defaults ship with the package
+    and never change at runtime, so every card of the same keyword shares one
+    parsed copy. Treat the returned list as read-only.
+
+    :Parameters:
+      -. `keyword` : str, the card name without the star; motion_correction
+    """
+    return json.loads(get_path_to_json(keyword).read_bytes())
+
+
 def read_parameter_card(all_the_parameter_lines):
     r"""
-    A function built to read and execute the \*parameter keyword. This has to be
-    in built in a local space outside the typical object structure to try and
-    mitigate some of the danger of using the exec command.
-    all_the_parameter_lines = lines of str; this CANNOT be used as a parameter
-    name
+    A function built to read and execute the \*parameter keyword. The lines
+    are compiled as a single block and executed in their own namespace to try
+    and mitigate some of the danger of using the exec command.
+
+    :Parameters:
+      -. `all_the_parameter_lines` : list of str, the lines under \*parameter
+
+    :Return:
+      -. a dict, {parameter name : value} for every variable the lines create
     """
-    # loop over all the parameter lines
-    for _ in all_the_parameter_lines:
-        exec(_)
-    
-    # Remove all the variables outside the ones created by exec
-    del _
-    del all_the_parameter_lines
-    return locals()
+    code = compile('\n'.join(all_the_parameter_lines), '<parameter-card>', 'exec')
+    user_defined_parameters = {}
+    exec(code, {}, user_defined_parameters)
+    return user_defined_parameters
     
 
 def read_input_deck(input_deck):
@@ -405,8 +446,7 @@ def make_card(cardname, parameters=None, datalines=None):
     
     # add the datalines
     if datalines is not None:
-        for line in datalines:
-            card.add_dataline(line)
+        card.extend_datalines(datalines)
     return card
 
 
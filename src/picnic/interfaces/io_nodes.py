@@ -9,6 +9,32 @@
 
 # =======================================
 # Functions
+def _link_or_copy(src, dst):
+    """
+    hardlink src to dst, which is a metadata-only operation, falling back to a
+    data-only copy (no permission bits, sendfile on linux) when the two paths
+    are on different filesystems (or the filesystem does not support links).
+    An existing dst is replaced
+    
+    :Parameter:
+      -. `src` : file-like str, the file being linked
+      -. `dst` : file-like str, the new path
+    """
+
+    import os
+    import shutil
+
+    if os.path.lexists(dst):
+        if os.path.samefile(src, dst):
+            return dst
+        os.remove(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+    
+    return dst
+
 def _find_associated_sidecar(in_filepaths, workflow_sidecars=None, out_basename=''):
     """
     take all the sidecars and combine them to one file
@@ -24,18 +50,19 @@ def _find_associated_sidecar(in_filepaths, workflow_sidecars=None, out_basename=
     import os
     import json
     import glob
-    from picnic.interfaces.utility import nibabel_image_types
+    from picnic.interfaces.utility import _strip_img_ext, _load_json
 
     # look for the associated sidecar in the same dir as the file
     base_sidecars = []
     for in_filepath in in_filepaths:
         if os.path.isfile(in_filepath):
             dirname, filename = os.path.split(in_filepath)
-            for img_type in nibabel_image_types:
-                if filename.endswith(img_type):
-                    basename = filename.replace(img_type, '')
-                    break
-            base_sidecars += glob.glob(os.path.join(dirname, basename + '.json'))
+            basename, _ = _strip_img_ext(filename)
+            # the name has no wildcards, so probe it directly rather than
+            #  globbing the whole directory
+            candidate = os.path.join(dirname, basename + '.json')
+            if os.path.isfile(candidate):
+                base_sidecars.append(candidate)
         else:
             base_sidecars += glob.glob(os.path.join(in_filepath, '*.json'))
     
@@ -50,8 +77,7 @@ def _find_associated_sidecar(in_filepaths, workflow_sidecars=None, out_basename=
     #  as r
     r = {}
     for sc in reversed(all_side_cars):
-        with open(sc) as f:
-            r.update(json.load(f))
+        r.update(_load_json(sc))
     
     # determine the final json filename
     if not out_basename:
@@ -81,25 +107,21 @@ def _rename_image(basename, in_file, sidecar=None):
     """
 
     import os
-    import shutil
-    from picnic.interfaces.utility import nibabel_image_types
+    from picnic.interfaces.utility import _strip_img_ext
+    from picnic.interfaces.io_nodes import _link_or_copy
 
     # get the extension type
-    ext = ""
     dirname, filename = os.path.split(in_file)
-    for img_type in nibabel_image_types:
-        if filename.endswith(img_type):
-            ext = img_type
-            break
+    _, ext = _strip_img_ext(filename)
     
-    # copy over image
+    # link (or copy) over image
     new_image_path = os.path.join(os.getcwd(), basename + ext)
-    _ = shutil.copy(in_file, new_image_path)
+    _link_or_copy(in_file, new_image_path)
     
-    # copy over the sidecar if one is provided
+    # link (or copy) over the sidecar if one is provided
     if not sidecar is None:
         new_sidecar = os.path.join(os.getcwd(), basename + '.json')
-        _ = shutil.copy(sidecar, new_sidecar)
+        _link_or_copy(sidecar, new_sidecar)
         return (new_image_path, new_sidecar)
     return new_image_path
 
@@ -114,14 +136,14 @@ def _rename_textfile(basename, in_file):
     """
 
     import os
-    import shutil
+    from picnic.interfaces.io_nodes import _link_or_copy
 
     # get the extension type
     ext = os.path.splitext(in_file)[-1]
     
-    # copy over image
+    # link (or copy) over the file
     new_path = os.path.join(os.getcwd(), basename + ext)
-    _ = shutil.copy(in_file, new_path)
+    _link_or_copy(in_file, new_path)
     
     return new_path
 
@@ -139,14 +161,15 @@ def _pop_list(in_list, index=None, filename_to_exclude=None):
         item based on its name
     """
 
-    import os
+    from os.path import basename
+
+    # only look at the filenames when there is a filename to exclude
+    if filename_to_exclude is None:
+        return [itm for idx, itm in enumerate(in_list) if idx != index]
 
     # loop over all the items in the in_list to see if the index or filename
     #  should be popped
-    out_list = []
-    for idx, itm in enumerate(in_list):
-        dirname, filename = os.path.split(itm)
-        if idx != index and filename != filename_to_exclude:
-            out_list.append(itm)
-    
-    return out_list
+    return [
+        itm for idx, itm in enumerate(in_list)
+        if idx != index and basename(itm) != filename_to_exclude
+    ]
@@ -1,14 +1,136 @@
 # =======================================
 # Imports
+import functools
 
 # =======================================
 # Constants
+# the freesurfer aseg rois used to translate the aseg into tissue masks
+WB_EXCLUSIONS = [
+    2, 4, 5, 14, 15, 24, 30, 31, 41, 43, 44, 62, 63, 77, 85,
+    251, 252, 253, 254, 255
+]
+GM_INCLUSIONS = [
+    3, 8, 42, 47
+]
+WM_INCLUSIONS = [
+    2, 7, 41, 46, 251, 252, 253, 254, 255
+]
+SUBCORTICAL_EXCLUSIONS = [
+    2, 3, 4, 5, 14, 15, 24, 30, 31, 41, 42, 43, 44, 62, 63, 77, 85,
+    251, 252, 253, 254, 255
+]
+VENTRICLE_INCLUSIONS = [
+    4, 5, 14, 15, 24, 43, 44
+]
+# {mask name : (included rois, excluded rois)}, one of the two is None
+ASEG_MASKS = {
+    'wholebrain_mask' : (None, WB_EXCLUSIONS),
+    'gm_mask' : (GM_INCLUSIONS, None),
+    'wm_mask' : (WM_INCLUSIONS, None),
+    'subcortical_mask' : (None, SUBCORTICAL_EXCLUSIONS),
+    'ventricle_mask' : (VENTRICLE_INCLUSIONS, None)
+}
+# the in-memory 4d source handed to forked workers, see _create_tacs
+_TAC_SOURCE = None
 
 # =======================================
 # Classes
 
 # =======================================
 # Functions
+def _label_data(image):
+    """
+    Read the voxels of a label image (an atlas or aseg) in their on-disk
+    integer dtype. get_fdata() would always build a float64 copy first, which
+    is 4x the memory of an int16 aseg just to cast it back to integers
+    
+    :Parameters:
+      -. `image` : nibabel image, the label image
+    """
+
+    import numpy as np
+
+    data = np.asanyarray(image.dataobj)
+    if data.dtype.kind not in 'iu':
+        data = data.astype(int)
+    return data
+
+@functools.lru_cache(maxsize=2)
+def _load_label_image_cached(path, mtime, size):
+    """
+    The cached half of _load_label_image, keyed on the file's path, mtime and
+    size so an edited file is reloaded
+    """
+
+    import nibabel as nib
+
+    image = nib.load(path)
+    data = _label_data(image)
+    data.flags.writeable = False
+    return nib.Nifti1Image(data, image.affine, dtype=data.dtype)
+
+def _load_label_image(path):
+    """
+    Load a label image (an atlas or aseg) as an in-memory integer image. The
+    decoded voxels of the two most recent label images are kept in a
+    per-process cache so the same atlas is only decompressed once when
+    several nodes in a process reuse it, without holding every volume a run
+    touches. The cached data is read-only, copy it before modifying
+    
+    :Parameters:
+      -. `path` : file-like str, the label image
+    """
+
+    import os
+
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    return _load_label_image_cached(path, stat.st_mtime_ns, stat.st_size)
+
+@functools.lru_cache(maxsize=None)
+def _numba_remap_kernel():
+    """
+    Compile (once per process) the numba kernel used by _apply_remap, or
+    return None when numba is not installed
+    """
+
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return None
+
+    @njit(parallel=True, cache=True)
+    def kernel(labels, remap, out):
+        for i in prange(labels.size):
+            out[i] = remap[labels[i]]
+
+    return kernel
+
+def _apply_remap(labels, remap, dtype=None):
+    """
+    Gather remap[labels] straight into a new volume. Uses a parallel numba
+    kernel when numba is available, otherwise np.take with a preallocated
+    output so no intermediate volume is created
+    
+    :Parameters:
+      -. `labels` : numpy array of ints, the label volume
+      -. `remap` : 1d numpy array, the new value for every label index
+      -. `dtype` : numpy dtype, the output dtype (default: remap's dtype)
+    """
+
+    import numpy as np
+
+    if dtype is None:
+        dtype = remap.dtype
+    out = np.empty(labels.shape, dtype=dtype)
+    remap = remap.astype(dtype)
+    kernel = _numba_remap_kernel()
+    if kernel is not None:
+        kernel(np.ascontiguousarray(labels).ravel(), remap, out.ravel())
+    else:
+        np.take(remap, labels, out=out)
+    return out
+
 
 # =======================================
 # Nipype Specific Functions
@@ -24,16 +146,12 @@ def _reorient_image(in_file, gz=True):
     import os
     import nibabel as nib
     from nibabel.orientations import OrientationError
-    from picnic.interfaces.utility import nibabel_image_types
+    from picnic.interfaces.utility import _strip_img_ext
 
 
     # Open the image with nibabel
-    base_name = ""
     dirname, filename = os.path.split(in_file)
-    for img_type in nibabel_image_types:
-        if filename.endswith(img_type):
-            base_name = filename.replace(img_type, '')
-            break
+    base_name, _ = _strip_img_ext(filename)
     orig_image = nib.load(in_file)
     if orig_image is None:
         print(f"SHIT! Failed to load '{in_file}' - orig_image is None")
@@ -88,14 +206,11 @@ def _reorient_image_deprecated(in_file, gz=True):
 
     import os
     import nibabel as nib
-    from picnic.interfaces.utility import nibabel_image_types
+    from picnic.interfaces.utility import _strip_img_ext
 
     # open the image with nibabel
     dirname, filename = os.path.split(in_file)
-    for img_type in nibabel_image_types:
-        if filename.endswith(img_type):
-            basename = filename.replace(img_type, '')
-            break
+    basename, _ = _strip_img_ext(filename)
     image = nib.load(in_file)
     
     # grab the important image parameters
@@ -131,15 +246,12 @@ def _merge_images(images, gz=True):
 
     import os
     import nibabel as nib
-    from picnic.interfaces.utility import nibabel_image_types
+    from picnic.interfaces.utility import _strip_img_ext
 
 
     # Open the image with nibabel
     dirname, filename = os.path.split(images[0])
-    for img_type in nibabel_image_types:
-        if filename.endswith(img_type):
-            basename = filename.replace(img_type, '')
-            break
+    basename, _ = _strip_img_ext(filename)
     
     # merge all the listed files
     merged_image = nib.funcs.concat_images(images, axis=-1)
@@ -169,25 +281,34 @@ def _create_bilateral_atlas(atlas, lookup_table, gz=True):
     import json
     import numpy as np
     import nibabel as nib
-    from picnic.interfaces.utility import nibabel_image_types
+    from picnic.interfaces.utility import _strip_img_ext, _load_json
+    from picnic.interfaces.nibabel_nodes import _load_label_image, _label_data, _apply_remap
 
     # use nibabel to load the 3d image
     dirname, filename = os.path.split(atlas)
-    for img_type in nibabel_image_types:
-        if filename.endswith(img_type):
-            basename = filename.replace(img_type, '')
-            break
-    atlas = nib.load(atlas)
+    basename, _ = _strip_img_ext(filename)
+    atlas = _load_label_image(atlas)
         
     
-    # use the json package to load the lookup table
-    with open(lookup_table) as f:
-        label_lookup = json.load(f)['label_lookup']
-        label_lookup = dict((int(k), v.lower()) for k, v in label_lookup.items())
-    
-    # get the unilateral atlas's data as integers and initialize the bilateral
-    unilateral_fdata = atlas.get_fdata().astype(int)
-    bilateral_fdata = np.zeros(unilateral_fdata.shape)
+    # load the lookup table
+    label_lookup = _load_json(lookup_table)['label_lookup']
+    label_lookup = dict((int(k), v.lower()) for k, v in label_lookup.items())
+    
+    # invert the lookup table once so finding a label's index is a dict hit.
+    #  Keep the first index for a repeated label, like list.index would
+    index_lookup = {}
+    for k, v in label_lookup.items():
+        index_lookup.setdefault(v, k)
+    
+    # get the unilateral atlas's data as integers. The bilateral atlas is 
+    #  built from a small remap table (unilateral index -> bilateral index) 
+    #  so the volume itself only gets touched once
+    unilateral_fdata = _label_data(atlas)
+    
+    # the labels present in the atlas, from one linear histogram pass rather
+    #  than the sort np.unique would do
+    roi_idxs = np.flatnonzero(np.bincount(unilateral_fdata.ravel()))
+    remap = np.arange(roi_idxs[-1] + 1)
     bilateral_lookup = {}
     
     # (1) loop over all the unique integers in the atlas
@@ -195,8 +316,8 @@ def _create_bilateral_atlas(atlas, lookup_table, gz=True):
     # (3) search for a corresponding counterpart in the lookup table
     # (4) assign both hemispheres to the first one's index in the new atlas
     # (5) if both hemispheres found, replace the label name with bilateral
-    idx_added = []
-    for roi_idx in np.unique(unilateral_fdata):
+    idx_added = set()
+    for roi_idx in roi_idxs:
         roi_idx = int(roi_idx)
         # Because the opposite hemisphere gets assigned the first time its
         # counterpart is found, it needs to be skipped
@@ -205,30 +326,35 @@ def _create_bilateral_atlas(atlas, lookup_table, gz=True):
         
         # Find the index's associated label
         idx_label = label_lookup[roi_idx]
-        
-        # Use np.where to find all the voxels with the index
-        bilateral_fdata += np.where(unilateral_fdata == roi_idx, roi_idx, 0.)
         bilateral_lookup[roi_idx] = idx_label
-        idx_added.append(roi_idx)
+        idx_added.add(roi_idx)
         
         # check if there is a opposing hemisphere in the lookup table
         for to_check, opp_check in zip(('left', 'lh', 'right', 'rh'), ('right', 'rh', 'left', 'lh')):
             if to_check in idx_label:
                 try:
                     opp_label = idx_label.replace(to_check, opp_check)
-                    opp_idx = list(label_lookup.keys())[list(label_lookup.values()).index(opp_label)]
+                    opp_idx = index_lookup[opp_label]
                 
                 # found a potential tag (ex 'left') in the label string, but 
                 #  couldn't find its partner ('right') in the lookup table
-                except ValueError:
+                except KeyError:
                     break
                 
-                # use np..where to find all the voxels with the other
-                #  hemisphere's index and assign it as the original index's 
-                #  index in the bilateral data
-                bilateral_fdata += np.where(unilateral_fdata == opp_idx, roi_idx, 0.)
+                # the other hemisphere's index gets the original index in the
+                #  bilateral data (if it shows up in the atlas at all)
+                if opp_idx < remap.size:
+                    remap[opp_idx] = roi_idx
                 bilateral_lookup[roi_idx] = idx_label.replace(to_check, 'bilateral') # overwrite bilateral label name to contain 'bilateral'
-                idx_added.append(opp_idx)
+                idx_added.add(opp_idx)
+    
+    # apply the remap table to every voxel in a single pass
+    #  as integer labels rather than float64 (int16 unless a label needs more)
+    if remap.max() <= np.iinfo(np.int16).max:
+        label_dtype = np.int16
+    else:
+        label_dtype = np.int32
+    bilateral_fdata = _apply_remap(unilateral_fdata, remap, label_dtype)
     
     # save out the new image
     if gz:
@@ -260,7 +386,7 @@ def _binarize_images(images, thr=None, uthr=None, gz=True):
     import os
     import numpy as np
     import nibabel as nib
-    from picnic.interfaces.utility import nibabel_image_types
+    from picnic.interfaces.utility import _strip_img_ext
 
     # error check if the images parameter is a string or list
     if isinstance(images, str):
@@ -268,34 +394,30 @@ def _binarize_images(images, thr=None, uthr=None, gz=True):
     
     # get the first file's name
     dirname, filename = os.path.split(images[0])
-    for img_type in nibabel_image_types:
-        if filename.endswith(img_type):
-            basename = filename.replace(img_type, '')
-            break
+    basename, _ = _strip_img_ext(filename)
     
-    # loop over all the provided images, binarize each one and sum those
+    # loop over all the provided images, binarize each one and combine those.
+    #  The thresholds and the non-zero test are fused in one boolean expression
+    #  and the images are OR'd together, so no float64 copies are made
+    mask = None
     for img in images:
-        # load the image and get its fdata
+        # load the image and get its data in the on-disk dtype
         image = nib.load(img)
-        image_data = image.get_fdata()
+        image_data = np.asanyarray(image.dataobj)
         
-        # test if a lower threshold was given
+        # keep the voxels that are not 0 and survive the given thresholds
+        image_mask = image_data != 0.
         if not thr is None:
-            image_data = np.where(image_data >= thr, image_data, 0.)
-        
-        # test if an upper threshold was given
+            image_mask &= image_data >= thr
         if not uthr is None:
-            image_data = np.where(image_data <= uthr, image_data, 0.)
+            image_mask &= image_data <= uthr
         
-        # if the remaining thresheld data is not 0, set it to one
-        try:
-            new_data += np.where(image_data != 0., 1., 0.)
-        except NameError: # a cheaters way to initialize an array without setting zeros
-            new_data = np.where(image_data != 0., 1., 0.)
+        # if two files overlap it is still a single 1. in the binarized data
+        mask = image_mask if mask is None else mask | image_mask
     
-    # binarize the summed data (if two files overlap, it might end up with a 2. 
-    #  We don't want that)
-    new_data = np.where(new_data > 0., 1., 0.)
+    # a 0/1 mask only needs a byte per voxel, a bool array already is one so
+    #  reinterpret it rather than copying
+    new_data = mask.view(np.uint8)
     binarized_image = nib.Nifti1Image(new_data, image.affine)
     
     # save out the new image
@@ -320,15 +442,12 @@ def _crop_image(in_file, crop_start=0, crop_end=0, gz=True):
 
     import os
     import nibabel as nib
-    from picnic.interfaces.utility import nibabel_image_types
+    from picnic.interfaces.utility import _strip_img_ext
 
 
     # Open the image with nibabel
     dirname, filename = os.path.split(in_file)
-    for img_type in nibabel_image_types:
-        if filename.endswith(img_type):
-            basename = filename.replace(img_type, '')
-            break
+    basename, _ = _strip_img_ext(filename)
     image = nib.load(in_file)
     
     # use nibabel's slicer to change up the image
@@ -360,14 +479,11 @@ def _resample_image(source, target, gz=True):
     import os
     import nibabel as nib
     from nibabel.processing import resample_from_to
-    from picnic.interfaces.utility import nibabel_image_types
+    from picnic.interfaces.utility import _strip_img_ext
 
     # open the image with nibabel
     dirname, filename = os.path.split(source)
-    for img_type in nibabel_image_types:
-        if filename.endswith(img_type):
-            basename = filename.replace(img_type, '')
-            break
+    basename, _ = _strip_img_ext(filename)
     
     # load the source and target images
     s = nib.load(source)
@@ -384,19 +500,112 @@ def _resample_image(source, target, gz=True):
     return resampled_image
 
 
-def _create_tacs(source, atlases, source_side_car=None, atlas_side_cars=None, units='uci'):
+def _extract_source_atlas_tacs(atlas, atlas_side_car=None):
+    """
+    Worker-side trampoline used by _create_tacs, extracts the tacs of one
+    atlas from the source inherited through _TAC_SOURCE
+    
+    :Parameters:
+      -. `atlas` : file-like str, the filename of the 3d atlas
+      -. `atlas_side_car` : file-like str or None, the filepath to the atlas'
+        side car json
+    """
+    return _extract_atlas_tacs(_TAC_SOURCE, atlas, atlas_side_car)
+
+def _extract_atlas_tacs(source, atlas, atlas_side_car=None):
+    """
+    Extract the mean TAC of every roi in a single atlas. This is the per-atlas
+    work of _create_tacs, kept at the module level so it can be handed to a
+    worker process.
+    
+    :Parameters:
+      -. `source` : file-like str or nibabel image, the 4d source image. An
+        image already loaded into memory is used as it is
+      -. `atlas` : file-like str, the filename of the 3d atlas
+      -. `atlas_side_car` : file-like str or None, the filepath to the atlas'
+        side car json
+    
+    :Return:
+      -. a tuple, (2d array of the roi x frame means, list of the roi labels)
+    """
+
+    import numpy as np
+    import nibabel as nib
+    from nibabel.processing import resample_from_to
+    from nilearn.image import resample_to_img
+    from picnic.interfaces.utility import _load_json
+    from picnic.interfaces.nibabel_nodes import _load_label_image, _label_data
+
+    # load the source and atlas image
+    if isinstance(source, str):
+        source = nib.load(source)
+    source_image = source
+    atlas_image = _load_label_image(atlas)
+    
+    # load the atlas sidecar
+    if atlas_side_car is not None:
+        label_lookup = _load_json(atlas_side_car)['label_lookup']
+        label_lookup = dict((k, v.lower()) for k, v in label_lookup.items())
+    else:
+        label_lookup = {}
+    
+    # bring the source and atlas onto a common grid. When the atlas grid is no
+    #  larger than the source grid, resample the 3d atlas to source space with
+    #  nearest neighbour (labels stay labels) so the 4d source is never
+    #  resampled; otherwise resample the source to atlas space
+    n_frames = source_image.shape[3]
+    if np.prod(atlas_image.shape[:3]) <= np.prod(source_image.shape[:3]):
+        atlas_image = resample_from_to(
+            atlas_image,
+            (source_image.shape[:3], source_image.affine),
+            order = 0
+        )
+        # read the whole series once in its on disk dtype, slicing frames
+        #  off a compressed image's proxy would decompress it every time
+        source_frames = np.asanyarray(source_image.dataobj)
+    else:
+        source_frames = resample_to_img(source_image, atlas_image).get_fdata()
+    atlas_flat = _label_data(atlas_image).ravel()
+    
+    # sum every roi for each frame in a single pass over the volume with
+    #  np.bincount, then divide by the number of voxels per roi. Only one
+    #  frame at a time is converted to float64
+    roi_sizes = np.bincount(atlas_flat)
+    roi_idxs = np.flatnonzero(roi_sizes)
+    roi_sums = np.empty((roi_sizes.size, n_frames))
+    for frame in range(n_frames):
+        roi_sums[:, frame] = np.bincount(
+            atlas_flat,
+            weights = np.asarray(source_frames[..., frame], dtype=np.float64).ravel(),
+            minlength = roi_sizes.size
+        )
+    roi_means = roi_sums[roi_idxs] / roi_sizes[roi_idxs, None]
+    
+    # find each roi's associated label
+    roi_labels = [
+        label_lookup.get(str(roi_idx), str(roi_idx)) for roi_idx in roi_idxs
+    ]
+    
+    return roi_means, roi_labels
+
+
+def _create_tacs(source, atlases, source_side_car=None, atlas_side_cars=None, units='uci', nprocs=1):
     """
     A nipype function used to create a tacs file based on an atlas and 4d
     image. 
     (1) Load the source and atlas image
     (2) Force atlas to be 3d (it already should be)
-    (3) Resample the source to be in atlas space
+    (3) Resample the atlas to source space (or the source to atlas space when
+        the atlas grid is the larger of the two)
     (4) Load the atlas side car to get the roi labels
     (5) Loop over each unique index in the atlas to create a mask and apply 
         that to all frames of the source
     (6) Convert to mCi/mL
     (7) Load the source side car to determine the mid-times
     (8) Assemble the data in a 2d array and save as a tsv
+    The source is read into memory once and shared by every atlas. Steps (2)
+    through (5) are independent for every atlas, so with nprocs > 1 multiple
+    atlases are processed in forked worker processes that inherit the source.
     
     :Parameters:
       -. `source` : file-like str, the filename of the 4d source image
@@ -406,78 +615,74 @@ def _create_tacs(source, atlases, source_side_car=None, atlas_side_cars=None, un
       -. `atlas_side_car` : file-like str, the filepath to the atlas' side car
         json
       -. `units` : str, available options are uci or bq
+      -. `nprocs` : int, the number of worker processes (default: 1, serial)
     """
 
     import os
-    import json
+    import multiprocessing
     import numpy as np
     import pandas as pd
     import nibabel as nib
-    from nilearn.image import resample_to_img
-    from picnic.interfaces.utility import nibabel_image_types
+    from picnic.interfaces.utility import _strip_img_ext, _load_json
+    from picnic.interfaces import nibabel_nodes
 
     # read the basename
     dirname, filename = os.path.split(source)
-    for img_type in nibabel_image_types:
-        if filename.endswith(img_type):
-            basename = filename.replace(img_type, '')
-            break
+    basename, _ = _strip_img_ext(filename)
     
-    # load the 4d image
+    # load the 4d image into memory once, in its on disk dtype
     source_image = nib.load(source)
+    source_image = nib.Nifti1Image(
+        np.asanyarray(source_image.dataobj),
+        source_image.affine,
+        source_image.header
+    )
     
     # read the midtimes where available. If not, use the index
     if source_side_car:
-        with open(source_side_car) as f:
-            data = json.load(f)
-            midtimes = list(np.array(data["FrameTimesStart"]) + (np.array(data["FrameDuration"]) / 2.))
+        data = _load_json(source_side_car)
+        midtimes = list(np.array(data["FrameTimesStart"]) + (np.array(data["FrameDuration"]) / 2.))
     else:
         midtimes = list(range(source_image.shape[3]))
     
-    # loop over each atlas and extract tacs for each roi
-    tacs, labels = [], []
-    for idx, atlas in enumerate(atlases):
-        # load the atlas image
-        atlas_image = nib.load(atlas)
-        
-        # load the atlas sidecar
+    # pair every atlas with its sidecar, atlases without one use the indices
+    side_cars = list(atlas_side_cars or [])[:len(atlases)]
+    side_cars += [None] * (len(atlases) - len(side_cars))
+    
+    # extract the tacs for each roi of every atlas. Forked workers inherit the
+    #  loaded source instead of reading it again; a daemonic caller may not
+    #  have children, so it stays serial
+    nprocs = min(len(atlases), int(nprocs or 1))
+    if (
+        nprocs < 2
+        or 'fork' not in multiprocessing.get_all_start_methods()
+        or multiprocessing.current_process().daemon
+    ):
+        atlas_tacs = [
+            nibabel_nodes._extract_atlas_tacs(source_image, atlas, side_car)
+            for atlas, side_car in zip(atlases, side_cars)
+        ]
+    else:
+        nibabel_nodes._TAC_SOURCE = source_image
         try:
-            atlas_side_car = atlas_side_cars[idx]
-            with open(atlas_side_car) as f:
-                label_lookup = json.load(f)['label_lookup']
-                label_lookup = dict((k, v.lower()) for k, v in label_lookup.items())
-        except TypeError:
-            label_lookup = {}
-        except IndexError:
-            label_lookup = {}
-        
-        # resample the source image to atlas space
-        resampled_source = resample_to_img(source_image, atlas_image)
-        
-        # load the voxel data as matrices
-        source_fdata = resampled_source.get_fdata()
-        atlas_fdata = atlas_image.get_fdata().astype(int)
-        
-        # loop over all the unique rois in the atlas
-        for roi_idx in np.unique(atlas_fdata):
-            # create a binary mask at the index
-            roi_mask = np.where(atlas_fdata==roi_idx, 1., 0.)
-            
-            roi_tacs = []
-            for frame in range(source_fdata.shape[3]):
-                # apply the binary roi mask created above to the source image
-                source_frame_mask = source_fdata[:,:,:,frame] * roi_mask
-                
-                mx = np.sum(source_frame_mask) / np.sum(roi_mask)
-                roi_tacs.append(mx)
-            tacs.append(roi_tacs)
-            
-            # find the roi's associated label
-            try:
-                label = label_lookup[str(roi_idx)]
-            except KeyError:
-                label = str(roi_idx)
-
+            with multiprocessing.get_context('fork').Pool(nprocs) as pool:
+                atlas_tacs = pool.starmap(
+                    nibabel_nodes._extract_source_atlas_tacs,
+                    zip(atlases, side_cars)
+                )
+        finally:
+            nibabel_nodes._TAC_SOURCE = None
+    
+    # gather the results in atlas order into one preallocated roi x frame
+    #  array, each atlas fills its own block of rows
+    n_rois = sum(len(roi_labels) for _, roi_labels in atlas_tacs)
+    tacs = np.empty((n_rois, len(midtimes)), dtype=np.float64)
+    labels = []
+    row = 0
+    for roi_means, roi_labels in atlas_tacs:
+        tacs[row:row + len(roi_labels)] = roi_means
+        row += len(roi_labels)
+        for label in roi_labels:
             # force each label name to be unique
             if label in labels:
                 label_idx = 1
@@ -488,11 +693,10 @@ def _create_tacs(source, atlases, source_side_car=None, atlas_side_cars=None, un
                 label = label_counter
             labels.append(label)
     
-    # unit correct to uCi/mL
+    # unit correct to uCi/mL, scaling in place to avoid a second copy
+    tac_matrix = tacs.T
     if units == 'uci':
-        tac_matrix = np.transpose(np.array(tacs)) * (1 / 37000.)
-    else:
-        tac_matrix = np.transpose(np.array(tacs))
+        tac_matrix *= (1 / 37000.)
     
     # save the tacs as a tsv using pandas
     tac_file = os.path.join(os.getcwd(), basename+'_tacs.tsv')
@@ -503,67 +707,72 @@ def _create_tacs(source, atlases, source_side_car=None, atlas_side_cars=None, un
 
 
 
-def _generate_wholebrain_mask(in_file, gz=True):
+def _generate_aseg_masks(in_file, masks=None, gz=True):
     """
-    use nibabel to create a wholebrain mask starting from the aseg
-    generated from freesurfer's reconall
+    use nibabel to create binary masks from the aseg generated from 
+    freesurfer's reconall. The aseg is loaded once and every requested mask
+    (see ASEG_MASKS) is built from it in a single np.isin pass, either keeping
+    only its included rois or every non-zero roi except its excluded rois.
 
     :Parameters:
       -. `in_file` : file-like str, the aseg file
+      -. `masks` : list of str or None, the ASEG_MASKS keys to create. If
+        None, create all of them
       -. `gz` : boolean, save the file as a nifti_gz (True) or nifti (False)
+
+    :Return:
+      -. a tuple of file-like str, the mask paths in the order of `masks`
     """
     import nibabel as nib
     import numpy as np
     import os
+    from picnic.interfaces.nibabel_nodes import ASEG_MASKS, _load_label_image, _label_data
 
-    # the exclusions used to translate aseg to wholebrain
-    WB_EXCLUSIONS = [
-        2,
-        4,
-        5,
-        14,
-        15,
-        24,
-        30,
-        31,
-        41,
-        43,
-        44,
-        62,
-        63,
-        77,
-        85,
-        251,
-        252,
-        253,
-        254,
-        255
-    ]
+    if masks is None:
+        masks = list(ASEG_MASKS.keys())
 
     # load the aseg atlas
-    aseg_atlas = nib.load(in_file)
-    aseg_fdata = aseg_atlas.get_fdata().astype(int)
+    aseg_atlas = _load_label_image(in_file)
+    aseg_fdata = _label_data(aseg_atlas)
+
+    mask_paths = []
+    for mask_name in masks:
+        # create the mask by including or excluding certain rois
+        include, exclude = ASEG_MASKS[mask_name]
+        if include is not None:
+            mask = np.isin(aseg_fdata, include)
+        else:
+            mask = (aseg_fdata > 0) & ~np.isin(aseg_fdata, exclude)
+        
+        # save out the new image
+        if gz:
+            mask_path = os.path.join(os.getcwd(), mask_name + '.nii.gz')
+        else:
+            mask_path = os.path.join(os.getcwd(), mask_name + '.nii')
+        # reinterpret the bool mask as uint8 (same bytes) instead of copying
+        nib.save(
+            nib.Nifti1Image(
+                mask.view(np.uint8),
+                aseg_atlas.affine
+            ),
+            mask_path
+        )
+        mask_paths.append(mask_path)
+
+    return tuple(mask_paths)
 
-    # create the wholebrain mask by exclusing certain rois
-    wholebrain_mask = np.zeros(aseg_atlas.shape)
-    wholebrain_mask += np.where(aseg_fdata > 0, 1., 0.)
-    for roi in WB_EXCLUSIONS:
-        wholebrain_mask -= np.where(aseg_fdata == roi, 1., 0.)
-    
-    # save out the new image
-    if gz:
-        mask_path = os.path.join(os.getcwd(), 'wholebrain_mask.nii.gz')
-    else:
-        mask_path = os.path.join(os.getcwd(), 'wholebrain_mask.nii')
-    nib.save(
-        nib.Nifti1Image(
-            wholebrain_mask,
-            aseg_atlas.affine
-        ),
-        mask_path
-    )
+def _generate_wholebrain_mask(in_file, gz=True):
+    """
+    use nibabel to create a wholebrain mask starting from the aseg
+    generated from freesurfer's reconall
 
-    return mask_path
+    :Parameters:
+      -. `in_file` : file-like str, the aseg file
+      -. `gz` : boolean, save the file as a nifti_gz (True) or nifti (False)
+    """
+    from picnic.interfaces.nibabel_nodes import _generate_aseg_masks
+
+    return _generate_aseg_masks(in_file, ['wholebrain_mask'], gz)[0]
 
 def _generate_gray_matter_mask(in_file, gz=True):
     """
@@ -574,91 +783,22 @@ def _generate_gray_matter_mask(in_file, gz=True):
       -. `in_file` : file-like str, the aseg file
       -. `gz` : boolean, save the file as a nifti_gz (True) or nifti (False)
     """
-    import nibabel as nib
-    import numpy as np
-    import os
-
-    # the inclusions used to translate aseg to gray matter
-    GM_INCLUSIONS = [
-        3,
-        8,
-        42,
-        47
-    ]
-
-    # load the aseg atlas
-    aseg_atlas = nib.load(in_file)
-    aseg_fdata = aseg_atlas.get_fdata().astype(int)
-    
-    # create the gray matter mask by exclusing certain rois
-    gm_mask = np.zeros(aseg_atlas.shape)
-    for roi in GM_INCLUSIONS:
-        gm_mask += np.where(aseg_fdata == roi, 1., 0.)
-    
-    # save out the new image
-    if gz:
-        mask_path = os.path.join(os.getcwd(), 'gm_mask.nii.gz')
-    else:
-        mask_path = os.path.join(os.getcwd(), 'gm_mask.nii')
-    nib.save(
-        nib.Nifti1Image(
-            gm_mask,
-            aseg_atlas.affine
-        ),
-        mask_path
-    )
+    from picnic.interfaces.nibabel_nodes import _generate_aseg_masks
 
-    return mask_path
+    return _generate_aseg_masks(in_file, ['gm_mask'], gz)[0]
 
 def _generate_white_matter_mask(in_file, gz=True):
     """
-    use nibabel to create a gray matter mask starting from the aseg
+    use nibabel to create a white matter mask starting from the aseg
     generated from freesurfer's reconall
 
     :Parameters:
       -. `in_file` : file-like str, the aseg file
       -. `gz` : boolean, save the file as a nifti_gz (True) or nifti (False)
     """
-    import nibabel as nib
-    import numpy as np
-    import os
-
-    # the inclusions used to translate aseg to white matter
-    WM_INCLUSIONS = [
-        2,
-        7,
-        41,
-        46,
-        251,
-        252,
-        253,
-        254,
-        255
-    ]
-
-    # load the aseg atlas
-    aseg_atlas = nib.load(in_file)
-    aseg_fdata = aseg_atlas.get_fdata().astype(int)
-
-    # create the wholebrain mask by exclusing certain rois
-    wm_mask = np.zeros(aseg_atlas.shape)
-    for roi in WM_INCLUSIONS:
-        wm_mask += np.where(aseg_fdata == roi, 1., 0.)
-
-    # Save out the new image
-    if gz:
-        mask_path = os.path.join(os.getcwd(), 'wm_mask.nii.gz')
-    else:
-        mask_path = os.path.join(os.getcwd(), 'wm_mask.nii')
-    nib.save(
-        nib.Nifti1Image(
-            wm_mask,
-            aseg_atlas.affine
-        ),
-        mask_path
-    )
+    from picnic.interfaces.nibabel_nodes import _generate_aseg_masks
 
-    return mask_path
+    return _generate_aseg_masks(in_file, ['wm_mask'], gz)[0]
 
 def _generate_subcortical_mask(in_file, gz=True):
     """
@@ -669,60 +809,9 @@ def _generate_subcortical_mask(in_file, gz=True):
       -. `in_file` : file-like str, the aseg file
       -. `gz` : boolean, save the file as a nifti_gz (True) or nifti (False)
     """
-    import nibabel as nib
-    import numpy as np
-    import os
-
-    # the exclusions used to translate aseg to subcortical
-    SUBCORTICAL_EXCLUSIONS = [
-        2,
-        3,
-        4,
-        5,
-        14,
-        15,
-        24,
-        30,
-        31,
-        41,
-        42,
-        43,
-        44,
-        62,
-        63,
-        77,
-        85,
-        251,
-        252,
-        253,
-        254,
-        255
-    ]
-
-    # load the aseg atlas
-    aseg_atlas = nib.load(in_file)
-    aseg_fdata = aseg_atlas.get_fdata().astype(int)
+    from picnic.interfaces.nibabel_nodes import _generate_aseg_masks
 
-    # create the subcortical mask by exclusing certain rois
-    subcortical_mask = np.zeros(aseg_atlas.shape)
-    subcortical_mask += np.where(aseg_fdata > 0, 1., 0.)
-    for roi in SUBCORTICAL_EXCLUSIONS:
-        subcortical_mask -= np.where(aseg_fdata == roi, 1., 0.)
-    
-    # save out the new image
-    if gz:
-        mask_path = os.path.join(os.getcwd(), 'subcortical_mask.nii.gz')
-    else:
-        mask_path = os.path.join(os.getcwd(), 'subcortical_mask.nii')
-    nib.save(
-        nib.Nifti1Image(
-            subcortical_mask,
-            aseg_atlas.affine
-        ),
-        mask_path
-    )
-
-    return mask_path
+    return _generate_aseg_masks(in_file, ['subcortical_mask'], gz)[0]
 
 def _generate_ventricle_mask(in_file, gz=True):
     """
@@ -733,44 +822,9 @@ def _generate_ventricle_mask(in_file, gz=True):
       -. `in_file` : file-like str, the aseg file
       -. `gz` : boolean, save the file as a nifti_gz (True) or nifti (False)
     """
-    import nibabel as nib
-    import numpy as np
-    import os
-
-    # the inclusions used to translate aseg to venticle
-    VENTRICLE_INCLUSIONS = [
-        4,
-        5,
-        14,
-        15,
-        24,
-        43,
-        44
-    ]
-
-    # load the aseg atlas
-    aseg_atlas = nib.load(in_file)
-    aseg_fdata = aseg_atlas.get_fdata().astype(int)
-
-    # create the wholebrain mask by exclusing certain rois
-    ventricle_mask = np.zeros(aseg_atlas.shape)
-    for roi in VENTRICLE_INCLUSIONS:
-        ventricle_mask += np.where(aseg_fdata == roi, 1., 0.)
-
-    # Save out the new image
-    if gz:
-        mask_path = os.path.join(os.getcwd(), 'ventricle_mask.nii.gz')
-    else:
-        mask_path = os.path.join(os.getcwd(), 'ventricle_mask.nii')
-    nib.save(
-        nib.Nifti1Image(
-            ventricle_mask,
-            aseg_atlas.affine
-        ),
-        mask_path
-    )
+    from picnic.interfaces.nibabel_nodes import _generate_aseg_masks
 
-    return mask_path
+    return _generate_aseg_masks(in_file, ['ventricle_mask'], gz)[0]
 
 
 '''
@@ -789,14 +843,11 @@ def find_linear_tail_tac_aberrations(image_4d, json=None):
     import os
     import numpy as np
     import nibabel as nib
-    from picnic.interfaces.utility import nibabel_image_types
+    from picnic.interfaces.utility import _strip_img_ext
     
     # read the basename
     dirname, filename = os.path.split(image_4d)
-    for img_type in nibabel_image_types:
-        if filename.endswith(img_type):
-            basename = filename.replace(img_type, '')
-            break
+    basename, _ = _strip_img_ext(filename)
     
     # load the 4d image
     im = nib.load(image_4d)
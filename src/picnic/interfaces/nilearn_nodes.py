@@ -1,18 +1,90 @@
 # =======================================
 # Imports
+import functools
 
 # =======================================
 # Constants
+# the per-frame render function handed to forked workers, see
+#  _render_frames_in_parallel
+_FRAME_RENDERER = None
 
 # =======================================
 # Classes
 
 # =======================================
 # Functions
+@functools.lru_cache(maxsize=4)
+def _colormap_weights(shape):
+    """
+    The weighting volume used when calculating a report's colormap limits.
+    Each axis is weighted with sin(x*pi/2 + pi/4) over [0, 1], which will 
+    make 0 -> root(2)/2  |  0.5 -> 1.0  |  1.0 -> root(2)/2, so the innermost
+    voxels keep their value and the outermost are scaled by (root(2)/2.)**3.
+    The volume only depends on the shape, so it is cached (read-only)
+    
+    :Parameters:
+      -. `shape` : tuple of 3 ints, the shape of the 3d image
+    """
+
+    import numpy as np
+
+    wx, wy, wz = (
+        np.sin(np.linspace(0., 1., n) * np.pi / 2. + np.pi / 4.).astype(np.float32)
+        for n in shape
+    )
+    weights = (wx[:, None] * wy[None, :])[:, :, None] * wz[None, None, :]
+    weights.flags.writeable = False
+    return weights
+
+def _render_frame(frame):
+    """
+    Worker-side trampoline used by _render_frames_in_parallel
+    
+    :Parameters:
+      -. `frame` : int, the frame index
+    """
+    return _FRAME_RENDERER(frame)
+
+def _render_frames_in_parallel(render, n_frames, nprocs=1):
+    """
+    Call render(frame) for every frame and return the results in frame order,
+    spread over a pool of forked worker processes. The report renderers are
+    closures inside _create_report (so they travel with the nipype node) and
+    cannot be pickled, so they are inherited by fork instead. Matplotlib is
+    not thread-safe, hence processes over threads. Parallelism is opt-in, it
+    runs a serial loop when there is only one process to use, fork is
+    unavailable or the caller is a daemonic process (which may not have
+    children)
+    
+    :Parameters:
+      -. `render` : callable, takes a frame index and returns a picklable
+        result (e.g. a PIL Image)
+      -. `n_frames` : int, the number of frames
+      -. `nprocs` : int, the number of worker processes (default: 1, serial)
+    """
+
+    import multiprocessing
+
+    global _FRAME_RENDERER
+
+    nprocs = min(n_frames, int(nprocs or 1))
+    if (
+        nprocs < 2
+        or 'fork' not in multiprocessing.get_all_start_methods()
+        or multiprocessing.current_process().daemon
+    ):
+        return [render(frame) for frame in range(n_frames)]
+    
+    _FRAME_RENDERER = render
+    try:
+        with multiprocessing.get_context('fork').Pool(nprocs) as pool:
+            return pool.map(_render_frame, range(n_frames))
+    finally:
+        _FRAME_RENDERER = None
 
 # =======================================
 # Nipype Specific Functions
-def _create_report(type_, in_files, additional_args=[]):
+def _create_report(type_, in_files, additional_args=[], nprocs=1):
     """
     a function to hold all the reports
     
@@ -20,11 +92,35 @@ def _create_report(type_, in_files, additional_args=[]):
       -. `type_`: str, the star keyword
       -. `in_files`: list, a list of image files
       -. `additional_args`: list, a list of additional_args
+      -. `nprocs`: int, the number of processes used to render movie frames
+        (default: 1, serial)
     """
+    # the nested report functions share these imports through the closure,
+    #   so they are only looked up once per report rather than once per
+    #   panel or frame
+    import io
+    import os
+    import subprocess
+    import numpy as np
+    import pandas as pd
+    import nibabel as nib
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    from PIL import Image
+    from nilearn.plotting import plot_anat, plot_roi
+    from picnic.interfaces.nilearn_nodes import _render_frames_in_parallel, _colormap_weights
+    
     # ============================================================== High Level
     STANDARD_WIDTH = 1120
     UPPER_COLORMAP_LIMIT = 99.5
     FRAMES_PER_SECOND = 4
+    # the motion plots are scaled down to the report width anyway, so render
+    #   them at screen resolution rather than matplotlib's default 100 dpi
+    MOCO_PLOT_DPI = 72
+    
+    # motion correction figures reused across frames, see create_moco_plot_dual
+    moco_figures = {}
     
     def image_report(in_file, basename='image'):
         """
@@ -35,33 +131,27 @@ def _create_report(type_, in_files, additional_args=[]):
           -. `basename`: str, name of the output filename
         """
 
-        import os
-        import nibabel as nib
-
         # Load file
-        image = nib.load(in_file)
+        image = load_image(in_file)
 
         # if the image is a 4d image, assume it is a pet image and create a mp4
         if len(image.shape) > 3:
+            # time average once and share it between the colormap and the
+            #   bounds rather than each averaging the series again
+            image3d = force_3d_image(image)
+            
             # create an optimized colormap for pet brains
             cmap_limits = calculate_colormap_limits(
-                image,
+                image3d,
                 UPPER_COLORMAP_LIMIT
             )
             
             # calculate the bounds early so the mp4 and png have the same bound
-            bounds = calculate_bounds(image)
+            bounds = calculate_bounds(image3d)
 
-            # create movie and png report
-            mov = create_mp4_mosaic(
-                image,
-                basename,
-                bounds = bounds,
-                cmap = 'jet',
-                vmin = cmap_limits[0],
-                vmax = cmap_limits[1]
-            )
-            png = create_png_mosaic(
+            # create movie and png report, the png is the middle frame of the
+            #   movie so it does not need to be rendered a second time
+            mov, png = create_mp4_mosaic(
                 image,
                 basename,
                 bounds = bounds,
@@ -101,15 +191,9 @@ def _create_report(type_, in_files, additional_args=[]):
           -. `width`: int,number of pixels wide used in the report image
         """
 
-        import math
-        import numpy as np
-        import nibabel as nib
-
-        from PIL import Image
-
         # load the files
-        base_image = nib.load(base_file)
-        moco_image = nib.load(moco_file)
+        base_image = load_image(base_file)
+        moco_image = load_image(moco_file)
         
         # create an optimized colormap for pet brains
         cmap_lims = calculate_colormap_limits(base_image, UPPER_COLORMAP_LIMIT)
@@ -118,28 +202,29 @@ def _create_report(type_, in_files, additional_args=[]):
         bounds = calculate_bounds(moco_image)
         ortho_cuts = [np.mean(bounds[direction]) for direction in 'xyz']
         
-        # loop through all the transformation matrices and derive all 6 dofs
+        # stack all the transformation matrices (parsed with pandas' c reader
+        #   rather than np.loadtxt) and derive all 6 dofs at once
         if mats is not None:
-            dofs = []
-            for mat in mats:
-                m = np.loadtxt(mat)
-                x, y, z = m[0,3], m[1, 3], m[2, 3]
-                rx = math.atan2(-m[1, 2], m[2, 2])
-                ry = math.asin(m[0, 2])
-                rz = math.atan2(-m[0, 1], m[0, 0])
-                dofs.append(np.array([x, y, z, rx, ry, rz]))
-            dofs = np.array(dofs)
-        
-        # loop over each frame and create a comparison orthogonal image for 
-        #   pre- and post- correction
-        stills = []
-        for frame in range(moco_image.shape[3]):
+            m = np.stack([
+                pd.read_csv(mat, header=None, sep=r'\s+', engine='c').to_numpy(dtype=float)
+                for mat in mats
+            ])
+            dofs = np.column_stack([
+                m[:, :3, 3],
+                np.arctan2(-m[:, 1, 2], m[:, 2, 2]),
+                np.arcsin(m[:, 0, 2]),
+                np.arctan2(-m[:, 0, 1], m[:, 0, 0])
+            ])
+        
+        # create a comparison orthogonal image for pre- and post- correction
+        #   of a single frame
+        def render_still(frame):
             panels = []
             for image in (base_image, moco_image):
                 panels.append(
                     draw_lines_on_image(
                         create_png_ortho(
-                            image.slicer[..., frame],
+                            load_frame(image, frame),
                             ortho_cuts,
                             basename = None,
                             cmap = 'jet',
@@ -152,32 +237,16 @@ def _create_report(type_, in_files, additional_args=[]):
                     )
                 )
             
-            # if a list of mat files were provided, create tracer plots
+            # if a list of mat files were provided, create tracer plots of the
+            #   translation and rotation dofs
             if mats is not None:
-                # create a motion plot for the x, y and z dofs
-                # print(np.arange(moco_image.shape[3]))
-                # print(dofs[:, :3])
                 panels.append(
-                    create_moco_plot(
+                    create_moco_plot_dual(
                         np.arange(moco_image.shape[3]),
-                        dofs[:, :3],
+                        dofs,
                         frame,
                         basename = None,
                         ref_frame = None,
-                        labels = ['x', 'y', 'z'],
-                        width = width
-                    )
-                )
-                
-                # create a motion plot for the rx, ry and rz dofs
-                panels.append(
-                    create_moco_plot(
-                        np.arange(moco_image.shape[3]),
-                        dofs[:, 3:],
-                        frame,
-                        basename = None,
-                        ref_frame = None,
-                        labels = ['rx', 'ry', 'rz'],
                         width = width
                     )
                 )
@@ -185,9 +254,7 @@ def _create_report(type_, in_files, additional_args=[]):
             # open the temporary images of panels and resize them to the same width
             resized_panels, heights = [], []
             for panel in panels:
-                resized_panel = panel.resize(
-                    (width, int(panel.size[1]*(width/panel.size[0])))
-                )
+                resized_panel = resize_to_width(panel, width)
                 resized_panels.append(resized_panel)
                 heights.append(resized_panel.size[1])
             
@@ -197,7 +264,16 @@ def _create_report(type_, in_files, additional_args=[]):
             for panel in resized_panels:
                 img.paste(panel, (0, y_offset))
                 y_offset += panel.size[1]
-            stills.append(img)
+            return img
+        
+        # render every frame's still, the frames are independent so they are
+        #   spread over worker processes
+        stills = _render_frames_in_parallel(render_still, moco_image.shape[3], nprocs)
+        
+        # the motion plots are done, release the reused figures
+        for fig, _ in moco_figures.values():
+            plt.close(fig)
+        moco_figures.clear()
         
         # create an mp4 from the list of pngs
         output_filename = basename + '.mp4'
@@ -222,12 +298,10 @@ def _create_report(type_, in_files, additional_args=[]):
           -. `width`: int, number of pixels wide used in the report image
         """
 
-        import numpy as np
-        import nibabel as nib
-
-        # load file
-        base_image = nib.load(base_file)
-        over_image = nib.load(over_file)
+        # load file, time averaging 4d images once up front so the colormap,
+        #   the bounds and every still below reuse the same 3d data
+        base_image = force_3d_image(nib.load(base_file))
+        over_image = force_3d_image(nib.load(over_file))
         
         # create an optimized colormap for pet brains
         cmap_limits = calculate_colormap_limits(
@@ -279,8 +353,6 @@ def _create_report(type_, in_files, additional_args=[]):
           -. `width`: int, number of pixels wide used in the report image
         """
 
-        import pandas as pd
-
         # load tacs file as a pandas dataset
         data = pd.read_csv(tac_file, delimiter='\t', header=0, index_col=0)
         
@@ -295,6 +367,40 @@ def _create_report(type_, in_files, additional_args=[]):
         return tac_plot
     
     # ======================================================= png/mp4 Generator
+    def resize_to_width(panel, width):
+        """
+        Scale an Image obj to the given width, keeping its aspect ratio.
+        Bilinear is plenty for report panels and much cheaper than PIL's 
+        default bicubic, and a panel that already has the width is returned
+        untouched
+        
+        :Parameters:
+          -. `panel` : Image obj, the image
+          -. `width` : int, width (in pixels) for the output image
+        """
+
+        if panel.size[0] == width:
+            return panel
+        return panel.resize(
+            (width, int(panel.size[1]*(width/panel.size[0]))),
+            Image.Resampling.BILINEAR
+        )
+    
+    def figure_to_image(figure, **kwargs):
+        """
+        Render a matplotlib figure to an in-memory png and open it as an
+        Image obj, keeping the round trip off the filesystem
+        
+        :Parameters:
+          -. `figure` : matplotlib Figure, the figure to render
+          -. `kwargs` : passed on to figure.savefig
+        """
+
+        buffer = io.BytesIO()
+        figure.savefig(buffer, format='png', **kwargs)
+        buffer.seek(0)
+        return Image.open(buffer)
+    
     def create_png_mosaic(
         image,
         basename = 'image',
@@ -329,12 +435,6 @@ def _create_report(type_, in_files, additional_args=[]):
           -. `width`: int, width (in pixels) for the output image
         """
 
-        import os
-        import tempfile
-        import numpy as np
-        from PIL import Image
-        from nilearn.plotting import plot_anat, plot_roi
-
         # if the image is a 4d image, get the tmean
         image = force_3d_image(image)
         if overlay_image is not None:
@@ -347,13 +447,11 @@ def _create_report(type_, in_files, additional_args=[]):
         # use nilearn's plot_anat to create each panel
         panels = {}
         for direction in 'xyz':
-            panels[direction] = tempfile.NamedTemporaryFile(suffix='.png').name
             if overlay_image is None:
-                _ = plot_anat(
+                display = plot_anat(
                     image,
                     display_mode = direction,
                     cut_coords = np.linspace(*bounds[direction], n_cuts),
-                    output_file = panels[direction],
                     black_bg = True,
                     dim = 0.,
                     cmap = cmap,
@@ -361,12 +459,11 @@ def _create_report(type_, in_files, additional_args=[]):
                     vmax = vmax,
                 )
             else:
-                _ = plot_roi(
+                display = plot_roi(
                     overlay_image,
                     image,
                     display_mode = direction,
                     cut_coords = np.linspace(*bounds[direction], n_cuts),
-                    output_file = panels[direction],
                     black_bg = True,
                     dim = 0.,
                     cmap = cmap,
@@ -374,14 +471,21 @@ def _create_report(type_, in_files, additional_args=[]):
                     vmax = vmax,
                     alpha = opacity
                 )
+            
+            # render the panel in memory (black background, like nilearn's
+            #   own savefig with black_bg) and close the display
+            panels[direction] = figure_to_image(
+                display.frame_axes.figure,
+                facecolor = 'k',
+                edgecolor = 'k'
+            )
+            display.close()
         
         # open the temporary images of panels and resize them to the same width
         resized_panels, heights = [], []
         for direction in 'yxz':
-            panel = Image.open(panels[direction])
-            resized_panel = panel.resize(
-                (width, int(panel.size[1]*(width/panel.size[0])))
-            )
+            panel = panels[direction]
+            resized_panel = resize_to_width(panel, width)
             resized_panels.append(resized_panel)
             heights.append(resized_panel.size[1])
         
@@ -422,12 +526,6 @@ def _create_report(type_, in_files, additional_args=[]):
           -. `width` : int, width (in pixels) for the output image
         """
 
-        import os
-        import tempfile
-        import numpy as np
-        from PIL import Image
-        from nilearn.plotting import plot_anat
-
         # if the image is a 4d image, get the tmean
         image = force_3d_image(image)
         
@@ -437,12 +535,10 @@ def _create_report(type_, in_files, additional_args=[]):
             ortho_cuts = [np.mean(bounds[direction]) for direction in ['xyz']]
 
         # Use nilearn's plot_anat to create each panel
-        temp_panel = tempfile.NamedTemporaryFile(suffix='.png').name
-        _ = plot_anat(
+        display = plot_anat(
             image,
             display_mode = 'ortho',
             cut_coords = ortho_cuts,
-            output_file = temp_panel,
             black_bg = True,
             dim = 0.,
             cmap = cmap,
@@ -450,12 +546,15 @@ def _create_report(type_, in_files, additional_args=[]):
             vmax = vmax,
             draw_cross = False
         )
+        panel = figure_to_image(
+            display.frame_axes.figure,
+            facecolor = 'k',
+            edgecolor = 'k'
+        )
+        display.close()
         
         # resize the image to the desired width
-        panel = Image.open(temp_panel)
-        resized_panel = panel.resize(
-            (width, int(panel.size[1]*(width/panel.size[0])))
-        )
+        resized_panel = resize_to_width(panel, width)
         
         # either save the resized image or return the Image obj
         if basename is not None:
@@ -465,36 +564,20 @@ def _create_report(type_, in_files, additional_args=[]):
         else:
             return resized_panel
     
-    def create_moco_plot(
-        t,
-        dofs,
-        frame,
-        basename = 'image',
-        ref_frame = None,
-        labels = ['x', 'y', 'z'],
-        width = STANDARD_WIDTH
-    ):
+    def draw_moco_axes(ax, t, dofs, frame, ref_frame=None, labels=['x', 'y', 'z']):
         """
-        Create pyplots for motion correction
+        Draw three dofs, and the current/reference frame markers, on a
+        matplotlib axes. Returns the current frame's marker so it can be moved
         
         :Parameters:
+          -. `ax` : matplotlib Axes, the axes to draw on
           -. `t` : numpy array, x axis
           -. `dofs` : numpy array, an array of dofs (x, y, z or rx, ry, rz)
           -. `frame` : int, denote which frame we are looking at
           -. `ref_frame` :int or None, denote the reference frame
-          -. `width` : int, width (in pixels) for the output image
+          -. `labels` : list of str, the name of each dof
         """
 
-        import os
-        import tempfile
-        import numpy as np
-        import matplotlib.pyplot as plt
-
-        from PIL import Image
-
-        # create a pyplot
-        tmp_png = tempfile.NamedTemporaryFile(suffix = '.png').name
-        fig, ax = plt.subplots(figsize = (9, 3))
         a, = ax.plot(t, dofs[:, 0])
         a.set_label(labels[0])
         b, = ax.plot(t, dofs[:, 1])
@@ -503,7 +586,7 @@ def _create_report(type_, in_files, additional_args=[]):
         c.set_label(labels[2])
         
         # create vertical lines for the current and reference frame
-        _ = ax.vlines(
+        current = ax.vlines(
             t[frame],
             np.min(dofs[:, :3]),
             np.max(dofs[:, :3]),
@@ -525,15 +608,90 @@ def _create_report(type_, in_files, additional_args=[]):
         ax.set_xlabel('Frame Number')
         ax.set_ylabel('Detected Motion')
         ax.legend(loc='center left', bbox_to_anchor=(1, 0.5))
+        
+        return current
+    
+    def create_moco_plot(
+        t,
+        dofs,
+        frame,
+        basename = 'image',
+        ref_frame = None,
+        labels = ['x', 'y', 'z'],
+        width = STANDARD_WIDTH
+    ):
+        """
+        Create pyplots for motion correction
+        
+        :Parameters:
+          -. `t` : numpy array, x axis
+          -. `dofs` : numpy array, an array of dofs (x, y, z or rx, ry, rz)
+          -. `frame` : int, denote which frame we are looking at
+          -. `ref_frame` :int or None, denote the reference frame
+          -. `width` : int, width (in pixels) for the output image
+        """
+
+        # create a pyplot
+        fig, ax = plt.subplots(figsize = (9, 3))
+        draw_moco_axes(ax, t, dofs, frame, ref_frame, labels)
         plt.tight_layout()
-        fig.savefig(tmp_png)
+        panel = figure_to_image(fig, dpi=MOCO_PLOT_DPI)
         plt.close('all')
         
         # resize the image to the desired width
-        panel = Image.open(tmp_png)
-        resized_panel = panel.resize(
-            (width, int(panel.size[1]*(width/panel.size[0])))
-        )
+        resized_panel = resize_to_width(panel, width)
+        
+        # either save the resized image or return the Image obj
+        if basename is not None:
+            filename = basename + '.png'
+            resized_panel.save(filename)
+            return os.path.abspath(filename)
+        else:
+            return resized_panel
+    
+    def create_moco_plot_dual(
+        t,
+        dofs,
+        frame,
+        basename = 'image',
+        ref_frame = None,
+        width = STANDARD_WIDTH
+    ):
+        """
+        Create the translation (x, y, z) and rotation (rx, ry, rz) motion
+        correction plots as two rows of a single figure. Only the current
+        frame marker changes between frames, so the figure is built once per
+        process and reused, moving the marker for each later frame
+        
+        :Parameters:
+          -. `t` : numpy array, x axis
+          -. `dofs` : numpy array, all 6 dofs (x, y, z, rx, ry, rz)
+          -. `frame` : int, denote which frame we are looking at
+          -. `ref_frame` :int or None, denote the reference frame
+          -. `width` : int, width (in pixels) for the output image
+        """
+
+        # create a pyplot with a row for the translations and the rotations,
+        #   or move the current frame marker of the one already made
+        key = (id(dofs), ref_frame)
+        if key not in moco_figures:
+            fig, (ax_trans, ax_rot) = plt.subplots(2, 1, figsize = (9, 6))
+            markers = [
+                draw_moco_axes(ax_trans, t, dofs[:, :3], frame, ref_frame, ['x', 'y', 'z']),
+                draw_moco_axes(ax_rot, t, dofs[:, 3:], frame, ref_frame, ['rx', 'ry', 'rz'])
+            ]
+            fig.tight_layout()
+            moco_figures[key] = (fig, markers)
+        else:
+            fig, markers = moco_figures[key]
+            for marker in markers:
+                segment = marker.get_segments()[0]
+                segment[:, 0] = t[frame]
+                marker.set_segments([segment])
+        panel = figure_to_image(fig, dpi=MOCO_PLOT_DPI)
+        
+        # resize the image to the desired width
+        resized_panel = resize_to_width(panel, width)
         
         # either save the resized image or return the Image obj
         if basename is not None:
@@ -561,11 +719,6 @@ def _create_report(type_, in_files, additional_args=[]):
           -. `width` : int, width (in pixels) for the output image
         """
 
-        import os
-        import tempfile
-        import matplotlib.pyplot as plt
-        from PIL import Image
-
         # if selected plots are given, reduce the dataset
         title = 'All TACs'
         if len(selected_rois) > 0:
@@ -573,7 +726,6 @@ def _create_report(type_, in_files, additional_args=[]):
             title = 'Selected TACs'
         
         # create plot
-        tmp_png = tempfile.NamedTemporaryFile(suffix = '.png').name
         fig, ax = plt.subplots(figsize=(12, 4))
         ax = dataframe.plot(ax=ax)
         if len(selected_rois) == 0:
@@ -586,13 +738,11 @@ def _create_report(type_, in_files, additional_args=[]):
             _ = ax.set_ylabel('Counts (Bq/mL)')
         _ = ax.set_xlim(0.)
         plt.tight_layout()
-        fig.savefig(tmp_png)
+        panel = figure_to_image(fig)
+        plt.close(fig)
         
         # resize the image to the desired width
-        panel = Image.open(tmp_png)
-        resized_panel = panel.resize(
-            (width, int(panel.size[1]*(width/panel.size[0])))
-        )
+        resized_panel = resize_to_width(panel, width)
         
         # either save the resized image or return the Image obj
         if basename is not None:
@@ -614,7 +764,9 @@ def _create_report(type_, in_files, additional_args=[]):
         fps = FRAMES_PER_SECOND
     ):
         """
-        Create a movie based on stills from the create_png_mosaic function
+        Create a movie based on stills from the create_png_mosaic function.
+        The still of the middle frame is also saved as a png and both paths
+        are returned
         
         |----------------------|
         | [] [] [] [] [] [] [] | y
@@ -640,28 +792,32 @@ def _create_report(type_, in_files, additional_args=[]):
             image3d = force_3d_image(image)
             bounds = calculate_bounds(image3d)
         
-        # loop over each frame and create a mosaic still of that frame
-        images = []
-        for frame in range(image.shape[3]):
-            images.append(
-                create_png_mosaic(
-                    image.slicer[..., frame],
-                    basename = None,
-                    bounds = bounds,
-                    cmap = cmap,
-                    vmin = vmin,
-                    vmax = vmax,
-                    n_cuts = n_cuts,
-                    width = width
-                )
+        # create a mosaic still of each frame, the frames are independent so
+        #   they are spread over worker processes
+        def render_still(frame):
+            return create_png_mosaic(
+                load_frame(image, frame),
+                basename = None,
+                bounds = bounds,
+                cmap = cmap,
+                vmin = vmin,
+                vmax = vmax,
+                n_cuts = n_cuts,
+                width = width
             )
+        images = _render_frames_in_parallel(render_still, image.shape[3], nprocs)
+        
+        # keep the middle frame as the png still
+        png_filename = basename + '.png'
+        images[len(images) // 2].save(png_filename)
         
         output_filename = basename + '.mp4'
-        return create_mp4_from_image_list(
+        mov = create_mp4_from_image_list(
             images,
             output_filename,
             fps = fps
         )
+        return mov, os.path.abspath(png_filename)
         
     def create_mp4_from_image_list(
         images,
@@ -677,30 +833,34 @@ def _create_report(type_, in_files, additional_args=[]):
           -. `fps` : int, frames per second
         """
 
-        import os
-        import glob
-
-        # from each image in the list, save it as a temporary image
-        for idx, image in enumerate(images):
-            image.save('_image_' + str(idx).zfill(4) + '.png')
-        
-        # use ffmpeg to create an mp4 from the list of temporary images
-        os.system(' '.join([
-            'ffmpeg',
-            '-r ' + str(fps),
-            '-f image2',
-            '-pattern_type glob',
-            '-i "_image_*.png"',
-            '-vcodec libx264',
-            '-crf 20',
-            '-pix_fmt yuv420p',
-            output_filename
-        ]))
+        # pipe the raw rgb frames straight into ffmpeg rather than writing
+        #   each one out as a temporary png
+        width, height = images[0].size
+        proc = subprocess.Popen(
+            [
+                'ffmpeg',
+                '-y',
+                '-f', 'rawvideo',
+                '-vcodec', 'rawvideo',
+                '-s', f'{width}x{height}',
+                '-pix_fmt', 'rgb24',
+                '-r', str(fps),
+                '-i', '-',
+                '-vcodec', 'libx264',
+                '-crf', '20',
+                '-pix_fmt', 'yuv420p',
+                output_filename
+            ],
+            stdin = subprocess.PIPE
+        )
+        for image in images:
+            if image.size != (width, height):
+                image = image.resize((width, height))
+            proc.stdin.write(image.convert('RGB').tobytes())
+        proc.stdin.close()
+        if proc.wait() != 0:
+            raise subprocess.CalledProcessError(proc.returncode, proc.args)
         
-        # remove the dummy pngs
-        for tmp_file in glob.glob('_image_*.png'):
-            os.remove(tmp_file)
-            
         return os.path.abspath(output_filename)
     
     # ============================================================ Calculations
@@ -729,8 +889,6 @@ def _create_report(type_, in_files, additional_args=[]):
           -. image : nibabel.Nifti1Image, the nibabel image
         """
 
-        import numpy as np
-
         # isolate constants
         COORDS_IDX_KEY = {'x':0, 'y':1, 'z':2}
         COORDS_AXIS = {'x':(1, 2), 'y':(0, 2), 'z':(0, 1)}
@@ -738,7 +896,7 @@ def _create_report(type_, in_files, additional_args=[]):
         
         # get the data and affine from nibabel information
         image = force_3d_image(image)
-        fdata = image.get_fdata()
+        fdata = np.asanyarray(image.dataobj)
         affine = image.affine
         zooms = [affine[idx, idx] for idx in range(3)]
         
@@ -747,22 +905,22 @@ def _create_report(type_, in_files, additional_args=[]):
         for direction in 'xyz':
             distribution = np.mean(fdata, axis=COORDS_AXIS[direction])
             
+            # trapezoid prefix sums, cum_area[i] is the area under
+            #  distribution[:i+1]. This is the (unnormalised) cdf of the axis
+            #  so each bound is a direct inverse lookup
+            cum_area = np.zeros(len(distribution))
+            np.cumsum((distribution[1:] + distribution[:-1]) / 2., out=cum_area[1:])
+            total_area = cum_area[-1]
+            
             # loop over low and high threshold
             bounds[direction] = []
             for thr in COORDS_THRESHOLD[direction]:
-                # bounce back and forth to locate the bounds
-                l_idx, u_idx = (0, len(distribution))
-                total_area = np.trapz(distribution)
-                
-                while u_idx - l_idx > 1.:
-                    idx = (l_idx + u_idx) // 2
-                    area = np.trapz(distribution[:idx])
-                    if area/total_area > (thr/100.)+0.005:
-                        u_idx = idx
-                    elif area/total_area < (thr/100.)-0.005:
-                        l_idx = idx
-                    else:
-                        break
+                # the first index whose area reaches the threshold, idx counts
+                #  the points under the curve so it is one past cum_area's
+                idx = min(
+                    int(np.searchsorted(cum_area, (thr/100.) * total_area)) + 1,
+                    len(distribution)
+                )
                 
                 bounds[direction].append(
                     affine[COORDS_IDX_KEY[direction], 3] + (idx * zooms[COORDS_IDX_KEY[direction]])
@@ -770,6 +928,36 @@ def _create_report(type_, in_files, additional_args=[]):
         
         return bounds
     
+    def load_image(in_file):
+        """
+        Load an image with its data read into memory once, in its on disk
+        dtype. The reports go over 4d images frame by frame, and slicing a
+        frame out of a compressed image's proxy decompresses the file again
+        from the start every time
+        
+        :Parameters:
+          -. `in_file`: file-like str, the nibabel readable image file
+        """
+
+        image = nib.load(in_file)
+        return nib.Nifti1Image(np.asanyarray(image.dataobj), image.affine)
+    
+    def load_frame(image, frame):
+        """
+        Read a single frame of a 4d image from its data as a float32 image,
+        rather than slicing the image and letting the plotting load the frame
+        as float64
+        
+        :Parameters:
+          -. `image` : nibabel.Nifti1Image, the 4d nibabel image
+          -. `frame` : int, the frame index
+        """
+
+        return nib.Nifti1Image(
+            np.asarray(image.dataobj[..., frame], dtype=np.float32),
+            image.affine
+        )
+    
     def force_3d_image(image):
         """
         check if the image is a 4d image. If it is, time average the data
@@ -778,14 +966,13 @@ def _create_report(type_, in_files, additional_args=[]):
           -. `image` : nibabel.Nifti1Image, the nibabel image
         """
 
-        import numpy as np
-        import nibabel as nib
-
         # check the image dimensionality
         if len(image.shape) > 3:
-            # average along the time axis and return a Nifti
-            fdata = image.get_fdata()
-            fdata = np.mean(fdata, axis=3)
+            # average along the time axis and return a Nifti. The series is
+            #  read from the proxy in one pass (a compressed image would be
+            #  decompressed again for every frame slice) and kept in its on
+            #  disk dtype, only the mean is accumulated as float64
+            fdata = np.asanyarray(image.dataobj).mean(axis=3, dtype=np.float64)
             return nib.Nifti1Image(fdata, image.affine)
         
         return image
@@ -801,38 +988,34 @@ def _create_report(type_, in_files, additional_args=[]):
           -. `upper_limit` : float, value between 0 and 100
         """
 
-        import math
-        import numpy as np
-
         image = force_3d_image(image)
-        fdata = image.get_fdata()
+        fdata = np.asanyarray(image.dataobj)
         
-        # let's create a vectorizing function as a nested function. This will 
-        #   make 0 -> root(2)/2  |  0.5 -> 1.0  |  1.0 -> root(2)/2
-        def vector_function(float_):
-            """
-            used for numpy.vectorize
-
-            :Parameters:
-              -. `float_` : float (duh), a value between 0. and 1.
-            """
-
-            return math.sin(float_ * math.pi / 2. + math.pi / 4.)
-        
-        # create a 3d array of 1s, multiply that by the x vector function above
-        #   then the y and z. This gives a 3d array where the innermost voxels 
-        #   will have a value of 1 and the outermost will be (root(2)/2.)**3.
-        wa = np.ones(image.shape)
-        vec = np.vectorize(vector_function)
-        wa *= vec(np.linspace(0., 1., fdata.shape[0]))[:, None, None]
-        wa *= vec(np.linspace(0., 1., fdata.shape[1]))[None, :, None]
-        wa *= vec(np.linspace(0., 1., fdata.shape[2]))[None, None, :]
-        
-        wght_fdata = wa * fdata
+        # weight the voxels closest to the center, the weighting volume only
+        #   depends on the shape so it is built once and reused
+        wght_fdata = np.multiply(
+            _colormap_weights(fdata.shape[:3]),
+            fdata,
+            dtype = np.float32
+        )
         
         # set lower bound to 0. and upper bound to the xth percentile (ignoring
-        #  all values less than 0.)
-        return 0., np.percentile(wght_fdata[wght_fdata > 0.], upper_limit)
+        #  all values less than 0.). Only the two order statistics around the
+        #  percentile are needed and wght_fdata is already a scratch buffer,
+        #  so partition it in place instead of copying out the positive
+        #  values. Non-positive values sort before the positives and nans
+        #  after them, so the ranks only need to be shifted past the former
+        #  and the interpolation is linear like np.percentile
+        flat = wght_fdata.reshape(-1)
+        n_positive = np.count_nonzero(flat > 0.)
+        offset = flat.size - n_positive - np.count_nonzero(np.isnan(flat))
+        rank = (n_positive - 1) * (upper_limit / 100.)
+        lower = int(rank)
+        upper = min(lower + 1, n_positive - 1)
+        flat.partition((offset + lower, offset + upper))
+        lo_val = float(flat[offset + lower])
+        hi_val = float(flat[offset + upper])
+        return 0., lo_val + (hi_val - lo_val) * (rank - lower)
     
     def draw_lines_on_image(image, numx, numy):
         """
@@ -845,18 +1028,14 @@ def _create_report(type_, in_files, additional_args=[]):
           -. `numy`: int, number of equally spaced horizontal lines
         """
 
-        import numpy as np
-        from PIL import ImageDraw
-
-        # draw lines
+        # draw the (white) lines by setting whole pixel rows and columns of
+        #   the image's array at once
         w, h = image.size
-        draw = ImageDraw.Draw(image)
-        for line_height in np.linspace(0, h, numy)[1:-1]:
-            draw.line((0, line_height, w, line_height), width=1)
-        for line_width in np.linspace(0, w, numx)[1:-1]:
-            draw.line((line_width, 0, line_width, h), width=1)
+        arr = np.array(image)
+        arr[np.linspace(0, h, numy)[1:-1].astype(int), ...] = 255
+        arr[:, np.linspace(0, w, numx)[1:-1].astype(int), ...] = 255
         
-        return image
+        return Image.fromarray(arr)
     
     # ============================================================ Control Flow
     if type_ == 'image':
@@ -1,5 +1,8 @@
 # =======================================
 # Imports
+import functools
+from pathlib import Path
+from string import Template
 
 # =======================================
 # Constants
@@ -9,6 +12,28 @@
 
 # =======================================
 # Functions
+@functools.lru_cache(maxsize=32)
+def _load_template(path, mtime):
+    """ read and build a Template once per (path, modification time) so
+    reports filled from the same template in one process share it
+    
+    :Parameters:
+      -. `path`: str, the absolute path to the template
+      -. `mtime`: float, the template's modification time, only part of the
+        cache key so an edited template gets reread
+    """
+    return Template(Path(path).read_text())
+
+@functools.lru_cache(maxsize=8)
+def _reconall_subdir(cwd):
+    """ the name of the directory above cwd, resolved once per working
+    directory
+    
+    :Parameters:
+      -. `cwd`: str, the current working directory
+    """
+    return Path(cwd).resolve().parent.name
+
 def _fill_report_template(html_template, parameters, basename='report'):
     """ fill out a standard template per keyword to create an easy to read html
     
@@ -19,30 +44,38 @@ def _fill_report_template(html_template, parameters, basename='report'):
     """
 
     import os
-    from string import Template
     from pathlib import Path
+    from picnic.interfaces.string_template_nodes import (
+        _load_template,
+        _reconall_subdir
+    )
 
 
-    # loop over all the parameters and create bullet points
-    parameter_lines = ''
-    parameter_lines += '        <ul>\n'
-    for key in parameters.keys():
-        parameter_lines += '          <li>' + key + ' = ' + str(parameters[key]) + '</li>\n'
-    parameter_lines += '        </ul>\n'
+    # create a bullet point for every parameter
+    parameter_lines = (
+        '        <ul>\n'
+        + ''.join(
+            f'          <li>{key} = {value}</li>\n'
+            for key, value in parameters.items()
+        )
+        + '        </ul>\n'
+    )
 
-    # read in the template
-    with open(html_template) as f:
-        template_html = Template(f.read())
+    # read in the template, or reuse it if it was already read
+    html_template = os.path.abspath(html_template)
+    template_html = _load_template(
+        html_template,
+        os.path.getmtime(html_template)
+    )
         
     # substitute out the parameters with and fill out the template
     final_html = template_html.substitute({
         'parameters' : parameter_lines,
-        "reconall_subdir": Path(".").resolve().parent.name,
+        "reconall_subdir": _reconall_subdir(os.getcwd()),
     })
     
     # save the created html file
-    filename = basename + '.html'
-    with open(filename, 'w') as f:
-        _ = f.write(final_html)
+    filename = Path(basename + '.html')
+    filename.write_text(final_html)
     
-    return os.path.abspath(filename)
+    return str(filename.absolute())
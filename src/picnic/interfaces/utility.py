@@ -1 +1,40 @@
 nibabel_image_types = ('.nii', '.nii.gz', '.mgz', '.img', '.hdr')
+
+def _strip_img_ext(filename, exts=nibabel_image_types):
+    """
+    split a nibabel image filename into its basename and extension. Only a
+    trailing extension is removed, a filename without one of the extensions
+    is returned whole with an empty extension
+    
+    :Parameters:
+      -. `filename` : str, the image's filename (not the full path)
+      -. `exts` : tuple of str, the recognised image extensions
+    """
+    if filename.endswith(exts):
+        for ext in exts:
+            if filename.endswith(ext):
+                return filename[:-len(ext)], ext
+    return filename, ''
+
+def _load_json(filepath):
+    """
+    read a json file, parsing it with orjson when it is installed and falling
+    back to the standard library otherwise (or for files orjson rejects, such
+    as ones containing NaN)
+    
+    :Parameters:
+      -. `filepath` : file-like str, the json file
+    """
+    import json
+    try:
+        import orjson
+    except ImportError:
+        with open(filepath) as f:
+            return json.load(f)
+    
+    with open(filepath, 'rb') as f:
+        data = f.read()
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        return json.loads(data)
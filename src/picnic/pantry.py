@@ -5,8 +5,10 @@
 import os
 import FreeSimpleGUI as sg
 import base64
-import tempfile
-import importlib
+import collections
+import functools
+import re
+import types
 from io import BytesIO
 
 from PIL import (
@@ -15,7 +17,10 @@ from PIL import (
     ImageFont
 )
 
-from picnic.cards import get_path_to_jsons
+from picnic.cards import (
+    get_path_to_jsons,
+    load_card_class
+)
 from picnic.input_deck_reader import (
     read_input_deck,
     make_card
@@ -30,22 +35,27 @@ COLORTHEMES = [
     'DarkPurple1'
 ]
 LEFTROUND = [
-    b'iVBORw0KGgoAAAANSUhEUgAAABsAAABzCAYAAABpc3liAAABhGlDQ1BJQ0MgcHJvZmlsZQAAKJF9kT1Iw0AYht+mSkUrDlYQcchQneyiIo6lFYtgobQVWnUwufQPmjQkKS6OgmvBwZ/FqoOLs64OroIg+APi7OCk6CIlfpcUWsR4x3EP733vy913gNCsMtXsiQKqZhnpREzM5VfFwCsEmiMIYEBipp7MLGbhOb7u4eP7XYRnedf9OQaVgskAn0gcZbphEW8Qz21aOud94hArSwrxOfGUQRckfuS67PIb55LDAs8MGdl0nDhELJa6WO5iVjZU4lnisKJqlC/kXFY4b3FWq3XWvid/YbCgrWS4TmscCSwhiRREyKijgiosRGjXSDGRpvOYh3/M8afIJZOrAkaOBdSgQnL84H/wu7dmcWbaTQrGgN4X2/6YAAK7QKth29/Htt06AfzPwJXW8deawPwn6Y2OFj4ChraBi+uOJu8BlzvA6JMuGZIj+WkJxSLwfkbflAeGb4H+Nbdv7XOcPgBZ6tXyDXBwCEyWKHvd49193X37t6bdvx8pOXKJ1ElYXQAAAAZiS0dEALUAugDZFqItrQAAAAlwSFlzAAALEwAACxMBAJqcGAAAAAd0SU1FB+gCDRQSNhIIVhQAAAQySURBVGje7drda1tlHMDxb3LOSXoSk/S0Z0lIbDYdUhxiJlM269yojF1sf4HbnTf+AbuRXbibyVa2ggoKeqPsReyFoNQVL0Q318JQKQ5quyxrGhvSJG26kvemTRov2lO62nVpk5MbzwOBJOTw4Xnye3kO5zHRhHH56o1jsmw7K8v2w7Js72qTZYfFYhUFQTSZTKb135l2C1y6cv2Qw+m6oLSrx9uVTmc91+wY6+u/eVpR1Iserz8oitIT15fLZTLZHJlcnlyuQKFYolReolKpUqvV6sc+6vtaVZQ9Az5foFeyWNavW1paZjadJplKk0ovND6z/k8GzrndvvMdne4O7btSaZF4Iklkeobl5QpNWcZPP//+ms+/94ws2wSAlZUVYvEE4alpyuXlHf0F22KffTF4qyuw/5QgCABkslki0RgzqfldBZVpOygQ2H/KvAYlU3OEHkXJF0u7ThHxaUvXtQGKxROMhyJUqtWG8lHcKhh8/r1nhA3Q36FJqtWVhpPfvDm83W7feS0Ykqk5xkORpkD/wRRlz4AW3plsltCjaMNLtyXW13/ztM8X6NXCOxKNNRQM22KKol7UKkMsnth1eD8Tu3Tl+iGP1x/UKkN4aho9hhnA4XRd0IpqPJHccWXYEaa0q8e1ohqZnkGvYb589cYxrR/NptN1F9VdYbJsO6t9SKbS6DnMsmw/rDW+Z/WjZmBdq0mcQ+9hbpNlB0Aml9cfs1isIkAuV9AfEwTRBFBocmnaEtP2daXykv6Y9qZSqbYOq9VqrcNaMQzMwAzMwAzMwAzMwAzMwAzMwAzMwAzMwAzMwAzMwAzMwAzMwP5vWCse+Kxj1Wqlddji4uoTwY2HsXTDCvksAKIo6I8tLKRrALLVoj+WSMTKAHabrD82PjY6C+Bw2PXHhn78JpyeS+JyPNeSpB6fnJzA5XS0BPvz9i+3EAQzHlXRHbv72+1Bwg/H8HpU3bEpYOTOr0O0uxxIkqgbpmWy8jB0/2Tw4BG8Xj/zCxldq/63QO7aVx9jEWtYrZKuM8sBnsfzqSNut4/u7leYX8jqhgH8A7z71+iI/GrwDTpUL/lCSTcsDViB3pG7P/HmWycQJLmpp5U29xUb8ANwAuCDD7+kuCQ27XDe5r6yDMSBdwDX8J1Beo6eBJPUlCMcWzWxKSC/Njvp3vAQwdd6kKx2GvWe1jFH12b5NiCO/v4zqruLTtXbELhdex5ZA48CUvjBH2CW6FS9iKK16ZgGzgIHAVd8eoJoZAKnS8Xp7MBkNjcV05b0PuAHXlwsZghP3KNYLGK1ytjsTsx1ovXucqaA74AyEATkuVSUB2MjPE6nEAQRSbJgsco7yrN6xsvA+8B7wBMd96UDPTwf6Ka9w4Pd7sLaZkOULKweE25sq+gHzgHDQK2eV7N2pi+spcnrwAFgH+AG7BvvJ/4FS+B3OXrTof8AAAAASUVORK5CYII=',
-    b'iVBORw0KGgoAAAANSUhEUgAAABsAAABzCAYAAABpc3liAAABhGlDQ1BJQ0MgcHJvZmlsZQAAKJF9kT1Iw0AYht+mSkUrDlYQcchQneyiIo6lFYtgobQVWnUwufQPmjQkKS6OgmvBwZ/FqoOLs64OroIg+APi7OCk6CIlfpcUWsR4x3EP733vy913gNCsMtXsiQKqZhnpREzM5VfFwCsEmiMIYEBipp7MLGbhOb7u4eP7XYRnedf9OQaVgskAn0gcZbphEW8Qz21aOud94hArSwrxOfGUQRckfuS67PIb55LDAs8MGdl0nDhELJa6WO5iVjZU4lnisKJqlC/kXFY4b3FWq3XWvid/YbCgrWS4TmscCSwhiRREyKijgiosRGjXSDGRpvOYh3/M8afIJZOrAkaOBdSgQnL84H/wu7dmcWbaTQrGgN4X2/6YAAK7QKth29/Htt06AfzPwJXW8deawPwn6Y2OFj4ChraBi+uOJu8BlzvA6JMuGZIj+WkJxSLwfkbflAeGb4H+Nbdv7XOcPgBZ6tXyDXBwCEyWKHvd49193X37t6bdvx8pOXKJ1ElYXQAAAAZiS0dEALUAugDZFqItrQAAAAlwSFlzAAALEwAACxMBAJqcGAAAAAd0SU1FB+gCDRQyGFtaf3kAAAQ8SURBVGje7drJbxt1FMDx78zYHtuNHS+Js5QgmkNTQCR0QYGKtgpCHNpTj7QXlEocgFRCFRLi0kvUVuKE+A/gQg8cAEEFBxAhiRq1tClN0qRJ7ATHzubMJN6XeIZDMlWLSprF4wvzJB/G8k8fv5/fe7+xbIEKRHfP1ZOy7DwvO12dDtnV4pCdHrvdYZNESUAQHr1O2D1w5ajb7blc4/WdqvH4vNtZs2PswsVrZzxeX68/2NAhSbYn1ufzBVRlFUVJoigpVtQ0y2oeNVOiqOnbx977sLfO4/VfD9Y3ddls9kfrCoUi8/ElwpF5BkcX957Z+x9/fskXCH3mrQ0EjOeymRwzMzEGboVZTBWpyDZ+8MkXX9WFms85ZKcEoGkakXCU/puTRNX8jj6CLbGPPv3yx1Bjy2lRlABQ1TVGRqb5fTi+q6IStoaePy2KIgCxuQUGh8aZiKd33SK2/9q6jYw2oEg4yo3fRlGy63vqR9vTiqEu1HzO2LpIOMpPv46g5sp7bn7h3+UdamyZMKouNrfAdz8P7zkjI8THLzxe/3UDUtU1BofGKwY9gV24eO1MsL6pyyjvkZHpPRXDlpjH6+s1JkMkHN11eT8T6+65ctQfbOgwJkP/zUnMCBHA7fZcNobqzExsx5NhR1iN13fKGKoDt8KYFWJ3z9WTxnk0H1/a9lDdFSbLzvPGRTgyj5khyk5Xp3HwPes82jPmkF0tAKqyitkhOmSnB0BRkuZjdrvDtoGlzMckURIAVtS0+ZhxX7dsUiM/dTaqmVL1sKKmVw+rRliYhVmYhVmYhVmYhVmYhVmYhVmYhVmYhVmYhVmYhVmYhVmYhf3vMF2vHlbWytXDioWNH+kcomA+ls9lAPDvs5uPpZKqDlDvd5qPKYmFAkDQX2M+NjM9tgQQCHjMx24P3phcUxMEAt6qNPVYfG4af8BnOiYB9ZrO2fYjx9GyKaLLGVMz+2P0bh9zs5O0HmgyfRsjwMC9P/uoD/lo8DhM3UYAf+zvh++0HmznueZGHkQSpk79b4DUL99/TW2tgxaTGtzILAU0pFPK6/5AiINtbTyIrJiGAcwC74YfDrvaXmynMRBgdjFtGpYAZKBr7K9BXjn8BqIusZIumoIB3AY6gdbx+/0cfu0EyWSZ3LpmClYCYsBbQO3U2ABHjh0nndEprOsVx9jsuzTwNmCfnRzi0KF2iiUbhbJecQzgzmaWJwDb/OxdnO466nxB0kW94hjAwCb4JmDPrU6RzEJDMEh2Xao4ZoBLwKtArV6Ik0zMgN2L7PSg7fDf3Nt5i3eAe8B+oBU9j5aeopTLIUgORLsbBLFimFE03wIFoANwUUqgpSYopxUQJRDtCJKjIpjRFn3AD8A68DIgU15Fy0xTXr1PObuGrhVBWwc2elMQhG1nvlXsBy4B/YC+nUel7kwPbLbJMeAl4AUgBOx7/PvEP54wj/KK74wGAAAAAElFTkSuQmCC',
-    b'iVBORw0KGgoAAAANSUhEUgAAABsAAABzCAYAAABpc3liAAABhGlDQ1BJQ0MgcHJvZmlsZQAAKJF9kT1Iw0AYht+mSkUrDlYQcchQneyiIo6lFYtgobQVWnUwufQPmjQkKS6OgmvBwZ/FqoOLs64OroIg+APi7OCk6CIlfpcUWsR4x3EP733vy913gNCsMtXsiQKqZhnpREzM5VfFwCsEmiMIYEBipp7MLGbhOb7u4eP7XYRnedf9OQaVgskAn0gcZbphEW8Qz21aOud94hArSwrxOfGUQRckfuS67PIb55LDAs8MGdl0nDhELJa6WO5iVjZU4lnisKJqlC/kXFY4b3FWq3XWvid/YbCgrWS4TmscCSwhiRREyKijgiosRGjXSDGRpvOYh3/M8afIJZOrAkaOBdSgQnL84H/wu7dmcWbaTQrGgN4X2/6YAAK7QKth29/Htt06AfzPwJXW8deawPwn6Y2OFj4ChraBi+uOJu8BlzvA6JMuGZIj+WkJxSLwfkbflAeGb4H+Nbdv7XOcPgBZ6tXyDXBwCEyWKHvd49193X37t6bdvx8pOXKJ1ElYXQAAAAZiS0dEALUAugDZFqItrQAAAAlwSFlzAAALEwAACxMBAJqcGAAAAAd0SU1FB+gCDRQoJioWmAkAAAQhSURBVGje7dpNSBxnGMDx/+zMuLO7s2533ez6EeMq0moulhowBRsrLT1EeughFJJboLT3QEiEEmiFXnsJ9NRDEVoNJRTSQw+2ihEtbYzFUIsW1xo1fsSso7u66371oCPmy7g6s6f3gYXZj3d/O+8+z/O+h1fCghi4PnBO1/RLXs3bomt6tcfp8WqqpqiyKkmStPc56ahA/7X+5oAeuBEuDbeFfKHSw4wpGBvsHOwI+UJdkWCkqUQpeWp8JpkmFUuQim2RjiXJGNtk4xlyySzkC8D6rvYFy33lPXXhunZN1fbGZVMZEo8MNmcNktH48e9s+PPhKzXBms6K1yoC5mvpzRTxmRgbD1bJbWWxZBrvf3H/u/pw/UVd02WAfC7HenQVY2yFXDxT0F9wIDbeNf5zQ2XDeUVWAEjGEhgTK2xNrR8pqaSDoMaqxvOyQwYgPh9jbXSJzJPtI5eI8rKpa6hs2IPWo4+JjSyS384dqx4dL0qG+nD9RXPqrIKew/qu9gVrgjWdZjLE52OWQc9h5b7yHjO9k7EEa6NLlkFPYYOdgx114bp2M72NiZVjJcOBWMgX6jI7w3p09cjp/Uqs/1p/cyQYaTI7gzG2gh3hAAjogRtmU43PxAruDAVh4dJwm9lUNx6sYlc4Bq4PnDPXo8Qj49BN9UiYrumXzCebswZ2hsOreVvMhe9V65EVd1YNkIolsDscHqfHu4Nt2Y9pqqYApGNJ+zFVViWAjLFtP2bu67I2FfILe2MumS0eRp4iYghMYAITmMAEJjCBCUxgAhOYwAQmMIEJTGACE5jABCYwgQnMaiyfzxcPS2fTxcM2tzd3rqQiYGuJtZ0LTbYfWzKW8gCyrtiPTS9PpwAUX4n92NDk0DKA6tfsx27+dnNq7skcTr+rKEX999h/Yzj9nqJgf/YM95BT8mi1uu3YYPfv3dyL3sN9ymc7FgWGekd6UYJOHC776s38Zv/I9MgH755up7Y8QmohYSs2C3wyNT/l7Dj7IfLjvKWHu57FNoDwnDF39uSJappfbyY9b/35kP3ttxG4CwRufXaL1txbJP+NW54gZkwAXwNc+OYCk9IMsl+17c4A3MBPwPsAw5cHqFgI2HMKENgEvgIeArz9bRtz/mUkVbIFA/gV+BLYAmj9/j3+KZl+yRnPo2XjszEKpIF3AKV78gcavW8Q8dfgyEiWYwBDu2AroN5Z/AU97abafxIPbssxE1wG3gR8d9dG+GNhlCpXJRXuMLIkW4qZU/oXUAXULWWXub18h8RWAq/qJegsOzR62J8WBX4EUkAT4BpLjNO7eJtZ4yGqQ8WluPAqekF1dphoBD4FLgPe/W98HPyIlrIzRNynOOEso1QtxSVrKA4F6Zh7xSrgym6Lyx/mYdXWtHa3TM4Ap4EIEAI8+2v5f+/td4LIBswsAAAAAElFTkSuQmCC',
-    b'iVBORw0KGgoAAAANSUhEUgAAABsAAABzCAYAAABpc3liAAABhGlDQ1BJQ0MgcHJvZmlsZQAAKJF9kT1Iw0AYht+mSkUrDlYQcchQneyiIo6lFYtgobQVWnUwufQPmjQkKS6OgmvBwZ/FqoOLs64OroIg+APi7OCk6CIlfpcUWsR4x3EP733vy913gNCsMtXsiQKqZhnpREzM5VfFwCsEmiMIYEBipp7MLGbhOb7u4eP7XYRnedf9OQaVgskAn0gcZbphEW8Qz21aOud94hArSwrxOfGUQRckfuS67PIb55LDAs8MGdl0nDhELJa6WO5iVjZU4lnisKJqlC/kXFY4b3FWq3XWvid/YbCgrWS4TmscCSwhiRREyKijgiosRGjXSDGRpvOYh3/M8afIJZOrAkaOBdSgQnL84H/wu7dmcWbaTQrGgN4X2/6YAAK7QKth29/Htt06AfzPwJXW8deawPwn6Y2OFj4ChraBi+uOJu8BlzvA6JMuGZIj+WkJxSLwfkbflAeGb4H+Nbdv7XOcPgBZ6tXyDXBwCEyWKHvd49193X37t6bdvx8pOXKJ1ElYXQAAAAZiS0dEALUAugDZFqItrQAAAAlwSFlzAAALEwAACxMBAJqcGAAAAAd0SU1FB+gCDRQcAEMx7gMAAAPvSURBVGje7dpPaCNVHMDxb2aSJjPNP9o0TceEmlwGTZol3UAP4i4rntyTN9m9CeJVWBAUZAUXPAleRfDgyT158lAqlsR486yItKWkTidtEmgaMjNJ2nroTujS2qRJphfnnZJJhg/vze/93g/m52EKo1wu3+t2u48ty1ozTTNlmmbIsixvv9/3nJ2dDf7nmQC4axjG01ardb/ZbIZHuefGWKlUethut5/VarU7vV7vpfvn5uZIJpPEYjEikQiyLOP3+xFFEY/HMzpWqVRi7Xb7ua7rDyzLGtwXiURQVZVUKsX8/PzkM9vc3HzSbDY/rdfrc/a1eDxONpslnU7j9XqZyjJubGx8r+v6o06nIwLMzMxQLBZRVRWfz3ejR3Attr6+/lO1Wn3n5OQEgEwmQz6fJx6PjxVUnlGhQqFALpdDkqSxt4j3v5Zud3d3AK2trZHL5RBFcaL9KFwVDLquP7oIraysTAxdWsZKpRKr1Wp/2VFXKBRYXV2dCnRpZu12+7kNZTKZqSzdlVipVHqo6/oDO7zz+fxEwXAt1m63n9mZoVgsjh3eQ7FyuXy3VqvdsTODqqo4MQQAwzCe2kk1m83eODPcCGu1WvftpJpOp3FqCOVy+Z59HqmqOnJSHQvrdruP7S+pVAonh2BZ1pp98A07jybGTNNMASSTSZwegmmaIYBYLOY8ZlmW145Ex7F+v+8BkGXZecyu6/x+v/OY/WGa2X0o5vF4bg+7jeFiLuZiLuZiLuZiLuZiLuZiLuZiLuZiLuZiLuZiLuZiLuZiLvZ/w27jhc8Ac/JV8SUsEAgAcLEZyzEsGAwCYDebOIqFQqEzAMuynMfC4bAF0Ol0nMei0egBwNHRkfOYJEl/x+Nx6vX6rWzqP5aWltjb27sV7PfFxUWOj49pNBqOY7/6/X4ymQzVatVZTFGUHeC3ZDLJ9vY2/X7f8UT8oyzLJBIJdnZ2HMd+AI6Xl5fZ39+n1+s5hymK8g/wnSAILCwssLW15fh59g3QjEajGIbB4eGhc5iiKH8CXwMkEgmazSaGYTh6Un8F/AwQDoc5ODiY6mnwEqYoSgf4EqjCeYNerVbj9PTUmRpEUZRfgC8AA877RBqNxlTAKwseRVG+BT4HTIB+v0+r1aLb7U6EXVvtaJr28QtUgvM+H0mSxu57HFpaaZr2AfAZkLKXNRgMIssygiBMF3sBvgV8ArxtX/N6vczOziJJ0sj9PyMXjZqmycAT4CNg0JYtiiKSJBEIBIb2Rd64QtU07TXgQ+B9IHTxN1EU8fv9+Hw+vF4voigiCMJg5mOXw5qmvQK8B7wLvDHVZRwCp4E3gSLwOvAqEAdmL26vfwG6x1BC0hrTGQAAAABJRU5ErkJggg=='
+    b'iVBORw0KGgoAAAANSUhEUgAAABsAAABzCAYAAABpc3liAAAABmJLR0QAtQC6ANkWoi2tAAAACXBIWXMAAAsTAAALEwEAmpwYAAAEMklEQVRo3u3a3WtbZRzA8W9yzkl6EpP0tGdJSGw2HVIcYiZTNuvcqIxdbH+B2503/gG7kV24m8lWtoIKCnqj7EXshaDUFS9EN9fCUCkOarssaxob0iRtupL3pk0aL9pTutp1aZOTG88DgSTk8OF58nt5Ducx0YRx+eqNY7JsOyvL9sOybO9qk2WHxWIVBUE0mUym9d+ZdgtcunL9kMPpuqC0q8fblU5nPdfsGOvrv3laUdSLHq8/KIrSE9eXy2Uy2RyZXJ5crkChWKJUXqJSqVKr1erHPur7WlWUPQM+X6BXsljWr1taWmY2nSaZSpNKLzQ+s/5PBs653b7zHZ3uDu27UmmReCJJZHqG5eUKTVnGTz///prPv/eMLNsEgJWVFWLxBOGpacrl5R39Bdtin30xeKsrsP+UIAgAZLJZItEYM6n5XQWVaTsoENh/yrwGJVNzhB5FyRdLu04R8WlL17UBisUTjIciVKrVhvJR3CoYfP69Z4QN0N+hSarVlYaT37w5vN1u33ktGJKpOcZDkaZA/8EUZc+AFt6ZbJbQo2jDS7cl1td/87TPF+jVwjsSjTUUDNtiiqJe1CpDLJ7YdXg/E7t05fohj9cf1CpDeGoaPYYZwOF0XdCKajyR3HFl2BGmtKvHtaIamZ5Br2G+fPXGMa0fzabTdRfVXWGybDurfUim0ug5zLJsP6w1vmf1o2ZgXatJnEPvYW6TZQdAJpfXH7NYrCJALlfQHxME0QRQaHJp2hLT9nWl8pL+mPamUqm2DqvVaq3DWjEMzMAMzMAMzMAMzMAMzMAMzMAMzMAMzMAMzMAMzMAMzMAMzMD+b1grHvisY9VqpXXY4uLqE8GNh7F0wwr5LACiKOiPLSykawCy1aI/lkjEygB2m6w/Nj42OgvgcNj1x4Z+/CacnkvicjzXkqQen5ycwOV0tAT78/YvtxAEMx5V0R27+9vtQcIPx/B6VN2xKWDkzq9DtLscSJKoG6ZlsvIwdP9k8OARvF4/8wsZXav+t0Du2lcfYxFrWK2SrjPLAZ7H86kjbreP7u5XmF/I6oYB/AO8+9foiPxq8A06VC/5Qkk3LA1Ygd6Ruz/x5lsnECS5qaeVNvcVG/ADcALggw+/pLgkNu1w3ua+sgzEgXcA1/CdQXqOngST1JQjHFs1sSkgvzY76d7wEMHXepCsdhr1ntYxR9dm+TYgjv7+M6q7i07V2xC4XXseWQOPAlL4wR9gluhUvYiitemYBs4CBwFXfHqCaGQCp0vF6ezAZDY3FdOW9D7gB15cLGYIT9yjWCxitcrY7E7MdaL17nKmgO+AMhAE5LlUlAdjIzxOpxAEEUmyYLHKO8qzesbLwPvAe8ATHfelAz08H+imvcOD3e7C2mZDlCysHhNubKvoB84Bw0CtnlezdqYvrKXJ68ABYB/gBuwb7yf+BUvgdzl606H/AAAAAElFTkSuQmCC',
+    b'iVBORw0KGgoAAAANSUhEUgAAABsAAABzCAYAAABpc3liAAAABmJLR0QAtQC6ANkWoi2tAAAACXBIWXMAAAsTAAALEwEAmpwYAAAEPElEQVRo3u3ayW8bdRTA8e/M2B7bjR0vibOUIJpDU0AkdEGBirYKQhzaU4+0F5RKHIBUQhUS4tJL1FbihPgP4EIPHABBBQcQIYkatbQpTdKkSewEx87mzCTel3iGQzJVi0qaxeML8yQfxvJPH7+f33u/sWyBCkR3z9WTsuw8LztdnQ7Z1eKQnR673WGTRElAEB69Ttg9cOWo2+25XOP1narx+LzbWbNj7MLFa2c8Xl+vP9jQIUm2J9bn8wVUZRVFSaIoKVbUNMtqHjVToqjp28fe+7C3zuP1Xw/WN3XZbPZH6wqFIvPxJcKReQZHF/ee2fsff37JFwh95q0NBIznspkcMzMxBm6FWUwVqcg2fvDJF1/VhZrPOWSnBKBpGpFwlP6bk0TV/I4+gi2xjz798sdQY8tpUZQAUNU1Rkam+X04vquiEraGnj8tiiIAsbkFBofGmYind90itv/auo2MNqBIOMqN30ZRsut76kfb04qhLtR8zti6SDjKT7+OoObKe25+4d/lHWpsmTCqLja3wHc/D+85IyPExy88Xv91A1LVNQaHxisGPYFduHjtTLC+qcso75GR6T0Vw5aYx+vrNSZDJBzddXk/E+vuuXLUH2zoMCZD/81JzAgRwO32XDaG6sxMbMeTYUdYjdd3yhiqA7fCmBVid8/Vk8Z5NB9f2vZQ3RUmy87zxkU4Mo+ZIcpOV6dx8D3rPNoz5pBdLQCqsorZITpkpwdAUZLmY3a7w7aBpczHJFESAFbUtPmYcV+3bFIjP3U2qplS9bCiplcPq0ZYmIVZmIVZmIVZmIVZmIVZmIVZmIVZmIVZmIVZmIVZmIVZmIX97zBdrx5W1srVw4qFjR/pHKJgPpbPZQDw77Obj6WSqg5Q73eajymJhQJA0F9jPjYzPbYEEAh4zMduD96YXFMTBALeqjT1WHxuGn/AZzomAfWaztn2I8fRsimiyxlTM/tj9G4fc7OTtB5oMn0bI8DAvT/7qA/5aPA4TN1GAH/s74fvtB5s57nmRh5EEqZO/W+A1C/ff01trYMWkxrcyCwFNKRTyuv+QIiDbW08iKyYhgHMAu+GHw672l5spzEQYHYxbRqWAGSga+yvQV45/AaiLrGSLpqCAdwGOoHW8fv9HH7tBMlkmdy6ZgpWAmLAW0Dt1NgAR44dJ53RKazrFcfY7Ls08DZgn50c4tChdoolG4WyXnEM4M5mlicA2/zsXZzuOup8QdJFveIYwMAm+CZgz61OkcxCQzBIdl2qOGaAS8CrQK1eiJNMzIDdi+z0oO3w39zbeYt3gHvAfqAVPY+WnqKUyyFIDkS7GwSxYphRNN8CBaADcFFKoKUmKKcVECUQ7QiSoyKY0RZ9wA/AOvAyIFNeRctMU169Tzm7hq4VQVsHNnpTEIRtZ75V7AcuAf2Avp1Hpe5MD2y2yTHgJeAFIATse/z7xD+eMI/yiu+MBgAAAABJRU5ErkJggg==',
+    b'iVBORw0KGgoAAAANSUhEUgAAABsAAABzCAYAAABpc3liAAAABmJLR0QAtQC6ANkWoi2tAAAACXBIWXMAAAsTAAALEwEAmpwYAAAEIUlEQVRo3u3aTUgcZxjA8f/szLizu7Nud93s+hHjKtJqLpYaMAUbKy09RHroIRSSW6C090BIhBJohV57CfTUQxFaDSUU0kMPtooRLW2MxVCLFtcaNX7ErKO7uut+9aAj5su4OrOn94GF2Y93fzvvPs/zvodXwoIYuD5wTtf0S17N26JrerXH6fFqqqaosipJkrT3OemoQP+1/uaAHrgRLg23hXyh0sOMKRgb7BzsCPlCXZFgpKlEKXlqfCaZJhVLkIptkY4lyRjbZOMZcsks5AvA+q72Bct95T114bp2TdX2xmVTGRKPDDZnDZLR+PHvbPjz4Ss1wZrOitcqAuZr6c0U8ZkYGw9WyW1lsWQa739x/7v6cP1FXdNlgHwux3p0FWNshVw8U9BfcCA23jX+c0Nlw3lFVgBIxhIYEytsTa0fKamkg6DGqsbzskMGID4fY210icyT7SOXiPKyqWuobNiD1qOPiY0skt/OHaseHS9Khvpw/UVz6qyCnsP6rvYFa4I1nWYyxOdjlkHPYeW+8h4zvZOxBGujS5ZBT2GDnYMddeG6djO9jYmVYyXDgVjIF+oyO8N6dPXI6f1KrP9af3MkGGkyO4MxtoId4QAI6IEbZlONz8QK7gwFYeHScJvZVDcerGJXOAauD5wz16PEI+PQTfVImK7pl8wnm7MGdobDq3lbzIXvVeuRFXdWDZCKJbA7HB6nx7uDbdmPaaqmAKRjSfsxVVYlgIyxbT9m7uuyNhXyC3tjLpktHkaeImIITGACE5jABCYwgQlMYAITmMAEJjCBCUxgAhOYwAQmMIEJzGosn88XD0tn08XDNrc3d66kImBribWdC022H1sylvIAsq7Yj00vT6cAFF+J/djQ5NAygOrX7Mdu/nZzau7JHE6/qyhF/ffYf2M4/Z6iYH/2DPeQU/Jotbrt2GD3793ci97DfcpnOxYFhnpHelGCThwu++rN/Gb/yPTIB++ebqe2PEJqIWErNgt8MjU/5ew4+yHy47ylh7uexTaA8Jwxd/bkiWqaX28mPW/9+ZD97bcRuAsEbn12i9bcWyT/jVueIGZMAF8DXPjmApPSDLJfte3OANzAT8D7AMOXB6hYCNhzChDYBL4CHgK8/W0bc/5lJFWyBQP4FfgS2AJo/f49/imZfskZz6Nl47MxCqSBdwCle/IHGr1vEPHX4MhIlmMAQ7tgK6DeWfwFPe2m2n8SD27LMRNcBt4EfHfXRvhjYZQqVyUV7jCyJFuKmVP6F1AF1C1ll7m9fIfEVgKv6iXoLDs0etifFgV+BFJAE+AaS4zTu3ibWeMhqkPFpbjwKnpBdXaYaAQ+BS4D3v1vfBz8iJayM0TcpzjhLKNULcUlaygOBemYe8Uq4Mpui8sf5mHV1rR2t0zOAKeBCBACPPtr+X/v7XeCyAbMLAAAAABJRU5ErkJggg==',
+    b'iVBORw0KGgoAAAANSUhEUgAAABsAAABzCAYAAABpc3liAAAABmJLR0QAtQC6ANkWoi2tAAAACXBIWXMAAAsTAAALEwEAmpwYAAAD70lEQVRo3u3aT2gjVRzA8W9mkiYzzT/aNE3HhJpcBk2aJd1AD+IuK57ckzfZvQniVVgQFGQFFzwJXkXw4Mk9efJQKpbEePOsiLSlpE4nbRJoGjIzSdp66E7o0tqkSaYX552SSYYP783v/d4P5udhCqNcLt/rdruPLctaM00zZZpmyLIsb7/f95ydnQ3+55kAuGsYxtNWq3W/2WyGR7nnxlipVHrYbref1Wq1O71e76X75+bmSCaTxGIxIpEIsizj9/sRRRGPxzM6VqlUYu12+7mu6w8syxrcF4lEUFWVVCrF/Pz85DPb3Nx80mw2P63X63P2tXg8TjabJZ1O4/V6mcoybmxsfK/r+qNOpyMCzMzMUCwWUVUVn893o0dwLba+vv5TtVp95+TkBIBMJkM+nycej48VVJ5RoUKhQC6XQ5KksbeI97+Wbnd3dwCtra2Ry+UQRXGi/ShcFQy6rj+6CK2srEwMXVrGSqUSq9Vqf9lRVygUWF1dnQp0aWbtdvu5DWUymaks3ZVYqVR6qOv6Azu88/n8RMFwLdZut5/ZmaFYLI4d3kOxcrl8t1ar3bEzg6qqODEEAMMwntpJNZvN3jgz3AhrtVr37aSaTqdxagjlcvmefR6pqjpyUh0L63a7j+0vqVQKJ4dgWdaaffANO48mxkzTTAEkk0mcHoJpmiGAWCzmPGZZlteORMexfr/vAZBl2XnMruv8fr/zmP1hmtl9KObxeG4Pu43hYi7mYi7mYi7mYi7mYi7mYi7mYi7mYi7mYi7mYi7mYi7mYi72f8Nu44XPAHPyVfElLBAIAHCxGcsxLBgMAmA3mziKhUKhMwDLspzHwuGwBdDpdJzHotHoAcDR0ZHzmCRJf8fjcer1+q1s6j+WlpbY29u7Fez3xcVFjo+PaTQajmO/+v1+MpkM1WrVWUxRlB3gt2Qyyfb2Nv1+3/FE/KMsyyQSCXZ2dhzHfgCOl5eX2d/fp9frOYcpivIP8J0gCCwsLLC1teX4efYN0IxGoxiGweHhoXOYoih/Al8DJBIJms0mhmE4elJ/BfwMEA6HOTg4mOpp8BKmKEoH+BKownmDXq1W4/T01JkaRFGUX4AvAAPO+0QajcZUwCsLHkVRvgU+B0yAfr9Pq9Wi2+1OhF1b7Wia9vELVILzPh9JksbuexxaWmma9gHwGZCylzUYDCLLMoIgTBd7Ab4FfAK8bV/zer3Mzs4iSdLI/T8jF42apsnAE+AjYNCWLYoikiQRCASG9kXeuELVNO014EPgfSB08TdRFPH7/fh8PrxeL6IoIgjCYOZjl8Oapr0CvAe8C7wx1WUcAqeBN4Ei8DrwKhAHZi9ur38BusdQQtIa0xkAAAAASUVORK5CYII='
 ]
 RIGHTROUND = [
-    b'iVBORw0KGgoAAAANSUhEUgAAABsAAABzCAYAAABpc3liAAABhGlDQ1BJQ0MgcHJvZmlsZQAAKJF9kT1Iw0AYht+mSkUrDlYQcchQneyiIo6lFYtgobQVWnUwufQPmjQkKS6OgmvBwZ/FqoOLs64OroIg+APi7OCk6CIlfpcUWsR4x3EP733vy913gNCsMtXsiQKqZhnpREzM5VfFwCsEmiMIYEBipp7MLGbhOb7u4eP7XYRnedf9OQaVgskAn0gcZbphEW8Qz21aOud94hArSwrxOfGUQRckfuS67PIb55LDAs8MGdl0nDhELJa6WO5iVjZU4lnisKJqlC/kXFY4b3FWq3XWvid/YbCgrWS4TmscCSwhiRREyKijgiosRGjXSDGRpvOYh3/M8afIJZOrAkaOBdSgQnL84H/wu7dmcWbaTQrGgN4X2/6YAAK7QKth29/Htt06AfzPwJXW8deawPwn6Y2OFj4ChraBi+uOJu8BlzvA6JMuGZIj+WkJxSLwfkbflAeGb4H+Nbdv7XOcPgBZ6tXyDXBwCEyWKHvd49193X37t6bdvx8pOXKJ1ElYXQAAAAZiS0dEALUAugDZFqItrQAAAAlwSFlzAAALEwAACxMBAJqcGAAAAAd0SU1FB+gCDRQUGnaKnXEAAAPJSURBVGje7dtfSFtXHMDxb3LvqmlMrSLq5nQto5M5RgvrWmgrw7G97GHQPe15UArbHjbGSlfYcOyhYzBwjD1sQjf6MPZUKZ0ORmnrnEKtlFU0NUnVNOo0UeKfemP+3Zs9xBMuos6Ye3w6BwLnd3IuH87f3IdfXNd7RnLJ5BrG6gqLiwu52dmplH/kfqzn919DgB8YAvqASUosru4/A7nNvliYn2N8/CF3bnXz150bAP1AF/AbMLMr7P1PO3Mulwtd1/CU7cO734PP56XSV0HlAR+a5iYUHKH3dg83rl8FeAJcAX4EHhaNbdehrqaK+roaDlb6CI494OrPHYSCwwBxoAP4FkjsBNNePf12+3YdjESS6Hycf+fmqa9v4Ezrm9TWPsM/9/s9QBtwcn1a/3dN3TudgkwmS2A8QjA8x9FX2rhwqUN89QbwC3DOMUyUVCpDcGKaiqpGLrX/JJobge+AC45ioszF4mRyHi5+UQA9wJfbge5Szo2RSJJI63x88QfRVA60bzWl7lIPatY0yebKOffh1/YRfg687jgGYFoWZd4a3jr7gX0NPwP2O44BWFaO5184xonWd+y79BMpWH6E8PKxM1TVNImmj4AXpWAAZeU+Tr1WGF01cF4aBtD4XDMtR9tE+B7QIA1zazrNLSdE6APelYYB1D59iMNHjovwrFRM03SaXzopwtPAYWkYQG1dkz1slYpVHKjmSMspER6XigE829Qsqi3SsYPVdaJ6SDrm9VYWllA6VlZeuIu90jH9qX2Fsy4d0zRNzq2/xdviXmIoTGEKU5jCFKYwhSlMYQpTmMIUpjCFKUxhClOYwhSmMIUpTGFFl9zeYaZp7h2WzaRF1ZKOpZKF/C9DOmYYy6Iak44txaOiGpaOTUcCouqXiq2uxAn5B0Q4JBWLRSP2sM8t73xlCYzeFWE/MCkNi82GmQwNibBL2qHOZjME/IMifEI+tVQONhMJ4n9wW4RXWM9hdRxbXlpgoPeaCOPkc1edvxvT6SShsXssLhR2YQe2JFkHE/NMwo+GGewrjOom+eRYZ299y7J4PDHKze5O0TQFXGZDFq7uxIgeT4zyR9f3omkN+Aq4tbGvXuoahR8N20eUJJ8m2rlZf72UXRcau2dfo7V16JutntF3c2BnIkEGeq/Zd93U+tR1bvesXsxdF5sNE/AP2g+s2HWXN1ujorHVlTixaITA6F37XScObFG537p43TJNk2wmTSqZwDCWWYpHmY4E7L9H9rtuV1nt4sVuJ5+/yWfPNux2U22cRgswgBgQxuF/IvwH+vtfOu7qz6YAAAAASUVORK5CYII=',
-    b'iVBORw0KGgoAAAANSUhEUgAAABsAAABzCAYAAABpc3liAAABhGlDQ1BJQ0MgcHJvZmlsZQAAKJF9kT1Iw0AYht+mSkUrDlYQcchQneyiIo6lFYtgobQVWnUwufQPmjQkKS6OgmvBwZ/FqoOLs64OroIg+APi7OCk6CIlfpcUWsR4x3EP733vy913gNCsMtXsiQKqZhnpREzM5VfFwCsEmiMIYEBipp7MLGbhOb7u4eP7XYRnedf9OQaVgskAn0gcZbphEW8Qz21aOud94hArSwrxOfGUQRckfuS67PIb55LDAs8MGdl0nDhELJa6WO5iVjZU4lnisKJqlC/kXFY4b3FWq3XWvid/YbCgrWS4TmscCSwhiRREyKijgiosRGjXSDGRpvOYh3/M8afIJZOrAkaOBdSgQnL84H/wu7dmcWbaTQrGgN4X2/6YAAK7QKth29/Htt06AfzPwJXW8deawPwn6Y2OFj4ChraBi+uOJu8BlzvA6JMuGZIj+WkJxSLwfkbflAeGb4H+Nbdv7XOcPgBZ6tXyDXBwCEyWKHvd49193X37t6bdvx8pOXKJ1ElYXQAAAAZiS0dEALUAugDZFqItrQAAAAlwSFlzAAALEwAACxMBAJqcGAAAAAd0SU1FB+gCDRQzLGP1uo0AAAOaSURBVGje7dtNaBxlHMfx78zOrkmat52QVI1KGmxDbSsUm0MtUZAeBE/ePCvSo4InD0JFQRCKxZsUiuClt4AVRC0ekqaCjW8VN2WzJS9N0maTbvb9dWaeHnafcZA0r/N46TOw8Pyf3dnP7szzf/byW+PjL8ZFvValWilRyG+IzPr92vydRHr6xvezQAKYBiaBOfZ5GJ9+eVVs9kRuY52VpTv8OT3BP39MAEwB48AVYHlPWNvhcyJmGsQPROmPt9EX78S2u7DtbuJ2L9FohKWFWf76bYJfJ78DKACXga+AmV1jW73g5WMHGT70FP0DvSwvJvnx22+4v5wCyAAXgQtAORRMHge7YpwZHaanJ0Zq5iY/Xf1aPnUN+Az4ebv3iFh9p87vBCvVXWbm1nmwmuPIyAgjR18kcesGwDDwGlAEfg8Fk0e+6jAz94AnbZsTJ09z++/rAD3AWaDRWkjhYPJYWC1iiggnR8dIJaYAosDYVqC5n75J3ityK1ni1Tfek1NtwHng3dAxgEzF4fZig5deeUdOtQMfte5juBhAruqylInRN/S6nHoW+BDoCB0DyNU8uu1hzJ5ROXUW+EAJBnCv4PL0c8fB7JVT7wNHlWAA69UY1sBpWdrAOWUYQHv3Mxgd/hd6GxhUhjWEidV7WJZdwFvKMIBIxwBGbEiWbyrFMCJE4kdkdQY4pA4DzPb+YDmmFot2YrQ9L8tTSjEAs3NQDl9Qj8X8Bh9SjhlRf3scUI9FnpDDA+ox0/KvqHIMI6Jm1992sWhMYxrTmMY0pjGNaUxjGtOYxjSmMY1pTGMa05jGNKYxjWlMY487Jtz/DxOeI4eeesytyWFJPdbww2Zp5ZhXz8rhvHqs6AcGE0oxr1FEVFOynFaLVdaC5aSpsr/cjaSspoA5ZZhbTiPq87IcV9bUwnNwsrOyLNCMlqrB3NIKouwnSC/TyrCa4fdVHif9iywzNLOr4e+NwqvjZFPg+Y18kUBI1gxRwskv4OVuyplrNMOxIe/6wsMpLOKu+RnYuzRDseVwsRbkrP4gZyrAJ2ySvrX2fY/yC8FvVKUZE7202eutfa26bCp4jyot6PNHnWPtpWHd0kpzef+76u62Lt2lrc61drXXldM42dlgw8pVt6OE9LaY1yjiVdZwN5LBvU427K6y31bwkwvPQbg1RKOMV8/iFZeDv0fBvW5PqXYAscPHdZrp2cG9Lqr/XkYPKAFpYJ6Q/4nwELMaY2S6GtFsAAAAAElFTkSuQmCC',
-    b'iVBORw0KGgoAAAANSUhEUgAAABsAAABzCAYAAABpc3liAAABhGlDQ1BJQ0MgcHJvZmlsZQAAKJF9kT1Iw0AYht+mSkUrDlYQcchQneyiIo6lFYtgobQVWnUwufQPmjQkKS6OgmvBwZ/FqoOLs64OroIg+APi7OCk6CIlfpcUWsR4x3EP733vy913gNCsMtXsiQKqZhnpREzM5VfFwCsEmiMIYEBipp7MLGbhOb7u4eP7XYRnedf9OQaVgskAn0gcZbphEW8Qz21aOud94hArSwrxOfGUQRckfuS67PIb55LDAs8MGdl0nDhELJa6WO5iVjZU4lnisKJqlC/kXFY4b3FWq3XWvid/YbCgrWS4TmscCSwhiRREyKijgiosRGjXSDGRpvOYh3/M8afIJZOrAkaOBdSgQnL84H/wu7dmcWbaTQrGgN4X2/6YAAK7QKth29/Htt06AfzPwJXW8deawPwn6Y2OFj4ChraBi+uOJu8BlzvA6JMuGZIj+WkJxSLwfkbflAeGb4H+Nbdv7XOcPgBZ6tXyDXBwCEyWKHvd49193X37t6bdvx8pOXKJ1ElYXQAAAAZiS0dEALUAugDZFqItrQAAAAlwSFlzAAALEwAACxMBAJqcGAAAAAd0SU1FB+gCDRQpMinXfTUAAAO4SURBVGje7dtdaFNnHMfxb9LTJn2xpbYqbZ3YXWxaHI5N8EKFobtQUDYvxG13KwxvNpiIgheKwwthUNaBgiIqgojtkE4UWrA6tY19oYpSyUoVU62mJjWxqU2aY5JzdpE+h7Ot1r6cpxfyPBB4/s8hfHjynOc55+IXl35KNxNvEozERwjFQubj8GPd1+8LH/vr2EPAD/QAbUCAOTaXedY0J7vwLPqMe0/u0dDRwLmucwA+oAm4ADyfFRbYeN/EBW5vDjlFGlpJHrmlXjyl+XhKCzE0kzuBOzR2NlLfWg/wGjgNnAD+njk2RfNWF1GwrASt3IMv0MHBPw7S+aQTIArUA3VAwhFMNHd+DgtWlTFSFOdibxN7G/eKS63AEeC6Y5iFFml4a4q5NdLJjuM7xPAgcBg4OeV3Z7rIxliaRHeU9cZn3Nx1TQx/APwO7HMUEy35aIzqlxV01N4UQ/nAL1OB7rnsm8yrFBXBhbR/a83QCxwCfnAcAzDfGCyNLqJl25/2GR4ANjqOAZgpk4/1ao5/+pt9DfcDBY5jAKRhU+UX7F++W4x8CeyRgwFa0s3XH25ltWeVGPoZWCkFA1hMOXs++lGUC4Fd0jCAteWf8/2S70RZC1RJw/JceWyt3CzKBcA30jCAT0pq+Kp0iyi3S8Vy3blsq7SwdUC1NAygpmSFvdwgFavwLmFn+XZRrpGKAawtW2NNVDq2vGCZ1ZWOLfKUWftdOlacWyy6hdKx/ByvdVpJxzS3JufUn/SNCtf8YdKeZwpTmMIUpjCFKUxhClOYwhSmMIUpTGEKU5jCFKYwhSlMYQp7jzETc/6wtJGeP2w8kxRdQzo2mhoV3bh0bFiPiG5YOjaQeGp1pWNdkR7R9UvFhpIhGl42ibJHKuaP9dnLNmlYykhxOdgsSh8QkIb1xvxcemVhTdI2tW7oXAm2iPI12WipHKw7cpczofOiPM1EhtVxbDDxnLr+o6KMks2uOn82jqXjNL+4yn39gRiqxxaSdQxLmxluhNs5MmAlAVvJhmOdPfUzZoa24dv81GeFNgfJhmL/lcLVnJhR2/Btah9YYbxxsmHY/6Vvtbmu0Y1wu31GSbIx0UlTt9pc7rrmF1ftazQ+Af36tu9os9mw3ZG71PUftd9108oRazM563pjfq4EW+wbVtx100pIvxMbSobwx/q4HGy2n3Viw84o+62J1620kWY8k2Q0NcqwHmEg8ZSuSI/9eWQ/62aVas9a0/u0k03PVs32pvrvz2gAcSAMDODwPxH+AVNyVs+P+/L2AAAAAElFTkSuQmCC',
-    b'iVBORw0KGgoAAAANSUhEUgAAABsAAABzCAYAAABpc3liAAABhGlDQ1BJQ0MgcHJvZmlsZQAAKJF9kT1Iw0AYht+mSkUrDlYQcchQneyiIo6lFYtgobQVWnUwufQPmjQkKS6OgmvBwZ/FqoOLs64OroIg+APi7OCk6CIlfpcUWsR4x3EP733vy913gNCsMtXsiQKqZhnpREzM5VfFwCsEmiMIYEBipp7MLGbhOb7u4eP7XYRnedf9OQaVgskAn0gcZbphEW8Qz21aOud94hArSwrxOfGUQRckfuS67PIb55LDAs8MGdl0nDhELJa6WO5iVjZU4lnisKJqlC/kXFY4b3FWq3XWvid/YbCgrWS4TmscCSwhiRREyKijgiosRGjXSDGRpvOYh3/M8afIJZOrAkaOBdSgQnL84H/wu7dmcWbaTQrGgN4X2/6YAAK7QKth29/Htt06AfzPwJXW8deawPwn6Y2OFj4ChraBi+uOJu8BlzvA6JMuGZIj+WkJxSLwfkbflAeGb4H+Nbdv7XOcPgBZ6tXyDXBwCEyWKHvd49193X37t6bdvx8pOXKJ1ElYXQAAAAZiS0dEALUAugDZFqItrQAAAAlwSFlzAAALEwAACxMBAJqcGAAAAAd0SU1FB+gCDRQdC834BsoAAAMeSURBVGje7Zu9a9tAGIcfK3LirxhTSOIcgRRv7dyx3bqXbh27dezQP6CFDoVCIKspeM6WfyB0Cdkyp0NJHHCCiRMbHMmSFX24g3Ph6rrNh3VT753uPQk/fr9OAv+caTQao1wuR6lUYnFxcVQul4NKpdLJ5/M/gQNgH9gVQjSZ0TL1en007cLy8jKrq6usrKywsLAAsAdsA1tCiNMHwUZjI45jgiDA8zz6/T4XFxecnJzgOA61Wo21tTUKhQKAAzSAuhDix71h/7qh2+3SarU4OjqiWq2yvr6OZVkAPWAT2BBCeKnApEVRRLPZpN1us7S0RKVSkZd2gC9CiO+pwaSFYcjh4SG+71OtVuV2C/gshPiWKkza+fk5vV6Pcrkst3zgkxDia+owAN/36XQ6zM/Py60h8PFvwJlgAHEcc3Z2RiaTUSN8Py2lM8MAkiSh2+0SRZFaw7eTTZMKTAIvLy/xfV/t0lfqWFikZJZlUSgU5GkD8BL4oCUytWn6/T7XH9sDnsuTxiJly+fzlEol6T4C3mmLbErDOMATIcRp6pHJ+hWLRekuAm+0pFFN59zcnHRfa0ujNMdxcF1XujVtkQHkcjnVfaEVls1m1VQ+0woD1CF/qh2WzWbl8rF2mG3bN+9Q2mFKzYraYdcvR+OlbpjyUEU77LcoDczADMzADMzADMzADMzADMzADMzADMzADMzADMzADMzADMzADMzA/nOY+pu7dliSJDdL7bA4juVyoB2m6Ho62mFhGMrlsXZYEARyeWDpjkqp2b5W2HA4VN1dS+d8KRqsPSFEUxvM9301hdvahjpJEgaDgXQdYEsbzPM8db4aUsOaOuzq6koVCfWAupazMY5jXNdVD99NVSRrpdl9ruuqQ7wDbKT+iJEgz7tRF7YYi2K9VGESpNTJZyyG/UN9a6dRIyWiIWMR7FTVrT1r1yk1ulVtaz9kYD3Pm+y6O+mI7fuedYPBQB1Y2XV3UkjfCgvDkOFwOHnWyYG9l/bbVr95kiTEcUwURYRhSBAEkwB51j1I1W632+273juzXn8yjQkwADrAMSn/E+EX5ymk8oGWp4QAAAAASUVORK5CYII='
+    b'iVBORw0KGgoAAAANSUhEUgAAABsAAABzCAYAAABpc3liAAAABmJLR0QAtQC6ANkWoi2tAAAACXBIWXMAAAsTAAALEwEAmpwYAAADyUlEQVRo3u3bX0hbVxzA8W9y76ppTK0i6uZ0LaOTOUYL61poK8Oxvexh0D3teVAK2x42xkpX2HDsoWMwcIw9bEI3+jD2VCmdDkZp65xCrZRVNDVJ1TTqNFHin3pj/t2bPcQTLqLOmHt8OgcC53dyLh/O39yHX1zXe0ZyyeQaxuoKi4sLudnZqZR/5H6s5/dfQ4AfGAL6gElKLK7uPwO5zb5YmJ9jfPwhd25189edGwD9QBfwGzCzK+z9TztzLpcLXdfwlO3Du9+Dz+el0ldB5QEfmuYmFByh93YPN65fBXgCXAF+BB4WjW3Xoa6mivq6Gg5W+giOPeDqzx2EgsMAcaAD+BZI7ATTXj39dvt2HYxEkuh8nH/n5qmvb+BM65vU1j7DP/f7PUAbcHJ9Wv93Td07nYJMJktgPEIwPMfRV9q4cKlDfPUG8AtwzjFMlFQqQ3BimoqqRi61/ySaG4HvgAuOYqLMxeJkch4uflEAPcCX24HuUs6NkUiSSOt8fPEH0VQOtG81pe5SD2rWNMnmyjn34df2EX4OvO44BmBaFmXeGt46+4F9DT8D9juOAVhWjudfOMaJ1nfsu/QTKVh+hPDysTNU1TSJpo+AF6VgAGXlPk69VhhdNXBeGgbQ+FwzLUfbRPge0CANc2s6zS0nROgD3pWGAdQ+fYjDR46L8KxUTNN0ml86KcLTwGFpGEBtXZM9bJWKVRyo5kjLKREel4oBPNvULKot0rGD1XWiekg65vVWFpZQOlZWXriLvdIx/al9hbMuHdM0Tc6tv8Xb4l5iKExhClOYwhSmMIUpTGEKU5jCFKYwhSlMYQpTmMIUpjCFKUxhRZfc3mGmae4dls2kRdWSjqWShfwvQzpmGMuiGpOOLcWjohqWjk1HAqLql4qtrsQJ+QdEOCQVi0Uj9rDPLe98ZQmM3hVhPzApDYvNhpkMDYmwS9qhzmYzBPyDInxCPrVUDjYTCeJ/cFuEV1jPYXUcW15aYKD3mgjj5HNXnb8b0+kkobF7LC4UdmEHtiRZBxPzTMKPhhnsK4zqJvnkWGdvfcuyeDwxys3uTtE0BVxmQxau7sSIHk+M8kfX96JpDfgKuLWxr17qGoUfDdtHlCSfJtq5WX+9lF0XGrtnX6O1deibrZ7Rd3NgZyJBBnqv2Xfd1PrUdW73rF7MXRebDRPwD9oPrNh1lzdbo6Kx1ZU4sWiEwOhd+10nDmxRud+6eN0yTZNsJk0qmcAwllmKR5mOBOy/R/a7bldZ7eLFbiefv8lnzzbsdlNtnEYLMIAYEMbhfyL8B/r7Xzru6s+mAAAAAElFTkSuQmCC',
+    b'iVBORw0KGgoAAAANSUhEUgAAABsAAABzCAYAAABpc3liAAAABmJLR0QAtQC6ANkWoi2tAAAACXBIWXMAAAsTAAALEwEAmpwYAAADmklEQVRo3u3bTWgcZRzH8e/Mzq5JmredkFSNShpsQ20rFJtDLVGQHgRP3jwr0qOCJw9CRUEQisWbFIrgpbeAFUQtHpKmgo1vFTdlsyUvTdJmk272/XVmnh52n3GQNK/zeOkzsPD8n93Zz+7M83/28lvj4y/GRb1WpVopUchviMz6/dr8nUR6+sb3s0ACmAYmgTn2eRiffnlVbPZEbmOdlaU7/Dk9wT9/TABMAePAFWB5T1jb4XMiZhrED0Tpj7fRF+/Etruw7W7idi/RaISlhVn++m2CXye/AygAl4GvgJldY1u94OVjBxk+9BT9A70sLyb58dtvuL+cAsgAF4ELQDkUTB4Hu2KcGR2mpydGauYmP139Wj51DfgM+Hm794hYfafO7wQr1V1m5tZ5sJrjyMgII0dfJHHrBsAw8BpQBH4PBZNHvuowM/eAJ22bEydPc/vv6wA9wFmg0VpI4WDyWFgtYooIJ0fHSCWmAKLA2FaguZ++Sd4rcitZ4tU33pNTbcB54N3QMYBMxeH2YoOXXnlHTrUDH7XuY7gYQK7qspSJ0Tf0upx6FvgQ6AgdA8jVPLrtYcyeUTl1FvhACQZwr+Dy9HPHweyVU+8DR5VgAOvVGNbAaVnawDllGEB79zMYHf4XehsYVIY1hInVe1iWXcBbyjCASMcARmxIlm8qxTAiROJHZHUGOKQOA8z2/mA5phaLdmK0PS/LU0oxALNzUA5fUI/F/AYfUo4ZUX97HFCPRZ6QwwPqMdPyr6hyDCOiZtffdrFoTGMa05jGNKYxjWlMYxrTmMY0pjGNaUxjGtOYxjSmMY1pTGOPOybc/w8TniOHnnrMrclhST3W8MNmaeWYV8/K4bx6rOgHBhNKMa9RRFRTspxWi1XWguWkqbK/3I2krKaAOWWYW04j6vOyHFfW1MJzcLKzsizQjJaqwdzSCqLsJ0gv08qwmuH3VR4n/YssMzSzq+HvjcKr42RT4PmNfJFASNYMUcLJL+DlbsqZazTDsSHv+sLDKSzirvkZ2Ls0Q7HlcLEW5Kz+IGcqwCdskr619n2P8gvBb1SlGRO9tNnrrX2tumwqeI8qLejzR51j7aVh3dJKc3n/u+ruti7dpa3OtXa115XTONnZYMPKVbejhPS2mNco4lXWcDeSwb1ONuyust9W8JMLz0G4NUSjjFfP4hWXg79Hwb1uT6l2ALHDx3Wa6dnBvS6q/15GDygBaWCekP+J8BCzGmNkuhrRbAAAAABJRU5ErkJggg==',
+    b'iVBORw0KGgoAAAANSUhEUgAAABsAAABzCAYAAABpc3liAAAABmJLR0QAtQC6ANkWoi2tAAAACXBIWXMAAAsTAAALEwEAmpwYAAADuElEQVRo3u3bXWhTZxzH8W/S0yZ9saW2Km2d2F1sWhyOTfBChaG7UFA2L8RtdysMbzaYiIIXisMLYVDWgYIiKoKI7ZBOFFqwOrWNfaGKUslKFVOtpiY1salNmmOSc3aRPoezrda+nKcX8jwQeP7PIXx48pznOefiF5d+SjcTbxKMxEcIxULm4/Bj3dfvCx/769hDwA/0AG1AgDk2l3nWNCe78Cz6jHtP7tHQ0cC5rnMAPqAJuAA8nxUW2HjfxAVubw45RRpaSR65pV48pfl4SgsxNJM7gTs0djZS31oP8Bo4DZwA/p45NkXzVhdRsKwErdyDL9DBwT8O0vmkEyAK1AN1QMIRTDR3fg4LVpUxUhTnYm8Texv3ikutwBHgumOYhRZpeGuKuTXSyY7jO8TwIHAYODnld2e6yMZYmkR3lPXGZ9zcdU0MfwD8DuxzFBMt+WiM6pcVdNTeFEP5wC9Tge657JvMqxQVwYW0f2vN0AscAn5wHAMw3xgsjS6iZduf9hkeADY6jgGYKZOP9WqOf/qbfQ33AwWOYwCkYVPlF+xfvluMfAnskYMBWtLN1x9uZbVnlRj6GVgpBQNYTDl7PvpRlAuBXdIwgLXln/P9ku9EWQtUScPyXHlsrdwsygXAN9IwgE9KaviqdIsot0vFct25bKu0sHVAtTQMoKZkhb3cIBWr8C5hZ/l2Ua6RigGsLVtjTVQ6trxgmdWVji3ylFn7XTpWnFssuoXSsfwcr3VaScc0tybn1J/0jQrX/GHSnmcKU5jCFKYwhSlMYQpTmMIUpjCFKUxhClOYwhSmMIUpTGEKe48xE3P+sLSRnj9sPJMUXUM6NpoaFd24dGxYj4huWDo2kHhqdaVjXZEe0fVLxYaSIRpeNomyRyrmj/XZyzZpWMpIcTnYLEofEJCG9cb8XHplYU3SNrVu6FwJtojyNdloqRysO3KXM6HzojzNRIbVcWww8Zy6/qOijJLNrjp/No6l4zS/uMp9/YEYqscWknUMS5sZboTbOTJgJQFbyYZjnT31M2aGtuHb/NRnhTYHyYZi/5XC1ZyYUdvwbWofWGG8cbJh2P+lb7W5rtGNcLt9RkmyMdFJU7faXO665hdX7Ws0PgH9+rbvaLPZsN2Ru9T1H7XfddPKEWszOet6Y36uBFvsG1bcddNKSL8TG0qG8Mf6uBxstp91YsPOKPutidettJFmPJNkNDXKsB5hIPGUrkiP/XlkP+tmlWrPWtP7tJNNz1bN9qb6789oAHEgDAzg8D8R/gFTclbPj/vy9gAAAABJRU5ErkJggg==',
+    b'iVBORw0KGgoAAAANSUhEUgAAABsAAABzCAYAAABpc3liAAAABmJLR0QAtQC6ANkWoi2tAAAACXBIWXMAAAsTAAALEwEAmpwYAAADHklEQVRo3u2bvWvbQBiHHyty4q8YU0jiHIEUb+3csd26l24du3Xs0D+ghQ6FQiCrKXjOln8gdAnZMqdDSRxwgokTGxzJkhV9uINz4eq6zYd1U++d7j0JP36/TgL/nGk0GqNcLkepVGJxcXFULpeDSqXSyefzP4EDYB/YFUI0mdEy9Xp9NO3C8vIyq6urrKyssLCwALAHbANbQojTB8FGYyOOY4IgwPM8+v0+FxcXnJyc4DgOtVqNtbU1CoUCgAM0gLoQ4se9Yf+6odvt0mq1ODo6olqtsr6+jmVZAD1gE9gQQnipwKRFUUSz2aTdbrO0tESlUpGXdoAvQojvqcGkhWHI4eEhvu9TrVbldgv4LIT4lipM2vn5Ob1ej3K5LLd84JMQ4mvqMADf9+l0OszPz8utIfDxb8CZYABxHHN2dkYmk1EjfD8tpTPDAJIkodvtEkWRWsO3k02TCkwCLy8v8X1f7dJX6lhYpGSWZVEoFORpA/AS+KAlMrVp+v0+1x/bA57Lk8YiZcvn85RKJek+At5pi2xKwzjAEyHEaeqRyfoVi0XpLgJvtKRRTefc3Jx0X2tLozTHcXBdV7o1bZEB5HI51X2hFZbNZtVUPtMKA9Qhf6odls1m5fKxdpht2zfvUNphSs2K2mHXL0fjpW6Y8lBFO+y3KA3MwAzMwAzMwAzMwAzMwAzMwAzMwAzMwAzMwAzMwAzMwAzMwAzMwP5zmPqbu3ZYkiQ3S+2wOI7lcqAdpuh6OtphYRjK5bF2WBAEcnlg6Y5Kqdm+VthwOFTdXUvnfCkarD0hRFMbzPd9NYXb2oY6SRIGg4F0HWBLG8zzPHW+GlLDmjrs6upKFQn1gLqWszGOY1zXVQ/fTVUka6XZfa7rqkO8A2yk/oiRIM+7URe2GItivVRhEqTUyWcshv1DfWunUSMloiFjEexU1a09a9cpNbpVbWs/ZGA9z5vsujvpiO37nnWDwUAdWNl1d1JI3woLw5DhcDh51smBvZf221a/eZIkxHFMFEWEYUgQBJMAedY9SNVut9vtu947s15/Mo0JMAA6wDEp/xPhF+cppPKBlqeEAAAAAElFTkSuQmCC'
 ]
 MIDDLE = [
-    b'iVBORw0KGgoAAAANSUhEUgAAAtUAAABzCAYAAABXaf6xAAABhGlDQ1BJQ0MgcHJvZmlsZQAAKJF9kT1Iw0AYht+mSkUrDlYQcchQneyiIo6lFYtgobQVWnUwufQPmjQkKS6OgmvBwZ/FqoOLs64OroIg+APi7OCk6CIlfpcUWsR4x3EP733vy913gNCsMtXsiQKqZhnpREzM5VfFwCsEmiMIYEBipp7MLGbhOb7u4eP7XYRnedf9OQaVgskAn0gcZbphEW8Qz21aOud94hArSwrxOfGUQRckfuS67PIb55LDAs8MGdl0nDhELJa6WO5iVjZU4lnisKJqlC/kXFY4b3FWq3XWvid/YbCgrWS4TmscCSwhiRREyKijgiosRGjXSDGRpvOYh3/M8afIJZOrAkaOBdSgQnL84H/wu7dmcWbaTQrGgN4X2/6YAAK7QKth29/Htt06AfzPwJXW8deawPwn6Y2OFj4ChraBi+uOJu8BlzvA6JMuGZIj+WkJxSLwfkbflAeGb4H+Nbdv7XOcPgBZ6tXyDXBwCEyWKHvd49193X37t6bdvx8pOXKJ1ElYXQAAAAZiS0dEALUAugDZFqItrQAAAAlwSFlzAAALEwAACxMBAJqcGAAAAAd0SU1FB+gCDRQWGzO7z2UAAAIWSURBVHja7dixEYBADANBmaH/bj6BjC6oxvTgz5jdEhTdqNb1dgAAgJHuzmEGAACYq6qc634sAQAAGzzVAAAgqgEAQFQDAICoBgAAUQ0AAIhqAAAQ1QAAIKoBAEBUAwAAohoAAEQ1AACIagAAENUAAICoBgAAUQ0AAKIaAABENQAAIKoBAEBUAwCAqAYAAFENAACIagAAENUAACCqAQBAVAMAAKIaAABENQAAiGoAABDVAACAqAYAAFENAACiGgAARDUAACCqAQBAVAMAgKgGAABRDQAAiGoAABDVAAAgqgEAQFQDAACiGgAARDUAAIhqAAAQ1QAAIKoBAABRDQAAohoAAEQ1AACIagAAQFQDAICoBgAAUQ0AAKIaAAAQ1QAAIKoBAEBUAwCAqAYAAEQ1AACIagAAENUAACCqAQAAUQ0AAKIaAABENQAAiGoAAEBUAwCAqAYAAFENAACiGgAAENUAACCqAQBAVAMAgKgGAABENQAAiGoAABDVAAAgqgEAAFENAACiGgAARDUAAIhqAABAVAMAgKgGAABRDQAAohoAABDVAAAgqgEAQFQDAICoBgAAUQ0AAIhqAAAQ1QAAIKoBAEBUAwAAohoAAEQ1AACIagAAENUAAICoBgAAUQ0AAKIaAABENQAAIKoBAEBUAwCAqAYAAFENAACIagAAENUAACCqAQDg3ypJmwEAAOY81QAAsOkDKJoKX1a5sggAAAAASUVORK5CYII=',
-    b'iVBORw0KGgoAAAANSUhEUgAAAtUAAABzCAYAAABXaf6xAAABhGlDQ1BJQ0MgcHJvZmlsZQAAKJF9kT1Iw0AYht+mSkUrDlYQcchQneyiIo6lFYtgobQVWnUwufQPmjQkKS6OgmvBwZ/FqoOLs64OroIg+APi7OCk6CIlfpcUWsR4x3EP733vy913gNCsMtXsiQKqZhnpREzM5VfFwCsEmiMIYEBipp7MLGbhOb7u4eP7XYRnedf9OQaVgskAn0gcZbphEW8Qz21aOud94hArSwrxOfGUQRckfuS67PIb55LDAs8MGdl0nDhELJa6WO5iVjZU4lnisKJqlC/kXFY4b3FWq3XWvid/YbCgrWS4TmscCSwhiRREyKijgiosRGjXSDGRpvOYh3/M8afIJZOrAkaOBdSgQnL84H/wu7dmcWbaTQrGgN4X2/6YAAK7QKth29/Htt06AfzPwJXW8deawPwn6Y2OFj4ChraBi+uOJu8BlzvA6JMuGZIj+WkJxSLwfkbflAeGb4H+Nbdv7XOcPgBZ6tXyDXBwCEyWKHvd49193X37t6bdvx8pOXKJ1ElYXQAAAAZiS0dEALUAugDZFqItrQAAAAlwSFlzAAALEwAACxMBAJqcGAAAAAd0SU1FB+gCDRQ1Aul5EMQAAAIWSURBVHja7dhBEYBAEAPBLC+MoA0jKDgrCFw83P6obgl5TaWe9XYAAIA93TmsAAAAA1Wp87o91QAAMOCpBgAAUQ0AAKIaAABENQAAiGoAAEBUAwCAqAYAAFENAACiGgAAENUAACCqAQBAVAMAgKgGAABENQAAiGoAABDVAAAgqgEAAFENAACiGgAARDUAAIhqAABAVAMAgKgGAABRDQAAohoAABDVAAAgqgEAQFQDAICoBgAARDUAAIhqAAAQ1QAAIKoBAABRDQAAohoAAEQ1AACIagAAQFQDAICoBgAAUQ0AAKIaAAAQ1QAAIKoBAEBUAwCAqAYAAFENAACIagAAENUAACCqAQBAVAMAAKIaAABENQAAiGoAABDVAACAqAYAAFENAACiGgAARDUAACCqAQBAVAMAgKgGAABRDQAAiGoAABDVAAAgqgEAQFQDAACiGgAARDUAAIhqAAAQ1QAAgKgGAABRDQAAohoAAEQ1AAAgqgEAQFQDAICoBgAAUQ0AAIhqAAAQ1QAAIKoBAEBUAwAAohoAAEQ1AACIagAAENUAAICoBgAAUQ0AAKIaAABENQAAiGoAAEBUAwCAqAYAAFENAACiGgAAENUAACCqAQBAVAMAgKgGAABENQAAiGoAABDVAAAgqgEAAFENAACiGgAARDUAAIhqAABAVAMAgKgGAABRDQAA/1ZJ2gwAALDPUw0AAEMf4DMIPs5obHYAAAAASUVORK5CYII=',
-    b'iVBORw0KGgoAAAANSUhEUgAAAtUAAABzCAYAAABXaf6xAAABhGlDQ1BJQ0MgcHJvZmlsZQAAKJF9kT1Iw0AYht+mSkUrDlYQcchQneyiIo6lFYtgobQVWnUwufQPmjQkKS6OgmvBwZ/FqoOLs64OroIg+APi7OCk6CIlfpcUWsR4x3EP733vy913gNCsMtXsiQKqZhnpREzM5VfFwCsEmiMIYEBipp7MLGbhOb7u4eP7XYRnedf9OQaVgskAn0gcZbphEW8Qz21aOud94hArSwrxOfGUQRckfuS67PIb55LDAs8MGdl0nDhELJa6WO5iVjZU4lnisKJqlC/kXFY4b3FWq3XWvid/YbCgrWS4TmscCSwhiRREyKijgiosRGjXSDGRpvOYh3/M8afIJZOrAkaOBdSgQnL84H/wu7dmcWbaTQrGgN4X2/6YAAK7QKth29/Htt06AfzPwJXW8deawPwn6Y2OFj4ChraBi+uOJu8BlzvA6JMuGZIj+WkJxSLwfkbflAeGb4H+Nbdv7XOcPgBZ6tXyDXBwCEyWKHvd49193X37t6bdvx8pOXKJ1ElYXQAAAAZiS0dEALUAugDZFqItrQAAAAlwSFlzAAALEwAACxMBAJqcGAAAAAd0SU1FB+gCDRQrC0Tkl78AAAITSURBVHja7dhBEYAwFEPBH6ThFEkoQErqob0xuxJyepP0aQcAANjSdi4zAADAviST73491QAAcMBTDQAAohoAAEQ1AACIagAAENUAAICoBgAAUQ0AAKIaAABENQAAIKoBAEBUAwCAqAYAAFENAACIagAAENUAACCqAQBAVAMAAKIaAABENQAAiGoAABDVAACAqAYAAFENAACiGgAARDUAACCqAQBAVAMAgKgGAABRDQAAiGoAABDVAAAgqgEAQFQDAACiGgAARDUAAIhqAAAQ1QAAgKgGAABRDQAAohoAAEQ1AAAgqgEAQFQDAICoBgAAUQ0AAKIaAAAQ1QAAIKoBAEBUAwCAqAYAAEQ1AACIagAAENUAACCqAQAAUQ0AAKIaAABENQAAiGoAAEBUAwCAqAYAAFENAACiGgAAENUAACCqAQBAVAMAgKgGAABENQAAiGoAABDVAAAgqgEAAFENAACiGgAARDUAAIhqAABAVAMAgKgGAABRDQAAohoAABDVAAAgqgEAQFQDAICoBgAARDUAAIhqAAAQ1QAAIKoBAABRDQAAohoAAEQ1AACIagAAENUAAICoBgAAUQ0AAKIaAABENQAAIKoBAEBUAwCAqAYAAFENAACIagAAENUAACCqAQBAVAMAAKIaAABENQAAiGoAABDVAACAqAYAAFENAACiGgAA/i0zUzMAAMA+TzUAABxauF0Lco+fZ/kAAAAASUVORK5CYII=',
-    b'iVBORw0KGgoAAAANSUhEUgAAAtUAAABzCAYAAABXaf6xAAABhGlDQ1BJQ0MgcHJvZmlsZQAAKJF9kT1Iw0AYht+mSkUrDlYQcchQneyiIo6lFYtgobQVWnUwufQPmjQkKS6OgmvBwZ/FqoOLs64OroIg+APi7OCk6CIlfpcUWsR4x3EP733vy913gNCsMtXsiQKqZhnpREzM5VfFwCsEmiMIYEBipp7MLGbhOb7u4eP7XYRnedf9OQaVgskAn0gcZbphEW8Qz21aOud94hArSwrxOfGUQRckfuS67PIb55LDAs8MGdl0nDhELJa6WO5iVjZU4lnisKJqlC/kXFY4b3FWq3XWvid/YbCgrWS4TmscCSwhiRREyKijgiosRGjXSDGRpvOYh3/M8afIJZOrAkaOBdSgQnL84H/wu7dmcWbaTQrGgN4X2/6YAAK7QKth29/Htt06AfzPwJXW8deawPwn6Y2OFj4ChraBi+uOJu8BlzvA6JMuGZIj+WkJxSLwfkbflAeGb4H+Nbdv7XOcPgBZ6tXyDXBwCEyWKHvd49193X37t6bdvx8pOXKJ1ElYXQAAAAZiS0dEALUAugDZFqItrQAAAAlwSFlzAAALEwAACxMBAJqcGAAAAAd0SU1FB+gCDRQeDHixwKoAAAISSURBVHja7dixDcBADAOxd5D9e0/oMZQd3l1AjqDqoOruHAAA4EpVnccMAABwL8mpJJ5qAABY8FQDAICoBgAAUQ0AAKIaAABENQAAIKoBAEBUAwCAqAYAAFENAACIagAAENUAACCqAQBAVAMAAKIaAABENQAAiGoAABDVAACAqAYAAFENAACiGgAARDUAACCqAQBAVAMAgKgGAABRDQAAiGoAABDVAAAgqgEAQFQDAACiGgAARDUAAIhqAAAQ1QAAgKgGAABRDQAAohoAAEQ1AAAgqgEAQFQDAICoBgAAUQ0AAIhqAAAQ1QAAIKoBAEBUAwCAqAYAAEQ1AACIagAAENUAACCqAQAAUQ0AAKIaAABENQAAiGoAAEBUAwCAqAYAAFENAACiGgAAENUAACCqAQBAVAMAgKgGAABENQAAiGoAABDVAAAgqgEAAFENAACiGgAARDUAAIhqAABAVAMAgKgGAABRDQAAohoAABDVAAAgqgEAQFQDAICoBgAARDUAAIhqAAAQ1QAAIKoBAABRDQAAohoAAEQ1AACIagAAQFQDAICoBgAAUQ0AAKIaAABENQAAIKoBAEBUAwCAqAYAAFENAACIagAAENUAACCqAQBAVAMAAKIaAABENQAAiGoAABDVAACAqAYAAFENAACiGgAARDUAACCqAQBAVAMAgKgGAIB/e2fGCgAAsOCpBgCApQ9tcA1iBRw5awAAAABJRU5ErkJggg=='
+    b'iVBORw0KGgoAAAANSUhEUgAAAtUAAABzCAYAAABXaf6xAAAABmJLR0QAtQC6ANkWoi2tAAAACXBIWXMAAAsTAAALEwEAmpwYAAACFklEQVR42u3YsRGAQAwDQZmh/24+gYwuqMb04M+Y3RIU3ajW9XYAAICR7s5hBgAAmKuqnOt+LAEAABs81QAAIKoBAEBUAwCAqAYAAFENAACIagAAENUAACCqAQBAVAMAAKIaAABENQAAiGoAABDVAACAqAYAAFENAACiGgAARDUAACCqAQBAVAMAgKgGAABRDQAAiGoAABDVAAAgqgEAQFQDAACiGgAARDUAAIhqAAAQ1QAAgKgGAABRDQAAohoAAEQ1AAAgqgEAQFQDAICoBgAAUQ0AAIhqAAAQ1QAAIKoBAEBUAwAAohoAAEQ1AACIagAAENUAACCqAQAAUQ0AAKIaAABENQAAiGoAAEBUAwCAqAYAAFENAACiGgAAENUAACCqAQBAVAMAgKgGAABENQAAiGoAABDVAAAgqgEAAFENAACiGgAARDUAAIhqAABAVAMAgKgGAABRDQAAohoAABDVAAAgqgEAQFQDAICoBgAARDUAAIhqAAAQ1QAAIKoBAABRDQAAohoAAEQ1AACIagAAQFQDAICoBgAAUQ0AAKIaAAAQ1QAAIKoBAEBUAwCAqAYAAFENAACIagAAENUAACCqAQBAVAMAAKIaAABENQAAiGoAABDVAACAqAYAAFENAACiGgAARDUAACCqAQBAVAMAgKgGAABRDQAAiGoAABDVAAAgqgEA4N8qSZsBAADmPNUAALDpAyiaCl9WubIIAAAAAElFTkSuQmCC',
+    b'iVBORw0KGgoAAAANSUhEUgAAAtUAAABzCAYAAABXaf6xAAAABmJLR0QAtQC6ANkWoi2tAAAACXBIWXMAAAsTAAALEwEAmpwYAAACFklEQVR42u3YQRGAQBADwSwvjKANIyg4KwhcPNz+qG4JeU2lnvV2AACAPd05rAAAAANVqfO6PdUAADDgqQYAAFENAACiGgAARDUAAIhqAABAVAMAgKgGAABRDQAAohoAABDVAAAgqgEAQFQDAICoBgAARDUAAIhqAAAQ1QAAIKoBAABRDQAAohoAAEQ1AACIagAAQFQDAICoBgAAUQ0AAKIaAAAQ1QAAIKoBAEBUAwCAqAYAAEQ1AACIagAAENUAACCqAQAAUQ0AAKIaAABENQAAiGoAAEBUAwCAqAYAAFENAACiGgAAENUAACCqAQBAVAMAgKgGAABRDQAAiGoAABDVAAAgqgEAQFQDAACiGgAARDUAAIhqAAAQ1QAAgKgGAABRDQAAohoAAEQ1AAAgqgEAQFQDAICoBgAAUQ0AAIhqAAAQ1QAAIKoBAEBUAwAAohoAAEQ1AACIagAAENUAAICoBgAAUQ0AAKIaAABENQAAIKoBAEBUAwCAqAYAAFENAACIagAAENUAACCqAQBAVAMAAKIaAABENQAAiGoAABDVAACAqAYAAFENAACiGgAARDUAAIhqAABAVAMAgKgGAABRDQAAohoAABDVAAAgqgEAQFQDAICoBgAARDUAAIhqAAAQ1QAAIKoBAABRDQAAohoAAEQ1AACIagAAQFQDAICoBgAAUQ0AAP9WSdoMAACwz1MNAABDH+AzCD7OaGx2AAAAAElFTkSuQmCC',
+    b'iVBORw0KGgoAAAANSUhEUgAAAtUAAABzCAYAAABXaf6xAAAABmJLR0QAtQC6ANkWoi2tAAAACXBIWXMAAAsTAAALEwEAmpwYAAACE0lEQVR42u3YQRGAMBRDwR+k4RRJKEBK6qG9MbsScnqT9GkHAADY0nYuMwAAwL4kk+9+PdUAAHDAUw0AAKIaAABENQAAiGoAABDVAACAqAYAAFENAACiGgAARDUAACCqAQBAVAMAgKgGAABRDQAAiGoAABDVAAAgqgEAQFQDAACiGgAARDUAAIhqAAAQ1QAAgKgGAABRDQAAohoAAEQ1AAAgqgEAQFQDAICoBgAAUQ0AAIhqAAAQ1QAAIKoBAEBUAwAAohoAAEQ1AACIagAAENUAAICoBgAAUQ0AAKIaAABENQAAIKoBAEBUAwCAqAYAAFENAACiGgAAENUAACCqAQBAVAMAgKgGAABENQAAiGoAABDVAAAgqgEAAFENAACiGgAARDUAAIhqAABAVAMAgKgGAABRDQAAohoAABDVAAAgqgEAQFQDAICoBgAARDUAAIhqAAAQ1QAAIKoBAABRDQAAohoAAEQ1AACIagAAQFQDAICoBgAAUQ0AAKIaAAAQ1QAAIKoBAEBUAwCAqAYAAEQ1AACIagAAENUAACCqAQAAUQ0AAKIaAABENQAAiGoAABDVAACAqAYAAFENAACiGgAARDUAACCqAQBAVAMAgKgGAABRDQAAiGoAABDVAAAgqgEAQFQDAACiGgAARDUAAIhqAAAQ1QAAgKgGAABRDQAAohoAAP4tM1MzAADAPk81AAAcWrhdC3KPn2f5AAAAAElFTkSuQmCC',
+    b'iVBORw0KGgoAAAANSUhEUgAAAtUAAABzCAYAAABXaf6xAAAABmJLR0QAtQC6ANkWoi2tAAAACXBIWXMAAAsTAAALEwEAmpwYAAACEklEQVR42u3YsQ3AQAwDsXeQ/XtP6DGUHd5dQI6g6qDq7hwAAOBKVZ3HDAAAcC/JqSSeagAAWPBUAwCAqAYAAFENAACiGgAARDUAACCqAQBAVAMAgKgGAABRDQAAiGoAABDVAAAgqgEAQFQDAACiGgAARDUAAIhqAAAQ1QAAgKgGAABRDQAAohoAAEQ1AAAgqgEAQFQDAICoBgAAUQ0AAIhqAAAQ1QAAIKoBAEBUAwAAohoAAEQ1AACIagAAENUAAICoBgAAUQ0AAKIaAABENQAAIKoBAEBUAwCAqAYAAFENAACIagAAENUAACCqAQBAVAMAgKgGAABENQAAiGoAABDVAAAgqgEAAFENAACiGgAARDUAAIhqAABAVAMAgKgGAABRDQAAohoAABDVAAAgqgEAQFQDAICoBgAARDUAAIhqAAAQ1QAAIKoBAABRDQAAohoAAEQ1AACIagAAQFQDAICoBgAAUQ0AAKIaAAAQ1QAAIKoBAEBUAwCAqAYAAEQ1AACIagAAENUAACCqAQAAUQ0AAKIaAABENQAAiGoAAEBUAwCAqAYAAFENAACiGgAARDUAACCqAQBAVAMAgKgGAABRDQAAiGoAABDVAAAgqgEAQFQDAACiGgAARDUAAIhqAAAQ1QAAgKgGAABRDQAAohoAAEQ1AAAgqgEAQFQDAICoBgCAf3tnxgoAALDgqQYAgKUPbXANYgUcOWsAAAAASUVORK5CYII='
+]
+# the middle rounds are drawn on for every card, so decode them (and load the
+#   pixels, which copy does) once rather than on every redraw
+MIDDLE_IMAGES = [
+    Image.open(BytesIO(base64.b64decode(middle))).copy() for middle in MIDDLE
 ]
 TEXTCOLOR = [
     (106, 117, 155, 255),
@@ -57,9 +67,20 @@ THEME_IDX = 0
 
 PADDING = 4
 CARD_SIZE = (780, 116)
+# vertical distance between the tops of two cards, and the x offsets of the
+#   middle and right round (the left round is 27 px and the middle 725 px wide)
+CARD_STRIDE = CARD_SIZE[1] + PADDING
+MIDDLE_X = 27
+RIGHTROUND_X = 752
 
 FOOTER_BUTTON_SIZE = (17, 2)
 
+# a {variable} in a dataline or parameter
+VARIABLE_PATTERN = re.compile(r'\{[^}]*\}')
+
+# the number of rendered card images kept for redrawing the canvas
+CARD_IMAGE_CACHE_SIZE = 256
+
 # =======================================
 # Classes
 class Deck():
@@ -70,6 +91,14 @@ class Deck():
         """
         self.cards = []
         self.variables = {}
+        
+        # rendered middle rounds, {(theme idx, text color, card text,
+        #   dataline text) : image}
+        self._image_cache = collections.OrderedDict()
+        
+        # the figure ids of every card's button on the graph, {idx : (left,
+        #   middle, right)}
+        self._card_figures = {}
 
     def add_card(self, card):
         """
@@ -91,7 +120,7 @@ class Deck():
         :Parameters:
           -. `idx` : int, the integer of card to be removed
         """
-        if self.can_remove_card:
+        if 0 <= idx < len(self.cards):
             del self.cards[idx]
     
     def clear_cards(self):
@@ -110,124 +139,120 @@ class Deck():
         """
         # clear the graph
         graph.erase()
+        self._card_figures = {}
+        
+        # grow the canvas by all the cards at once, the canvas and bottom left
+        #   grow together so the coordinates do not change while drawing
+        w, h = graph.CanvasSize
+        graph.CanvasSize = (w, h + len(self.cards) * CARD_STRIDE)
+        graph.BottomLeft = (0, h + len(self.cards) * CARD_STRIDE)
         
         # create a button (image placed on a graph) for each card
-        height = 0
-        for idx, card in enumerate(self.cards):
-            # check if the user has clicked on this particular card
-            #   if they have - "depress" the button
-            if idx == depressed:
-                theme_idx = -1
-                text_color = TEXTCOLOR[THEME_IDX]
-            else:
-                theme_idx = THEME_IDX
-                text_color = TEXTCOLOR[-1]
-            
-            # draw the left round
-            graph.draw_image(
-                data = LEFTROUND[theme_idx],
-                location = (0, height)
-            )
-            
-            # start preparing the middle "round"
+        for idx in range(len(self.cards)):
+            self.draw_card(graph, idx, idx == depressed)
+        
+        return graph
+    
+    def draw_card(self, graph, idx, depressed=False):
+        """
+        draw (or redraw over top of itself) a single card's button, this lets
+        a click only repaint the card that changed instead of the whole graph
+
+        :Parameters:
+          -. `graph` : FreeSimpleGUI.Graph element, the graph to be drawn on
+          -. `idx` : int, the index of the card
+          -. `depressed` : bool, draw the card in the clicked color
+        """
+        card = self.cards[idx]
+        height = idx * CARD_STRIDE
+        
+        # check if the user has clicked on this particular card
+        #   if they have - "depress" the button
+        if depressed:
+            theme_idx = -1
+            text_color = TEXTCOLOR[THEME_IDX]
+        else:
+            theme_idx = THEME_IDX
+            text_color = TEXTCOLOR[-1]
+        
+        # remove the card's previous button so redraws do not pile up
+        for figure in self._card_figures.get(idx, ()):
+            graph.delete_figure(figure)
+        
+        # draw the left round
+        left = graph.draw_image(
+            data = LEFTROUND[theme_idx],
+            location = (0, height)
+        )
+        
+        # the middle "round" only depends on the colors and the text, so
+        #   reuse the rendered image if this card was drawn like this before
+        try:
+            card_text = card.cardname + ' - ' + card.parameters['name']
+        except KeyError:
+            card_text = card.cardname
+        
+        txt = format_datalines(tuple(d[0] for d in card.datalines))
+        
+        key = (theme_idx, text_color, card_text, txt)
+        if key in self._image_cache:
+            self._image_cache.move_to_end(key)
+            png = self._image_cache[key]
+        else:
             # open the rounded rectangle image and prepare to draw on it
-            tmp_file = tempfile.NamedTemporaryFile(suffix=".png").name
-            img = Image.open(BytesIO(base64.b64decode(MIDDLE[theme_idx])))
+            img = MIDDLE_IMAGES[theme_idx].copy()
             draw = ImageDraw.Draw(img)
             
-            # create font for the card name/instance name
-            try:
-                font = ImageFont.truetype('Arial.ttf', size=36)
-            except OSError:
-                font = ImageFont.truetype('arial.ttf', size=36)
-
-            try:
-                card_text = card.cardname + ' - ' + card.parameters['name']
-            except KeyError:
-                card_text = card.cardname
-
+            # write the card name/instance name
             draw.text(
                 (0, 24),
                 text = card_text,
-                font = font,
+                font = get_font(36),
                 fill = text_color,
                 stroke_width = 1,
                 stroke_fill = text_color
             )
             
-            # create text for the dataline font
-            try:
-                font = ImageFont.truetype('Arial.ttf', size=24)
-            except OSError:
-                font = ImageFont.truetype('arial.ttf', size=24)
-
-            if not card.datalines:
-                txt = 'Select file'
-            else:
-                dl = []
-                for d in card.datalines:
-                    d = d[0]
-                    if d.startswith('@'):
-                        dl.append(d)
-                    else:
-                        dl.append(os.path.basename(d))
-                txt = ', '.join(dl)
+            # write the datalines
             draw.text(
                 (24, 72),
                 text = txt,
-                font = font,
+                font = get_font(24),
                 fill = text_color
             )
             
-            # save the image in the tempfile
-            img.save(tmp_file)
-            
-            # draw the image on the graph
-            graph.draw_image(filename = tmp_file, location=(27, height))
-            
-            # draw the right round
-            graph.draw_image(
-                data = RIGHTROUND[theme_idx],
-                location = (752, height)
-            )
-            
-            # add to height and change the colors back
-            height += CARD_SIZE[1] + PADDING
-            w, h = graph.CanvasSize
-            graph.CanvasSize = (w, h + CARD_SIZE[1] + PADDING)
-            graph.BottomLeft = (0, h + CARD_SIZE[1] + PADDING)
+            # encode the image in memory (base64, like the rounds) and
+            #   remember it, dropping the least recently drawn image once the
+            #   cache is full
+            buf = BytesIO()
+            img.save(buf, format='PNG')
+            png = base64.b64encode(buf.getvalue())
+            self._image_cache[key] = png
+            if len(self._image_cache) > CARD_IMAGE_CACHE_SIZE:
+                _ = self._image_cache.popitem(last=False)
         
-        return graph
+        # draw the image on the graph
+        middle = graph.draw_image(data = png, location=(MIDDLE_X, height))
+        
+        # draw the right round
+        right = graph.draw_image(
+            data = RIGHTROUND[theme_idx],
+            location = (RIGHTROUND_X, height)
+        )
+        
+        self._card_figures[idx] = (left, middle, right)
     
     def check_for_variables(self):
         """
         check if there are any variables in the parameters or datalines
         """
         for card in self.cards:
-            # loop over all the datalines to look for variables
-            for dataline in card.datalines:
-                idx = dataline[0].find('{')
-                while idx >= 0:
-                    start = idx
-                    end = dataline[0].find('}', idx)+1
-                    variable_name = dataline[0][idx:end]
-                    if not variable_name in self.variables.keys():
-                        self.variables[variable_name] = ''
-                    
-                    idx = dataline[0].find('{', end)
-                    
-            # loop over all the parameters to check for variables
-            for parameter in card.parameters.values():
-                idx = parameter.find('{')
-                while idx >= 0:
-                    start = idx
-                    end = parameter.find('}', idx)+1
-                    variable_name = parameter[idx:end]
-                    if not variable_name in self.variables.keys():
-                        self.variables[variable_name] = ''
-                    
-                    idx = parameter.find('{', end)
-                    
+            # look for variables in all the datalines and parameters
+            texts = [dataline[0] for dataline in card.datalines]
+            texts.extend(card.parameters.values())
+            for text in texts:
+                for variable_name in VARIABLE_PATTERN.findall(text):
+                    self.variables.setdefault(variable_name, '')
             
     def satisy_variables(self):
         """
@@ -241,6 +266,38 @@ class Deck():
 
 # =======================================
 # Functions
+@functools.lru_cache(maxsize=None)
+def get_font(size):
+    """
+    load the Arial font once per size, the cards are redrawn often. Falls
+    back on PIL's default font when Arial is not installed
+
+    :Parameters:
+      -. `size` : int, the font size
+    """
+    for font_name in ('Arial.ttf', 'arial.ttf'):
+        try:
+            return ImageFont.truetype(font_name, size=size)
+        except OSError:
+            pass
+    return ImageFont.load_default()
+
+@functools.lru_cache(maxsize=CARD_IMAGE_CACHE_SIZE)
+def format_datalines(datalines):
+    """
+    the dataline text written on a card, instance calls are kept as they are
+    and files are shortened to their basename. Cached since the same cards are
+    redrawn over and over
+
+    :Parameters:
+      -. `datalines` : tuple of str, the first item of every dataline
+    """
+    if not datalines:
+        return 'Select file'
+    return ', '.join(
+        d if d.startswith('@') else os.path.basename(d) for d in datalines
+    )
+
 def create_main_window(deck, theme, window=None):
     """
     create the main window
@@ -274,14 +331,14 @@ def create_main_window(deck, theme, window=None):
     +---------------------------------------------+
     """
     # this graph element is where all the cards show up
-    h = 20 + (len(deck.cards) * (CARD_SIZE[1] + PADDING))
+    h = 20 + (len(deck.cards) * CARD_STRIDE)
     graph = sg.Graph(
         canvas_size = (800, h),
         graph_bottom_left = (0, h),
         graph_top_right = (800, 0),
         key = '-CANVAS-',
         enable_events = True,
-        drag_submits = True
+        drag_submits = False
     )
     
     # define the actual layout
@@ -314,7 +371,8 @@ def create_main_window(deck, theme, window=None):
                 ],
                 scrollable = True,
                 vertical_scroll_only = True,
-                size = (850, 550)
+                size = (850, 550),
+                key = '-COLUMN-'
             )
         ],
         [
@@ -364,6 +422,26 @@ def create_main_window(deck, theme, window=None):
         window.close()
     return (window_, graph)
     
+def resize_main_window(window, graph, deck):
+    """
+    resize the canvas to fit the deck's cards, this is much cheaper than
+    rebuilding the whole window with create_main_window and is enough when
+    only the cards have changed
+
+    :Parameters:
+      -. `window` : FreeSimpleGUI.Window, the main window
+      -. `graph` : FreeSimpleGUI.Graph element, the main window's canvas
+      -. `deck` : Deck obj, the deck shown on the canvas
+    """
+    h = 20 + (len(deck.cards) * CARD_STRIDE)
+    graph.set_size((800, h))
+    graph.CanvasSize = (800, h)
+    graph.change_coordinates((0, h), (800, 0))
+    
+    # let the scrollable column pick up the new canvas height
+    window['-COLUMN-'].contents_changed()
+    return graph
+    
 def load_cards_from_input_deck():
     """
     create a new window to ask the user to pick an input deck, read that input
@@ -385,9 +463,11 @@ def load_cards_from_input_deck():
     event, values = window.read()
     window.Close()
     
-    if event == 'OK':
+    # nothing to load if the user cancelled or did not pick a real file
+    if event == 'OK' and os.path.isfile(values['-INP-']):
         inp = read_input_deck(values['-INP-'])
         return inp.cards
+    return []
     
 def add_card_manually():
     """
@@ -424,18 +504,25 @@ def save_input_deck(deck, filename):
       -. `deck` : input_deck_reader.InputDeck obj, a picnic input deck
       -. `filename` : file-like str, the filename/path to to save
     """
+    # build the whole deck and write it at once
+    lines = [
+        '*start\n',
+        '  *sink\n',
+        '    ' + os.path.dirname(filename) + '\n'
+    ]
+    for card in deck.cards:
+        line = ['  ' + card.cardname]
+        line.extend(
+            param + '=' + value for param, value in card.parameters.items()
+        )
+        lines.append(', '.join(line) + '\n')
+        lines.extend(
+            '    ' + ', '.join(dataline) + '\n' for dataline in card.datalines
+        )
+    lines.append('*end')
+    
     with open(filename, 'w') as f:
-        _ = f.write('*start\n')
-        _ = f.write('  *sink\n')
-        _ = f.write('    ' + os.path.dirname(filename) + '\n')
-        for card in deck.cards:
-            line = ['  ' + card.cardname]
-            for param in card.parameters.keys():
-                line.append(param + '=' + card.parameters[param])
-            _ = f.write(', '.join(line) + '\n')
-            for dataline in card.datalines:
-                _ = f.write('    ' + ', '.join(dataline) + '\n')
-        _ = f.write('*end')
+        _ = f.write(''.join(lines))
         
 def show_parameters(card):
     """
@@ -599,18 +686,20 @@ def create_variable_window(variables):
             window.Close()
             return None
     
+@functools.lru_cache(maxsize=8)
 def get_card_list(folder_path=None, extension='.json'):
     """
     return a list of cards found in the `cards.default_parameters`
     sub-directory. We use this to determine which instances steps will be
-    loaded.
+    loaded. The shipped cards do not change while pantry is open, so the
+    listing is only built once per folder.
 
     :Parameters:
       -. `folder_path` : a file-like string, the path to find the json files
       -. `extension` : a string, the file type to search for the cards
 
     :Return:
-      -. a dictionary, cards and their associated picnic classes
+      -. a read-only dictionary, cards and their associated picnic classes
     """
 
     # {key = 'card name' : val = CardName obj}
@@ -620,18 +709,138 @@ def get_card_list(folder_path=None, extension='.json'):
     # Get all the jsons in the default parameters folder
     if folder_path is None:
         folder_path = get_path_to_jsons()
-    for json_ in folder_path.glob(f"*{extension}"):
-        card_name = os.path.basename(json_).replace(extension, '').replace('_', ' ')
-        module_ = importlib.import_module(
-            # '.'.join(('picnic', 'cards', card_name.replace(' ', '_')))
-            '.'.join(('cards', card_name.replace(' ', '_')))
-        )
-        card_instance_legend[card_name] = getattr(
-            module_,
-            ''.join([s.capitalize() for s in card_name.split(' ')])
-        )
+    with os.scandir(folder_path) as entries:
+        json_names = [
+            entry.name for entry in entries
+            if entry.name.endswith(extension) and entry.is_file()
+        ]
+    for json_ in json_names:
+        card_name = json_.replace(extension, '').replace('_', ' ')
+        card_instance_legend[card_name] = load_card_class(card_name)
+
+    return types.MappingProxyType(card_instance_legend)
+
+def on_load(state, values):
+    """
+    load an input deck
+
+    :Parameters:
+      -. `state` : dict, {'deck' : Deck, 'window' : main window, 'graph' :
+        the main window's canvas}
+      -. `values` : dict, the values read from the main window
+    """
+    cards = load_cards_from_input_deck()
+    if cards:
+        for card in cards:
+            if card.cardname.lower() != 'sink':
+                state['deck'].add_card(card)
+        redraw_cards(state)
+
+def on_add(state, values):
+    """
+    add a preprocessing step to the workflow, see on_load for the parameters
+    """
+    card = add_card_manually()
+    if not card is None:
+        state['deck'].add_card(card)
+        redraw_cards(state)
+
+def on_clear(state, values):
+    """
+    clear all the steps, see on_load for the parameters
+    """
+    state['deck'].clear_cards()
+    redraw_cards(state)
+
+def on_variables(state, values):
+    """
+    if any variables have been added, satisfy them, see on_load for the
+    parameters
+    """
+    state['deck'].satisy_variables()
+
+def on_save(state, values):
+    """
+    save the input deck, see on_load for the parameters
+    """
+    filename = sg.popup_get_file('Choose Save File', save_as=True)
+    save_input_deck(state['deck'], filename)
+
+def on_canvas(state, values):
+    """
+    clicking on the canvas, see on_load for the parameters
+    """
+    deck, graph = state['deck'], state['graph']
+    card_idx = values['-CANVAS-'][1]//CARD_STRIDE
+    # check to make sure the user has actually clicked a card and not 
+    #   some padding
+    if not card_idx >= len(deck.cards):
+        deck.draw_card(graph, card_idx, depressed=True) # highlight card
+        card = deck.cards[card_idx]
+        
+        # only the clicked card needs repainting unless it was edited
+        parameters, datalines = show_parameters(card)
+        if not (parameters, datalines)==(None, None):
+            if parameters == 'DELETE':
+                deck.remove_card(card_idx)
+            else:
+                deck.cards[card_idx].parameters = parameters
+                deck.cards[card_idx].datalines = datalines
+            deck.build_graph_element(graph)
+        else:
+            deck.draw_card(graph, card_idx)
+
+def on_run(state, values):
+    """
+    running from pantry is disabled, see on_load for the parameters
+    """
+    sg.popup('This feature has been disabled')
 
-    return card_instance_legend
+def on_theme(state, values, theme_idx):
+    """
+    change the color theme, this needs a whole new window
+
+    :Parameters:
+      -. `state` : dict, see on_load
+      -. `values` : dict, see on_load
+      -. `theme_idx` : int, the index of the new theme in COLORTHEMES
+    """
+    global THEME_IDX
+    THEME_IDX = theme_idx
+    state['window'], state['graph'] = create_main_window(
+        state['deck'],
+        COLORTHEMES[THEME_IDX],
+        state['window']
+    )
+    state['deck'].build_graph_element(state['graph'])
+
+def redraw_cards(state):
+    """
+    resize the main window's canvas to the deck and draw all its cards
+
+    :Parameters:
+      -. `state` : dict, see on_load
+    """
+    state['graph'] = resize_main_window(
+        state['window'],
+        state['graph'],
+        state['deck']
+    )
+    state['deck'].build_graph_element(state['graph'])
+
+# {event : handler(state, values)}
+MAIN_WINDOW_EVENTS = {
+    '-LOAD-' : on_load,
+    '-ADD-' : on_add,
+    '-CLEAR-' : on_clear,
+    '-VARIABLES-' : on_variables,
+    '-SAVE-' : on_save,
+    '-CANVAS-' : on_canvas,
+    '-RUN-' : on_run,
+    'Dark Blue::-DARKBLUE-' : functools.partial(on_theme, theme_idx=0),
+    'Default::-DEFAULT-' : functools.partial(on_theme, theme_idx=1),
+    'Dark Purple::-DARKPURPLE-' : functools.partial(on_theme, theme_idx=2),
+}
 
 # =======================================
 # Main
@@ -639,80 +848,16 @@ if __name__ == '__main__':
     # initialize the deck and main window
     deck = Deck()
     window, graph = create_main_window(deck, COLORTHEMES[THEME_IDX])
+    state = {'deck' : deck, 'window' : window, 'graph' : graph}
     
     # read the window and control flow based off the detected event/value
     while True:
-        event, values = window.read()
+        event, values = state['window'].read()
         if event == sg.WIN_CLOSED or event == 'Exit':
             break
         
-        # load an input deck
-        if event == '-LOAD-':
-            cards = load_cards_from_input_deck()
-            if not cards is None:
-                for card in cards:
-                    if card.cardname.lower() != 'sink':
-                        deck.add_card(card)
-                window, graph = create_main_window(deck, COLORTHEMES[THEME_IDX], window)
-                deck.build_graph_element(graph)
-        
-        # add a preprocessing step to the workflow
-        elif event == '-ADD-':
-            card = add_card_manually()
-            if not card is None:
-                deck.add_card(card)
-                window, graph = create_main_window(deck, COLORTHEMES[THEME_IDX], window)
-                deck.build_graph_element(graph)
-        
-        # clear all the steps
-        elif event == '-CLEAR-':
-            deck.clear_cards()
-            window, graph = create_main_window(deck, COLORTHEMES[THEME_IDX], window)
-            deck.build_graph_element(graph)
-        
-        # if any variables have been added, satisfy them
-        elif event == '-VARIABLES-':
-            deck.satisy_variables()
-        
-        # save the input deck
-        elif event == '-SAVE-':
-            filename = sg.popup_get_file('Choose Save File', save_as=True)
-            save_input_deck(deck, filename)
-        
-        # clicking on the canvas
-        elif event == '-CANVAS-':
-            card_idx = values['-CANVAS-'][1]//(CARD_SIZE[1]+PADDING)
-            # check to make sure the user has actually clicked a card and not 
-            #   some padding
-            if not card_idx >= len(deck.cards):
-                deck.build_graph_element(graph, card_idx) # highlight card
-                card = deck.cards[card_idx]
-                
-                parameters, datalines = show_parameters(card)
-                if not (parameters, datalines)==(None, None):
-                    if parameters == 'DELETE':
-                        deck.remove_card(card_idx)
-                    else:
-                        deck.cards[card_idx].parameters = parameters
-                        deck.cards[card_idx].datalines = datalines
-                
-                deck.build_graph_element(graph)
-        
-        elif event == '-RUN-':
-            sg.popup('This feature has been disabled')
-        
-        # change the color theme
-        elif event == 'Dark Blue::-DARKBLUE-':
-            THEME_IDX = 0
-            window, graph = create_main_window(deck, COLORTHEMES[THEME_IDX], window)
-            deck.build_graph_element(graph)
-        elif event == 'Default::-DEFAULT-':
-            THEME_IDX = 1
-            window, graph = create_main_window(deck, COLORTHEMES[THEME_IDX], window)
-            deck.build_graph_element(graph)
-        elif event == 'Dark Purple::-DARKPURPLE-':
-            THEME_IDX = 2
-            window, graph = create_main_window(deck, COLORTHEMES[THEME_IDX], window)
-            deck.build_graph_element(graph)
+        handler = MAIN_WINDOW_EVENTS.get(event)
+        if handler is not None:
+            handler(state, values)
         else:
             print(event, values)
@@ -17,12 +17,11 @@ How To Use This Module
 # =======================================
 # Imports
 import os
-import importlib
 import argparse
 import pandas
-import copy
 import traceback
 
+from picnic.cards import load_card_class
 from picnic.input_deck_reader import read_input_deck
 
 
@@ -98,11 +97,7 @@ class Pipeline:
         for card in self.inp.cards:
             if not card.cardname[1:] == 'sink':
                 # print(card.cardname[1:])
-                instance_name = infer_class_name_from_card_name(card.cardname[1:])
-                module = importlib.import_module(
-                    'picnic.cards.' + '_'.join(card.cardname[1:].lower().split(' '))
-                )
-                instance = getattr(module, instance_name)
+                instance = load_card_class(card.cardname[1:])
 
                 # replace all the instance calls
                 new_datalines = []
@@ -110,15 +105,16 @@ class Pipeline:
                     new_dataline = []
                     for data in dataline:
                         if data.startswith('@'):
-                            # set up a control flow to parse instance calls
-                            splitter = data[1:].split('.')
-                            if len(splitter) == 2:
+                            # set up a control flow to parse instance calls,
+                            #   @instance or @instance.outflow
+                            instance_name, dot, outflow = data[1:].partition('.')
+                            if not dot:
+                                data = list(self.pipeline_instances[instance_name].outflows.values())[0]
+                            elif '.' not in outflow:
                                 try:
-                                    data = self.pipeline_instances[splitter[0]].outflows[splitter[1]]
+                                    data = self.pipeline_instances[instance_name].outflows[outflow]
                                 except KeyError:
-                                    raise Exception('Error: The outflow "' + splitter[1] + '" is not available for instance "' + splitter[0] + '"')
-                            elif len(splitter) == 1:
-                                data = list(self.pipeline_instances[splitter[0]].outflows.values())[0]
+                                    raise Exception('Error: The outflow "' + outflow + '" is not available for instance "' + instance_name + '"')
                             else:
                                 raise Exception('Error: Syntax issue with data line "' + data + '"')
 
@@ -130,7 +126,7 @@ class Pipeline:
                 name = card.parameters['name']
                 self.pipeline_instances[name] = instance(card)
                 self.pipeline_instances[name].set_outflows(self.sink_directory)
-                self.pipeline_workflows[name] = instance(card).build_workflow(self.sink_directory)
+                self.pipeline_workflows[name] = self.pipeline_instances[name].build_workflow(self.sink_directory)
                 self.pipeline_workflows[name].workflow.run()
                 report.integrate_report(
                     self.pipeline_instances[name].outflows['report'],
@@ -246,21 +242,6 @@ def create_parser():
     return _parser
 
 
-def infer_class_name_from_card_name(card_name):
-    """
-    returns a string of the suspected class name by giving a card name. This
-    assumes all spaces will be removed, the first word will be capitalized and
-    CamelCase will be used for subsequent words.
-
-    :Parameters:
-      -. `card_name` : a string, the name of the card
-
-    :Return:
-      -.  a string
-    """
-    return ''.join([s.capitalize() for s in card_name.split(' ')])
-
-
 def insert_parameters(inps, dox_file):
     """
     creates new input decks from a list of template inps and a test readable
@@ -278,6 +259,10 @@ def insert_parameters(inps, dox_file):
     # Read in the dox file
     df = pandas.read_csv(dox_file, index_col=0)
     number_of_runs = df.shape[1]
+    
+    # pull the table out of pandas once, every run is a column of values
+    parameter_names = df.index.tolist()
+    values = df.to_numpy()
 
     # Loop over each input deck provided
     new_inps = []
@@ -286,14 +271,14 @@ def insert_parameters(inps, dox_file):
         parameters = {}
         with open(inp) as f:
             parameter_flag = False
-            for line in f.readlines():
+            for line in f:
                 line = line.strip()
                 if line:
-                    # creating a flag system for the *parameter keyword
-                    if line.startswith('*'):
-                        parameter_flag = False
-                        if line.lower().startswith('*parameter'):
-                            parameter_flag = True
+                    # creating a flag system for the *parameter keyword, only
+                    #  keyword lines need their case folded
+                    is_keyword = line.startswith('*')
+                    if is_keyword:
+                        parameter_flag = line[:10].lower() == '*parameter'
 
                     if not parameter_flag:
                         all_lines.append(line)
@@ -301,17 +286,15 @@ def insert_parameters(inps, dox_file):
                     # because *parameter is special and it is how we are
                     #  creating new input decks we are going to isolate
                     #  all these lines and set them aside
-                    else:
-                        if not line.lower().startswith('*parameter'):
-                            k, v = [a.strip() for a in line.split('=')]
-                            parameters[k] = v
+                    elif not is_keyword:
+                        k, v = [a.strip() for a in line.split('=')]
+                        parameters[k] = v
 
         # now that we've read the entire input deck, we want to add in the new
         #  parameters as described by the dox file
-        for idx, run in enumerate(df.columns):
-            new_parameters = copy.deepcopy(parameters)
-            for parameter_name in df.index:
-                new_parameters[parameter_name] = df.loc[parameter_name][run]
+        for idx in range(number_of_runs):
+            new_parameters = dict(parameters)
+            new_parameters.update(zip(parameter_names, values[:, idx]))
 
             # write out the new input deck with the additional parameters
             new_inp = '_'.join([
@@ -321,7 +304,7 @@ def insert_parameters(inps, dox_file):
             with open(new_inp, 'w') as g:
                 for line in all_lines:
                     _ = g.write(line + '\n')
-                    if line.lower().startswith('*start'):
+                    if line[:6].lower() == '*start':
                         _ = g.write('*parameter\n')
                         for key, value in new_parameters.items():
                             _ = g.write(key + ' = ' + value + '\n')
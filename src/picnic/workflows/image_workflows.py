@@ -34,7 +34,8 @@ class ImageWorkflow():
     """
     DEFAULT_PARAMS = {
         'name' : 'nibabel_image_import',
-        'report' : True
+        'report' : True,
+        'nprocs' : 1
     }
     DEFAULT_INFLOWS = {
         'in_files' : []
@@ -204,7 +205,8 @@ class ImageWorkflow():
                 input_names = [
                     'type_',
                     'in_files',
-                    'additional_args'
+                    'additional_args',
+                    'nprocs'
                 ],
                 output_names = [
                     'reports'
@@ -217,7 +219,8 @@ class ImageWorkflow():
                 'in_files' : '@report_merge',
                 'additional_args' : [
                     'image'
-                ]
+                ],
+                'nprocs' : self.params['nprocs']
             },
             outflows = (
                 'reports',
@@ -47,6 +47,7 @@ class MotionCorrectionWorkflow():
         'mean' : False,
         'search_angle' : 0,
         'report' : True,
+        'nprocs' : 1,
     }
     DEFAULT_INFLOWS = {
         'in_file' : None
@@ -229,7 +230,8 @@ class MotionCorrectionWorkflow():
                 input_names = [
                     'type_',
                     'in_files',
-                    'additional_args'
+                    'additional_args',
+                    'nprocs'
                 ],
                 output_names = [
                     'reports'
@@ -243,7 +245,8 @@ class MotionCorrectionWorkflow():
                 'additional_args' : [
                     self.params['ref_vol'],
                     'motion_correction'
-                ]
+                ],
+                'nprocs' : self.params['nprocs']
             },
             outflows = (
                 'reports',
@@ -14,11 +14,8 @@ from picnic.interfaces.nibabel_nodes import (
     _reorient_image,
     _create_bilateral_atlas,
     _binarize_images,
-    _generate_wholebrain_mask,
-    _generate_gray_matter_mask,
-    _generate_white_matter_mask,
-    _generate_subcortical_mask,
-    _generate_ventricle_mask
+    _generate_aseg_masks,
+    ASEG_MASKS
 )
 
 
@@ -115,11 +112,7 @@ class ReconallWorkflow:
         self.execute_reconall()
         self.reorient_outflows()
         self.generate_bilateral_rois()
-        self.generate_wholebrain_mask()
-        self.generate_gray_matter_mask()
-        self.generate_white_matter_mask()
-        self.generate_subcortical_mask()
-        self.generate_ventricle_mask()
+        self.generate_aseg_masks()
         if self.params['report']:
             self.create_report()
         
@@ -256,13 +249,15 @@ class ReconallWorkflow:
                 ]
             )
 
-    def generate_wholebrain_mask(self):
-        """ create a whole brain mask from the aseg
+    def generate_aseg_masks(self):
+        """ create the wholebrain, gray matter, white matter, subcortical and
+        ventricle masks from the aseg. The aseg is only loaded once for all of
+        them
         """
         # select the atlas from the renamed niftis
         self.wf.add_node(
             interface = Select(),
-            name = 'select_aseg_for_wholebrain',
+            name = 'select_aseg_for_masks',
             inflows = {
                 'inlist' : '@standardized_filenames',
                 'index' : FREESURFER_OUTFLOWS_TO_EXPOSE.index('aseg')
@@ -272,183 +267,21 @@ class ReconallWorkflow:
             )
         )
         
-        # create wholebrain mask
+        # create all the masks
         self.wf.add_node(
             interface = Function(
                 input_names = [
                     'in_file'
                 ],
-                output_names = [
-                    'out_file'
-                ],
-                function = _generate_wholebrain_mask
-            ),
-            name = 'create_wholebrain_mask',
-            inflows = {
-                'in_file' : '@select_aseg_for_wholebrain'
-            },
-            outflows = (
-                'mask_path',
-            ),
-            to_sink = [
-                'out_file'
-            ]
-        )
-
-    def generate_gray_matter_mask(self):
-        """ create the gray matter mask by including some rois from the aseg
-        """
-        # select the atlas from the renamed niftis
-        self.wf.add_node(
-            interface = Select(),
-            name = 'select_aseg_for_gray_matter',
-            inflows = {
-                'inlist' : '@standardized_filenames',
-                'index' : FREESURFER_OUTFLOWS_TO_EXPOSE.index('aseg')
-            },
-            outflows = (
-                'out',
-            )
-        )
-
-        # create gray matter mask
-        self.wf.add_node(
-            interface = Function(
-                input_names = [
-                    'in_file'
-                ],
-                output_names = [
-                    'out_file'
-                ],
-                function = _generate_gray_matter_mask
-            ),
-            name = 'create_gray_matter_mask',
-            inflows = {
-                'in_file' : '@select_aseg_for_gray_matter'
-            },
-            outflows = (
-                'mask_path',
-            ),
-            to_sink = [
-                'out_file'
-            ]
-        )
-
-    def generate_white_matter_mask(self):
-        """ create the white matter mask by including some rois from the aseg
-        """
-        # select the atlas from the renamed niftis
-        self.wf.add_node(
-            interface = Select(),
-            name = 'select_aseg_for_white_matter',
-            inflows = {
-                'inlist' : '@standardized_filenames',
-                'index' : FREESURFER_OUTFLOWS_TO_EXPOSE.index('aseg')
-            },
-            outflows = (
-                'out',
-            )
-        )
-        
-        # create white matter mask
-        self.wf.add_node(
-            interface = Function(
-                input_names = [
-                    'in_file'
-                ],
-                output_names = [
-                    'out_file'
-                ],
-                function = _generate_white_matter_mask
-            ),
-            name = 'create_white_matter_mask',
-            inflows = {
-                'in_file' : '@select_aseg_for_white_matter'
-            },
-            outflows = (
-                'mask_path',
+                output_names = list(ASEG_MASKS.keys()),
+                function = _generate_aseg_masks
             ),
-            to_sink = [
-                'out_file'
-            ]
-        )
-    
-    def generate_subcortical_mask(self):
-        """ create the white matter mask by including some rois from the aseg
-        """
-        # select the atlas from the renamed niftis
-        self.wf.add_node(
-            interface = Select(),
-            name = 'select_aseg_for_subcortical',
+            name = 'create_aseg_masks',
             inflows = {
-                'inlist' : '@standardized_filenames',
-                'index' : FREESURFER_OUTFLOWS_TO_EXPOSE.index('aseg')
+                'in_file' : '@select_aseg_for_masks'
             },
-            outflows = (
-                'out',
-            )
-        )
-        
-        # create subcortical mask
-        self.wf.add_node(
-            interface = Function(
-                input_names = [
-                    'in_file'
-                ],
-                output_names = [
-                    'out_file'
-                ],
-                function = _generate_subcortical_mask
-            ),
-            name = 'create_subcortical_mask',
-            inflows = {
-                'in_file' : '@select_aseg_for_subcortical'
-            },
-            outflows = (
-                'mask_path',
-            ),
-            to_sink = [
-                'out_file'
-            ]
-        )
-
-    def generate_ventricle_mask(self):
-        """ create the white matter mask by including some rois from the aseg
-        """
-        # select the atlas from the renamed niftis
-        self.wf.add_node(
-            interface = Select(),
-            name = 'select_aseg_for_ventricle',
-            inflows = {
-                'inlist' : '@standardized_filenames',
-                'index' : FREESURFER_OUTFLOWS_TO_EXPOSE.index('aseg')
-            },
-            outflows = (
-                'out',
-            )
-        )
-        
-        # create ventricle mask
-        self.wf.add_node(
-            interface = Function(
-                input_names = [
-                    'in_file'
-                ],
-                output_names = [
-                    'out_file'
-                ],
-                function = _generate_ventricle_mask
-            ),
-            name = 'create_ventricle_mask',
-            inflows = {
-                'in_file' : '@select_aseg_for_ventricle'
-            },
-            outflows = (
-                'mask_path',
-            ),
-            to_sink = [
-                'out_file'
-            ]
+            outflows = tuple(ASEG_MASKS.keys()),
+            to_sink = list(ASEG_MASKS.keys())
         )
     
     def create_report(self):
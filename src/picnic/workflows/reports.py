@@ -822,12 +822,27 @@ def create_mp4_from_image_list(image_list, output_filename, fps=2):
     fps - int
         frames per second
     """
-    import os
+    import subprocess
 
     for idx, im in enumerate(image_list):
         im.save('image_'+str(idx).zfill(4)+'.png')
 
-    os.system('ffmpeg -r '+str(fps)+' -f image2 -pattern_type glob -i "*.png" -vcodec libx264 -crf 20 -pix_fmt yuv420p '+output_filename)
+    # call ffmpeg directly with an argument list, no shell is needed to
+    #  expand the glob since ffmpeg does it itself
+    subprocess.run(
+        [
+            'ffmpeg', '-y',
+            '-r', str(fps),
+            '-f', 'image2',
+            '-pattern_type', 'glob',
+            '-i', '*.png',
+            '-vcodec', 'libx264',
+            '-crf', '20',
+            '-pix_fmt', 'yuv420p',
+            output_filename
+        ],
+        check=True
+    )
 
 
 def advanced_colorbar_limits(image):
@@ -36,6 +36,7 @@ class TacsWorkflow():
     DEFAULT_PARAMS = {
         'name' : 'nibabel_image_import',
         'units' : 'uci',
+        'nprocs' : 1,
         'report' : True
     }
     DEFAULT_INFLOWS = {
@@ -190,7 +191,8 @@ class TacsWorkflow():
                     'atlases',
                     'source_side_car',
                     'atlas_side_cars',
-                    'units'
+                    'units',
+                    'nprocs'
                 ],
                 output_names = [
                     'tac_file'
@@ -203,7 +205,8 @@ class TacsWorkflow():
                 'atlases' : '@reorient_atlas',
                 'source_side_car' : '@find_4d_sidecar',
                 'atlas_side_cars' : '@find_atlas_sidecar',
-                'units' : self.params['units']
+                'units' : self.params['units'],
+                'nprocs' : self.params['nprocs']
             },
             outflows = (
                 'tac_file',